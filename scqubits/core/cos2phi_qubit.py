@@ -30,6 +30,7 @@ import scqubits.core.descriptors as descriptors
 import scqubits.core.discretization as discretization
 import scqubits.core.harmonic_osc as osc
 import scqubits.core.operators as op
+import scqubits.core.param_hamiltonian as ph
 import scqubits.core.qubit_base as base
 import scqubits.core.storage as storage
 import scqubits.core.units as units
@@ -463,6 +464,10 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
     ncut = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     zeta_cut = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     phi_cut = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
+    _parametric_terms = {
+        "flux": ([ph.cos_pi, ph.sin_pi], (0.0, 0.5, 1.0)),
+        "ng": ([ph.linear, ph.quadratic], (0.0, 0.5, 1.0)),
+    }
 
     def __init__(
         self,
@@ -602,6 +607,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             / math.sqrt(2)
         )
 
+    @base.cached_operator
     def phi_operator(self) -> csc_matrix:
         """Returns :math:`\\phi` operator"""
         return self._kron3(
@@ -620,6 +626,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             / (self.phi_osc() * math.sqrt(2))
         )
 
+    @base.cached_operator
     def n_phi_operator(self) -> csc_matrix:
         """Returns :math:`n_\\phi` operator"""
         return self._kron3(
@@ -638,6 +645,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             / math.sqrt(2)
         )
 
+    @base.cached_operator
     def zeta_operator(self) -> csc_matrix:
         """Returns :math:`\\zeta` operator"""
         return self._kron3(
@@ -656,12 +664,14 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             / (self.zeta_osc() * math.sqrt(2))
         )
 
+    @base.cached_operator
     def n_zeta_operator(self) -> csc_matrix:
         """Returns :math:`n_\\zeta` operator"""
         return self._kron3(
             self._identity_phi(), self._n_zeta_operator(), self._identity_theta()
         )
 
+    @base.cached_operator
     def _exp_i_phi_operator(self) -> csc_matrix:
         """
         Returns
@@ -670,6 +680,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         exponent = 1j * self._phi_operator()
         return sp.sparse.linalg.expm(exponent)
 
+    @base.cached_operator
     def _cos_phi_operator(self) -> csc_matrix:
         """
         Returns
@@ -679,6 +690,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         cos_phi_op += cos_phi_op.conj().T
         return cos_phi_op
 
+    @base.cached_operator
     def _sin_phi_operator(self) -> csc_matrix:
         """
         Returns
@@ -698,6 +710,7 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             (diag_elements, [0]), shape=(self._dim_theta(), self._dim_theta())
         ).tocsc()
 
+    @base.cached_operator
     def n_theta_operator(self) -> csc_matrix:
         """Returns :math:`n_\\theta` operator"""
         return self._kron3(
@@ -856,25 +869,21 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
         )
 
     def _evals_calc(self, evals_count) -> ndarray:
-        hamiltonian_mat = self.hamiltonian()
-        evals = sparse.linalg.eigsh(
+        hamiltonian_mat = self._sweep_hamiltonian()
+        evals = self._sparse_eigsh(
             hamiltonian_mat,
-            k=evals_count,
+            evals_count,
             return_eigenvectors=False,
-            sigma=0.0,
-            which="LM",
             v0=settings.RANDOM_ARRAY[: self.hilbertdim()],
         )
         return np.sort(evals)
 
     def _esys_calc(self, evals_count) -> Tuple[ndarray, ndarray]:
-        hamiltonian_mat = self.hamiltonian()
-        evals, evecs = sparse.linalg.eigsh(
+        hamiltonian_mat = self._sweep_hamiltonian()
+        evals, evecs = self._sparse_eigsh(
             hamiltonian_mat,
-            k=evals_count,
+            evals_count,
             return_eigenvectors=True,
-            sigma=0.0,
-            which="LM",
             v0=settings.RANDOM_ARRAY[: self.hilbertdim()],
         )
         evals, evecs = spec_utils.order_eigensystem(evals, evecs)
@@ -1080,20 +1089,24 @@ class Cos2PhiQubit(base.QubitBaseClass, serializers.Serializable, NoisyCos2PhiQu
             **kwargs
         )
 
+    @base.cached_operator
     def phi_1_operator(self) -> csc_matrix:
         """Returns operator representing the phase across inductor 1"""
         return self.zeta_operator() - self.phi_operator()
 
+    @base.cached_operator
     def phi_2_operator(self) -> csc_matrix:
         """Returns operator representing the phase across inductor 2"""
         return -self.zeta_operator() - self.phi_operator()
 
+    @base.cached_operator
     def n_1_operator(self) -> csc_matrix:
         """Returns operator representing the charge difference across junction 1"""
         return 0.5 * self.n_phi_operator() + 0.5 * (
             self.n_theta_operator() - self.n_zeta_operator()
         )
 
+    @base.cached_operator
     def n_2_operator(self) -> csc_matrix:
         """Returns operator representing the charge difference across junction 2"""
         return 0.5 * self.n_phi_operator() - 0.5 * (
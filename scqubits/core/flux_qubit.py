@@ -24,6 +24,7 @@ from numpy import ndarray
 import scqubits.core.constants as constants
 import scqubits.core.descriptors as descriptors
 import scqubits.core.discretization as discretization
+import scqubits.core.param_hamiltonian as ph
 import scqubits.core.qubit_base as base
 import scqubits.core.storage as storage
 import scqubits.io_utils.fileio_serializers as serializers
@@ -305,6 +306,7 @@ class FluxQubit(base.QubitBaseClass, serializers.Serializable, NoisyFluxQubit):
     ng2 = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     flux = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     ncut = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
+    _parametric_terms = {"flux": ([ph.cos_2pi, ph.sin_2pi], (0.0, 0.25, 0.5))}
 
     def __init__(
         self,
@@ -391,14 +393,14 @@ class FluxQubit(base.QubitBaseClass, serializers.Serializable, NoisyFluxQubit):
         return np.linalg.inv(Cmat) / 2.0
 
     def _evals_calc(self, evals_count: int) -> ndarray:
-        hamiltonian_mat = self.hamiltonian()
+        hamiltonian_mat = self._sweep_hamiltonian()
         evals = sp.linalg.eigh(
             hamiltonian_mat, eigvals=(0, evals_count - 1), eigvals_only=True
         )
         return np.sort(evals)
 
     def _esys_calc(self, evals_count: int) -> Tuple[ndarray, ndarray]:
-        hamiltonian_mat = self.hamiltonian()
+        hamiltonian_mat = self._sweep_hamiltonian()
         evals, evecs = sp.linalg.eigh(
             hamiltonian_mat, eigvals=(0, evals_count - 1), eigvals_only=False
         )
@@ -540,40 +542,48 @@ class FluxQubit(base.QubitBaseClass, serializers.Serializable, NoisyFluxQubit):
         dim = 2 * self.ncut + 1
         return np.eye(dim)
 
+    @base.cached_operator
     def n_1_operator(self) -> ndarray:
         r"""Return charge number operator conjugate to :math:`\phi_1`"""
         return np.kron(self._n_operator(), self._identity())
 
+    @base.cached_operator
     def n_2_operator(self) -> ndarray:
         r"""Return charge number operator conjugate to :math:`\phi_2`"""
         return np.kron(self._identity(), self._n_operator())
 
+    @base.cached_operator
     def exp_i_phi_1_operator(self) -> ndarray:
         r"""Return operator :math:`e^{i\phi_1}` in the charge basis."""
         return np.kron(self._exp_i_phi_operator(), self._identity())
 
+    @base.cached_operator
     def exp_i_phi_2_operator(self) -> ndarray:
         r"""Return operator :math:`e^{i\phi_2}` in the charge basis."""
         return np.kron(self._identity(), self._exp_i_phi_operator())
 
+    @base.cached_operator
     def cos_phi_1_operator(self) -> ndarray:
         """Return operator :math:`\\cos \\phi_1` in the charge basis"""
         cos_op = 0.5 * self.exp_i_phi_1_operator()
         cos_op += cos_op.T
         return cos_op
 
+    @base.cached_operator
     def cos_phi_2_operator(self) -> ndarray:
         """Return operator :math:`\\cos \\phi_2` in the charge basis"""
         cos_op = 0.5 * self.exp_i_phi_2_operator()
         cos_op += cos_op.T
         return cos_op
 
+    @base.cached_operator
     def sin_phi_1_operator(self) -> ndarray:
         """Return operator :math:`\\sin \\phi_1` in the charge basis"""
         sin_op = -1j * 0.5 * self.exp_i_phi_1_operator()
         sin_op += sin_op.conj().T
         return sin_op
 
+    @base.cached_operator
     def sin_phi_2_operator(self) -> ndarray:
         """Return operator :math:`\\sin \\phi_2` in the charge basis"""
         sin_op = -1j * 0.5 * self.exp_i_phi_2_operator()
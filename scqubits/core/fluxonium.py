@@ -25,6 +25,7 @@ import scqubits.core.descriptors as descriptors
 import scqubits.core.discretization as discretization
 import scqubits.core.harmonic_osc as osc
 import scqubits.core.operators as op
+import scqubits.core.param_hamiltonian as ph
 import scqubits.core.qubit_base as base
 import scqubits.core.storage as storage
 import scqubits.io_utils.fileio_serializers as serializers
@@ -67,6 +68,10 @@ class Fluxonium(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
     EL = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     flux = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     cutoff = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
+    _parametric_terms = {
+        "flux": ([ph.cos_2pi, ph.sin_2pi], (0.0, 0.25, 0.5)),
+        "EJ": ([ph.linear], (0.0, 1.0)),
+    }
 
     def __init__(
         self,
@@ -130,6 +135,7 @@ class Fluxonium(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
         """
         return math.sqrt(8.0 * self.EL * self.EC)  # LC plasma oscillation energy
 
+    @base.cached_operator
     def phi_operator(self) -> ndarray:
         """
         Returns
@@ -143,6 +149,7 @@ class Fluxonium(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
             / math.sqrt(2)
         )
 
+    @base.cached_operator
     def n_operator(self) -> ndarray:
         """
         Returns
@@ -157,6 +164,7 @@ class Fluxonium(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
             / (self.phi_osc() * math.sqrt(2))
         )
 
+    @base.cached_operator
     def exp_i_phi_operator(self, alpha: float = 1.0, beta: float = 0.0) -> ndarray:
         """
         Returns
@@ -168,6 +176,7 @@ class Fluxonium(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
         exponent = 1j * (alpha * self.phi_operator())
         return sp.linalg.expm(exponent) * cmath.exp(1j * beta)
 
+    @base.cached_operator
     def cos_phi_operator(self, alpha: float = 1.0, beta: float = 0.0) -> ndarray:
         """
         Returns
@@ -179,6 +188,7 @@ class Fluxonium(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
         exp_matrix = self.exp_i_phi_operator(alpha, beta)
         return 0.5 * (exp_matrix + exp_matrix.conjugate().T)
 
+    @base.cached_operator
     def sin_phi_operator(self, alpha: float = 1.0, beta: float = 0.0) -> ndarray:
         """
         Returns
@@ -30,7 +30,9 @@ import qutip as qt
 
 from numpy import ndarray
 from qutip.qobj import Qobj
-from scipy.sparse import csc_matrix, dia_matrix
+from scipy import sparse
+from scipy.sparse import csc_matrix, csr_matrix, dia_matrix
+from scipy.sparse.linalg import LinearOperator
 
 import scqubits.core.central_dispatch as dispatch
 import scqubits.core.descriptors as descriptors
@@ -138,6 +140,65 @@ class InteractionTerm(dispatch.DispatchClient, serializers.Serializable):
         return name_prepend + output
 
 
+class CompositeHamiltonianOperator(LinearOperator):
+    """Matrix-free representation of a composite Hamiltonian, consisting of a part
+    diagonal in the product basis of subsystem eigenstates and of interaction terms,
+    each of which is a product of subsystem operators. Products with vectors are
+    evaluated by contracting each subsystem operator with the corresponding axis of
+    the vector reshaped into a tensor, so that the composite matrix is never formed.
+    The operator can be passed directly to `eigsh` or `lobpcg`.
+
+    Parameters
+    ----------
+    subsystem_dims:
+        dimensions of the subsystems composing the Hilbert space
+    diagonal:
+        diagonal of the bare Hamiltonian in the product basis
+    terms:
+        list of interaction terms `(coefficient, factors)`, where `factors` is a
+        list of `(subsystem index, matrix)` pairs; the matrices act in the order
+        opposite to the list order, as in the operator product
+    """
+
+    def __init__(
+        self,
+        subsystem_dims: List[int],
+        diagonal: ndarray,
+        terms: List[Tuple[Union[float, complex], List[Tuple[int, ndarray]]]],
+    ) -> None:
+        self.subsystem_dims = list(subsystem_dims)
+        self.diagonal = diagonal
+        self.terms = terms
+        dimension = int(np.prod(self.subsystem_dims))
+        dtype = np.result_type(
+            diagonal,
+            *[coefficient for coefficient, _ in terms],
+            *[matrix for _, factors in terms for _, matrix in factors],
+        )
+        super().__init__(dtype=dtype, shape=(dimension, dimension))
+
+    def _apply(self, vectors: ndarray) -> ndarray:
+        """Applies the operator to the columns of `vectors`."""
+        tensor_shape = self.subsystem_dims + [vectors.shape[1]]
+        result = np.asarray(self.diagonal[:, np.newaxis] * vectors, dtype=self.dtype)
+        for coefficient, factors in self.terms:
+            tensor = vectors.reshape(tensor_shape)
+            for subsys_index, matrix in reversed(factors):
+                tensor = np.tensordot(matrix, tensor, axes=(1, subsys_index))
+                tensor = np.moveaxis(tensor, 0, subsys_index)
+            result += coefficient * tensor.reshape(result.shape)
+        return result
+
+    def _matvec(self, vector: ndarray) -> ndarray:
+        return self._apply(vector.reshape(-1, 1)).reshape(vector.shape)
+
+    def _matmat(self, matrix: ndarray) -> ndarray:
+        return self._apply(np.asarray(matrix))
+
+    def _adjoint(self) -> "CompositeHamiltonianOperator":
+        return self
+
+
 class HilbertSpace(dispatch.DispatchClient, serializers.Serializable):
     """Class holding information about the full Hilbert space, usually composed of
     multiple subsys_list. The class provides methods to turn subsystem operators into
@@ -318,20 +379,22 @@ class HilbertSpace(dispatch.DispatchClient, serializers.Serializable):
     # HilbertSpace: energy spectrum
     ##################################################################################
     def eigenvals(self, evals_count: int = 6) -> ndarray:
-        """Calculates eigenvalues of the full Hamiltonian using
-        `qutip.Qob.eigenenergies()`.
+        """Calculates eigenvalues of the full Hamiltonian, assembled as a sparse
+        matrix and diagonalized with `eigsh` when only a few levels are requested.
 
         Parameters
         ----------
         evals_count:
             number of desired eigenvalues/eigenstates
         """
-        hamiltonian_mat = self.hamiltonian()
-        return hamiltonian_mat.eigenenergies(eigvals=evals_count)
+        return spec_utils.lowest_eigsh(
+            self._hamiltonian_for_eigsh(), evals_count, eigvals_only=True
+        )
 
     def eigensys(self, evals_count: int = 6) -> Tuple[ndarray, QutipEigenstates]:
-        """Calculates eigenvalues and eigenvectors of the full Hamiltonian using
-        `qutip.Qob.eigenstates()`.
+        """Calculates eigenvalues and eigenvectors of the full Hamiltonian, assembled
+        as a sparse matrix and diagonalized with `eigsh` when only a few levels are
+        requested. Eigenvectors are returned as `qutip.Qobj` kets.
 
         Parameters
         ----------
@@ -342,11 +405,25 @@ class HilbertSpace(dispatch.DispatchClient, serializers.Serializable):
         -------
             eigenvalues and eigenvectors
         """
-        hamiltonian_mat = self.hamiltonian()
-        evals, evecs = hamiltonian_mat.eigenstates(eigvals=evals_count)
+        evals, evecs = spec_utils.lowest_eigsh(
+            self._hamiltonian_for_eigsh(), evals_count
+        )
+        evecs = spec_utils.convert_ndarray_to_esys(evecs, self.subsystem_dims)
         evecs = evecs.view(scqubits.io_utils.fileio_qutip.QutipEigenstates)
         return evals, evecs
 
+    def _hamiltonian_for_eigsh(self) -> Union[csr_matrix, LinearOperator]:
+        """Returns the Hamiltonian in the form handed to the eigensolver."""
+        if self._matrix_free():
+            return self.hamiltonian_linear_operator()
+        return self._hamiltonian_csr()
+
+    def _matrix_free(self) -> bool:
+        """Returns whether the Hamiltonian is diagonalized matrix-free, based on the
+        Hilbert-space dimension and `settings.MATRIX_FREE_MIN_DIMENSION`."""
+        min_dimension = settings.MATRIX_FREE_MIN_DIMENSION
+        return min_dimension is not None and self.dimension >= min_dimension
+
     def _esys_for_paramval(
         self, paramval: float, update_hilbertspace: Callable, evals_count: int
     ) -> Tuple[ndarray, QutipEigenstates]:
@@ -370,7 +447,7 @@ class HilbertSpace(dispatch.DispatchClient, serializers.Serializable):
             Hamiltonian of the composite system, including the interaction between
             components
         """
-        return self.bare_hamiltonian() + self.interaction_hamiltonian()
+        return self._as_qobj(self._hamiltonian_csr())
 
     def bare_hamiltonian(self) -> Qobj:
         """
@@ -379,11 +456,7 @@ class HilbertSpace(dispatch.DispatchClient, serializers.Serializable):
             composite Hamiltonian composed of bare Hamiltonians of subsys_list
             independent of the external parameter
         """
-        bare_hamiltonian = 0
-        for subsys in self:
-            evals = subsys.eigenvals(evals_count=subsys.truncated_dim)
-            bare_hamiltonian += self.diag_hamiltonian(subsys, evals)
-        return bare_hamiltonian
+        return self._as_qobj(self._bare_hamiltonian_csr())
 
     def interaction_hamiltonian(self) -> Qobj:
         """
@@ -393,11 +466,7 @@ class HilbertSpace(dispatch.DispatchClient, serializers.Serializable):
         """
         if not self.interaction_list:
             return 0
-
-        hamiltonian = [
-            self.interactionterm_hamiltonian(term) for term in self.interaction_list
-        ]
-        return sum(hamiltonian)
+        return self._as_qobj(self._interaction_hamiltonian_csr())
 
     def interactionterm_hamiltonian(
         self,
@@ -405,16 +474,9 @@ class HilbertSpace(dispatch.DispatchClient, serializers.Serializable):
         evecs1: ndarray = None,
         evecs2: ndarray = None,
     ) -> Qobj:
-        interaction_op1 = self.identity_wrap(
-            interactionterm.op1, interactionterm.subsys1, evecs=evecs1
+        return self._as_qobj(
+            self._interactionterm_hamiltonian_csr(interactionterm, evecs1, evecs2)
         )
-        interaction_op2 = self.identity_wrap(
-            interactionterm.op2, interactionterm.subsys2, evecs=evecs2
-        )
-        hamiltonian = interactionterm.g_strength * interaction_op1 * interaction_op2
-        if interactionterm.add_hc:
-            return hamiltonian + hamiltonian.dag()
-        return hamiltonian
 
     def diag_hamiltonian(self, subsystem: QuantumSys, evals: ndarray = None) -> Qobj:
         """Returns a `qutip.Qobj` which has the eigenenergies of the object `subsystem`
@@ -427,11 +489,113 @@ class HilbertSpace(dispatch.DispatchClient, serializers.Serializable):
         evals:
             Eigenenergies can be provided as `evals`; otherwise, they are calculated.
         """
+        return self._as_qobj(self._diag_hamiltonian_csr(subsystem, evals))
+
+    def _hamiltonian_csr(self) -> csr_matrix:
+        """Sparse backend of `hamiltonian()`."""
+        return self._bare_hamiltonian_csr() + self._interaction_hamiltonian_csr()
+
+    def _bare_hamiltonian_csr(self) -> csr_matrix:
+        """Sparse backend of `bare_hamiltonian()`."""
+        bare_hamiltonian = sparse.csr_matrix((self.dimension, self.dimension))
+        for subsys in self:
+            evals = subsys.eigenvals(evals_count=subsys.truncated_dim)
+            bare_hamiltonian += self._diag_hamiltonian_csr(subsys, evals)
+        return bare_hamiltonian
+
+    def _interaction_hamiltonian_csr(self) -> csr_matrix:
+        """Sparse backend of `interaction_hamiltonian()`."""
+        hamiltonian = sparse.csr_matrix(
+            (self.dimension, self.dimension), dtype=np.complex_
+        )
+        for term in self.interaction_list:
+            hamiltonian += self._interactionterm_hamiltonian_csr(term)
+        return hamiltonian
+
+    def _interactionterm_hamiltonian_csr(
+        self,
+        interactionterm: InteractionTerm,
+        evecs1: ndarray = None,
+        evecs2: ndarray = None,
+        interaction_op1: csr_matrix = None,
+        interaction_op2: csr_matrix = None,
+    ) -> csr_matrix:
+        """Sparse backend of `interactionterm_hamiltonian()`. Identity-wrapped
+        operators computed beforehand may be passed as `interaction_op1` and
+        `interaction_op2`, in which case `evecs1` and `evecs2` are not used."""
+        if interaction_op1 is None:
+            interaction_op1 = self._identity_wrap_csr(
+                interactionterm.op1, interactionterm.subsys1, evecs=evecs1
+            )
+        if interaction_op2 is None:
+            interaction_op2 = self._identity_wrap_csr(
+                interactionterm.op2, interactionterm.subsys2, evecs=evecs2
+            )
+        hamiltonian = interactionterm.g_strength * (interaction_op1 @ interaction_op2)
+        if interactionterm.add_hc:
+            return hamiltonian + hamiltonian.conj().T
+        return hamiltonian
+
+    def _diag_hamiltonian_csr(
+        self, subsystem: QuantumSys, evals: ndarray = None
+    ) -> csr_matrix:
+        """Sparse backend of `diag_hamiltonian()`. The diagonal of the composite
+        operator is built directly by repeating and tiling the subsystem energies."""
+        return sparse.diags(self._bare_diagonal(subsystem, evals), format="csr")
+
+    def _bare_diagonal(self, subsystem: QuantumSys, evals: ndarray = None) -> ndarray:
+        """Returns the diagonal of the bare Hamiltonian of `subsystem` wrapped in
+        identities, built by repeating and tiling the subsystem energies."""
         evals_count = subsystem.truncated_dim
         if evals is None:
             evals = subsystem.eigenvals(evals_count=evals_count)
-        diag_qt_op = qt.Qobj(inpt=np.diagflat(evals[0:evals_count]))
-        return self.identity_wrap(diag_qt_op, subsystem)
+        dim_left, dim_right = self._outer_dims(subsystem)
+        return np.tile(np.repeat(evals[0:evals_count], dim_right), dim_left)
+
+    def hamiltonian_linear_operator(self) -> CompositeHamiltonianOperator:
+        """
+        Returns
+        -------
+            Hamiltonian of the composite system as a matrix-free `LinearOperator`,
+            suitable for `eigsh` or `lobpcg` when the composite matrix is too large
+            to be formed
+        """
+        return self._hamiltonian_linear_operator()
+
+    def _hamiltonian_linear_operator(
+        self,
+        bare_evals: List[Optional[ndarray]] = None,
+        bare_evecs: List[Optional[ndarray]] = None,
+    ) -> CompositeHamiltonianOperator:
+        """Builds the matrix-free Hamiltonian; subsystem eigenenergies and eigenstates
+        not provided via `bare_evals` and `bare_evecs` (indexed by subsystem) are
+        calculated."""
+        bare_evals = bare_evals or [None] * self.subsystem_count
+        bare_evecs = bare_evecs or [None] * self.subsystem_count
+        diagonal = np.zeros(self.dimension)
+        for subsys_index, subsys in enumerate(self):
+            diagonal += self._bare_diagonal(subsys, bare_evals[subsys_index])
+
+        terms = []
+        for term in self.interaction_list:
+            factors = []
+            for operator, subsys in [
+                (term.op1, term.subsys1),
+                (term.op2, term.subsys2),
+            ]:
+                subsys_index = self.get_subsys_index(subsys)
+                matrix = spec_utils.convert_operator_to_csr(
+                    operator, subsys, False, bare_evecs[subsys_index]
+                ).toarray()
+                factors.append((subsys_index, matrix))
+            terms.append((term.g_strength, factors))
+            if term.add_hc:
+                hc_factors = [
+                    (subsys_index, matrix.conj().T)
+                    for subsys_index, matrix in reversed(factors)
+                ]
+                terms.append((np.conj(term.g_strength), hc_factors))
+        return CompositeHamiltonianOperator(self.subsystem_dims, diagonal, terms)
 
     def get_bare_hamiltonian(self) -> Qobj:
         """Deprecated, use `bare_hamiltonian()` instead."""
@@ -471,15 +635,45 @@ class HilbertSpace(dispatch.DispatchClient, serializers.Serializable):
         evecs:
             internal QuantumSys eigenstates, used to convert `operator` into eigenbasis
         """
-        subsys_operator = spec_utils.convert_operator_to_qobj(
+        return self._as_qobj(
+            self._identity_wrap_csr(operator, subsystem, op_in_eigenbasis, evecs)
+        )
+
+    def _identity_wrap_csr(
+        self,
+        operator: Union[str, ndarray, csc_matrix, dia_matrix, Qobj],
+        subsystem: QuantumSys,
+        op_in_eigenbasis: bool = False,
+        evecs: ndarray = None,
+    ) -> csr_matrix:
+        """Sparse backend of `identity_wrap()`. Identities on the subsystems to the
+        left and right of `subsystem` are merged and enter the Kronecker products as
+        sparse identity matrices."""
+        subsys_operator = spec_utils.convert_operator_to_csr(
             operator, subsystem, op_in_eigenbasis, evecs
         )
-        operator_identitywrap_list = [
-            qt.operators.qeye(the_subsys.truncated_dim) for the_subsys in self
-        ]
+        dim_left, dim_right = self._outer_dims(subsystem)
+        wrapped_operator = sparse.kron(
+            subsys_operator, sparse.identity(dim_right, format="csr"), format="csr"
+        )
+        return sparse.kron(
+            sparse.identity(dim_left, format="csr"), wrapped_operator, format="csr"
+        )
+
+    def _outer_dims(self, subsystem: QuantumSys) -> Tuple[int, int]:
+        """Returns the total dimensions of the subsystems preceding and following
+        `subsystem` in the tensor product."""
         subsystem_index = self.get_subsys_index(subsystem)
-        operator_identitywrap_list[subsystem_index] = subsys_operator
-        return qt.tensor(operator_identitywrap_list)
+        dims = self.subsystem_dims
+        dim_left = int(np.prod(dims[:subsystem_index]))
+        dim_right = int(np.prod(dims[subsystem_index + 1 :]))
+        return dim_left, dim_right
+
+    def _as_qobj(self, operator: csr_matrix) -> Qobj:
+        """Converts a sparse operator on the full Hilbert space into a `qutip.Qobj`
+        with the tensor-product structure of the composite system."""
+        dims = self.subsystem_dims
+        return qt.Qobj(inpt=operator, dims=[dims, dims])
 
     def diag_operator(self, diag_elements: ndarray, subsystem: QuantumSys) -> Qobj:
         """For given diagonal elements of a diagonal operator in `subsystem`, return
@@ -9,10 +9,14 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
+import functools
+import inspect
+import itertools
 import math
+import numbers
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -28,19 +32,35 @@ import scqubits.core.units as units
 import scqubits.settings as settings
 import scqubits.utils.plotting as plotting
 
-from scqubits.core.storage import SpectrumData
+from scqubits.core.storage import DataStore, SpectrumData
+from scqubits.settings import IN_IPYTHON
+from scqubits.utils.cpu_switch import imap_ordered
+from scqubits.utils.misc import InfoBar, grid_traversal
+from scqubits.utils.spectrum_utils import (
+    get_matrixelement_table,
+    get_matrixelement_table_stack,
+)
+
+if IN_IPYTHON:
+    from tqdm.notebook import tqdm
+else:
+    from tqdm import tqdm
 
 # Helpers for units conversion
 
 
 def calc_therm_ratio(
-    omega: float, T: float, omega_in_standard_units: bool = False
-) -> float:
+    omega: Union[float, ndarray],
+    T: Union[float, ndarray],
+    omega_in_standard_units: bool = False,
+) -> Union[float, ndarray]:
     r"""Returns the ratio
 
     :math:`\beta \omega = \frac{\hbar \omega}{k_B T}`
 
-    after converting `\omega` from system units, to standard units.
+    after converting `\omega` from system units, to standard units. Arrays of
+    frequencies and temperatures are handled elementwise, following numpy
+    broadcasting rules.
 
     Parameters
     ----------
@@ -53,7 +73,7 @@ def calc_therm_ratio(
 
     Returns
     -------
-    float
+    float or ndarray
     """
     omega = units.to_standard_units(omega) if not omega_in_standard_units else omega
     return (sp.constants.hbar * omega) / (sp.constants.k * T)
@@ -95,6 +115,298 @@ NOISE_PARAMS = {
 }
 
 
+# Spectral densities of the depolarizing noise channels. Each takes the angular
+# frequency `omega` (in units of `2 \pi * <system units>`) as first argument; all
+# further arguments are passed by keyword, so that spectral densities for a whole
+# sweep can be evaluated at once, with the keyword values of all sweep points
+# stacked into arrays. All functions act elementwise on arrays of any shape, like
+# numpy ufuncs.
+
+
+def _thermal_factor(therm_ratio: ndarray) -> ndarray:
+    r"""Returns :math:`\coth(|x|/2) / (1 + e^{-x}) = 1 / |1 - e^{-x}|` for the thermal
+    ratio :math:`x`; diverges as :math:`1/|x|` for :math:`x \to 0`."""
+    with np.errstate(divide="ignore", over="ignore"):
+        return 1 / np.abs(np.expm1(-therm_ratio))
+
+
+def _omega_thermal_factor(omega: ndarray, T: ndarray) -> ndarray:
+    r"""Returns :math:`\omega \coth(x/2) / (1 + e^{-x}) = \omega / (1 - e^{-x})`, with
+    thermal ratio :math:`x = \hbar\omega / k_B T`, including its finite limit
+    :math:`k_B T / \hbar` (in system units) at :math:`\omega = 0`."""
+    therm_ratio = calc_therm_ratio(omega, T)
+    with np.errstate(invalid="ignore", over="ignore"):
+        x_factor = np.where(
+            therm_ratio == 0, 1.0, therm_ratio / -np.expm1(-therm_ratio)
+        )
+    return x_factor / calc_therm_ratio(1, T)
+
+
+def _kv0_sinh(x: ndarray) -> ndarray:
+    r"""Returns :math:`K_0(x) \sinh(x)` for :math:`x \geq 0`, without overflow for
+    large :math:`x`; vanishes at :math:`x = 0`."""
+    with np.errstate(invalid="ignore"):
+        return np.where(x == 0, 0.0, -0.5 * sp.special.kve(0, x) * np.expm1(-2 * x))
+
+
+def _q_cap_default(omega: ndarray) -> ndarray:
+    # See Smith et al (2020)
+    with np.errstate(divide="ignore"):
+        return 1e6 * (2 * np.pi * 6e9 / np.abs(units.to_standard_units(omega))) ** 0.7
+
+
+def _q_ind_default(omega: ndarray, T: ndarray) -> ndarray:
+    # See Smith et al (2020)
+    therm_ratio = np.abs(calc_therm_ratio(omega, T))
+    therm_ratio_500MHz = calc_therm_ratio(
+        2 * np.pi * 500e6, T, omega_in_standard_units=True
+    )
+    with np.errstate(divide="ignore"):
+        return (
+            500e6
+            * _kv0_sinh(1 / 2 * therm_ratio_500MHz)
+            / _kv0_sinh(1 / 2 * therm_ratio)
+        )
+
+
+def _y_qp_default(
+    omega: ndarray, EJ: float, x_qp: float, T: float, Delta: float
+) -> ndarray:
+    # Note that y_qp is always symmetric in omega, i.e. In Smith et al 2020,
+    # we essentially have something proportional to sinh(omega)/omega
+    omega = np.abs(omega)
+
+    Delta_in_Hz = convert_eV_to_Hz(Delta)
+    omega_in_Hz = units.to_standard_units(omega) / (2 * np.pi)
+    EJ_in_Hz = units.to_standard_units(EJ)
+
+    therm_ratio = calc_therm_ratio(omega, T)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (
+            np.sqrt(2 / np.pi)
+            * (8 / NOISE_PARAMS["R_k"])
+            * (EJ_in_Hz / Delta_in_Hz)
+            * (2 * Delta_in_Hz / omega_in_Hz) ** (3 / 2)
+            * x_qp
+            * np.sqrt(1 / 2 * therm_ratio)
+            * _kv0_sinh(1 / 2 * therm_ratio)
+        )
+
+
+def _evaluate_option(option: Union[float, Callable], omega: ndarray) -> ndarray:
+    """Returns the value of a noise option given either as a fixed value or as a
+    function of `omega`."""
+    return option(omega) if callable(option) else option
+
+
+def _spectral_density_capacitive(
+    omega: ndarray, EC: float, Q_cap: Union[float, Callable, None], T: float
+) -> ndarray:
+    therm_ratio = calc_therm_ratio(omega, T)
+    q_cap = _q_cap_default(omega) if Q_cap is None else _evaluate_option(Q_cap, omega)
+    with np.errstate(invalid="ignore"):
+        # the thermal factor diverges at omega=0, faster than 1/q_cap vanishes
+        s = np.where(
+            therm_ratio == 0, np.inf, 2 * 8 * EC / q_cap * _thermal_factor(therm_ratio)
+        )
+    s *= 2 * np.pi  # We assume that system energies are given in units of frequency
+    return s
+
+
+def _spectral_density_charge_impedance(
+    omega: ndarray, Z: Union[float, Callable], T: float
+) -> ndarray:
+    # Note, our definition of Q_c is different from Zhang et al (2020) by a
+    # factor of 2
+    Q_c = NOISE_PARAMS["R_k"] / (8 * np.pi * np.real(_evaluate_option(Z, omega)))
+    return 2 / Q_c * _omega_thermal_factor(omega, T)
+
+
+def _spectral_density_flux_bias_line(
+    omega: ndarray, M: float, Z: Union[complex, float, Callable], T: float
+) -> ndarray:
+    """Our definitions assume that the noise_op is dH/dflux."""
+    s = (
+        2
+        * (2 * np.pi) ** 2
+        * M ** 2
+        * sp.constants.hbar
+        / np.real(_evaluate_option(Z, omega))
+        * _omega_thermal_factor(omega, T)
+    )
+    # We assume that system energies are given in units of frequency and that
+    # the noise operator to be used with this `spectral_density` is dH/dflux.
+    # Hence we have to convert  2 powers of frequency to standard units
+    s *= (units.to_standard_units(1)) ** 2.0
+    return s
+
+
+def _spectral_density_inductive(
+    omega: ndarray, EL: float, Q_ind: Union[float, Callable, None], T: float
+) -> ndarray:
+    therm_ratio = calc_therm_ratio(omega, T)
+    q_ind = (
+        _q_ind_default(omega, T) if Q_ind is None else _evaluate_option(Q_ind, omega)
+    )
+    with np.errstate(invalid="ignore"):
+        # the thermal factor diverges at omega=0, faster than 1/q_ind vanishes
+        s = np.where(
+            therm_ratio == 0, np.inf, 2 * EL / q_ind * _thermal_factor(therm_ratio)
+        )
+    s *= 2 * np.pi  # We assume that system energies are given in units of frequency
+    return s
+
+
+def _spectral_density_quasiparticle_tunneling(
+    omega: ndarray,
+    EJ: float,
+    Y_qp: Union[float, Callable, None],
+    x_qp: float,
+    T: float,
+    Delta: float,
+) -> ndarray:
+    """Eq. 38 in Catalani et al (2011)."""
+    y_qp = (
+        _y_qp_default(omega, EJ, x_qp, T, Delta)
+        if Y_qp is None
+        else _evaluate_option(Y_qp, omega)
+    )
+    # omega / |1 - exp(-x)| is odd in omega and the default y_qp is even; the
+    # spectral density is set to zero at omega=0, the mean of its two limits
+    with np.errstate(invalid="ignore"):
+        return np.where(
+            omega == 0,
+            0.0,
+            np.sign(omega)
+            * _omega_thermal_factor(omega, T)
+            * NOISE_PARAMS["R_k"]
+            / np.pi
+            * np.real(y_qp),
+        )
+
+
+def _evaluate_spectral_density(
+    spectral_density: Callable, omega: Union[float, ndarray]
+) -> Union[float, ndarray]:
+    """Evaluates a spectral density for a single frequency or an array of
+    frequencies; user-provided functions that only accept scalar arguments are
+    applied elementwise."""
+    if np.ndim(omega) == 0:
+        return spectral_density(omega)
+    try:
+        return np.broadcast_to(spectral_density(omega), np.shape(omega))
+    except (TypeError, ValueError, ZeroDivisionError):
+        return np.vectorize(spectral_density, otypes=[float])(omega)
+
+
+def _evaluate_spectral_densities(
+    spectral_densities: List[Callable], omega: ndarray
+) -> ndarray:
+    """Evaluates spectral densities given for each point of a sweep (as produced by
+    the `_t1_..._terms` methods of NoisySystem) at the corresponding entries of
+    `omega`, an array whose first axis runs over the sweep points. Where the spectral
+    densities only differ by the numerical values of their options, these are
+    stacked into arrays, and all points are evaluated by a single call."""
+
+    def pointwise() -> ndarray:
+        return np.asarray(
+            [
+                _evaluate_spectral_density(spectral_density, omega_vals)
+                for spectral_density, omega_vals in zip(spectral_densities, omega)
+            ]
+        )
+
+    first = spectral_densities[0]
+    if not all(
+        isinstance(spectral_density, functools.partial)
+        and spectral_density.func is first.func
+        for spectral_density in spectral_densities
+    ):
+        return pointwise()
+    keywords = {}
+    for key, value in first.keywords.items():
+        values = [
+            spectral_density.keywords[key] for spectral_density in spectral_densities
+        ]
+        if all(val is value or (np.isscalar(val) and val == value) for val in values):
+            keywords[key] = value
+        elif all(isinstance(val, numbers.Number) for val in values):
+            # broadcast against the remaining axes of omega (e.g., transitions)
+            keywords[key] = np.asarray(values).reshape((-1,) + (1,) * (omega.ndim - 1))
+        else:
+            return pointwise()
+    try:
+        return np.broadcast_to(first.func(omega, **keywords), omega.shape)
+    except (TypeError, ValueError):
+        # e.g., user-provided noise options that only accept scalar arguments
+        return pointwise()
+
+
+def _sweep_matrix_elements(
+    noise_ops: Union[ndarray, csc_matrix, List[Union[ndarray, csc_matrix]]],
+    state_table: ndarray,
+    bra_index: int,
+    ket_index: int,
+) -> ndarray:
+    """Returns the matrix elements <bra|noise_op|ket> for all points of a sweep, with
+    eigenstates `state_table[n][:, index]` at the n-th point. `noise_ops` is either a
+    single operator used for all points, or a list with one operator per point."""
+    bras = state_table[:, :, bra_index]
+    kets = state_table[:, :, ket_index]
+    if isinstance(noise_ops, list):
+        return np.asarray(
+            [
+                np.vdot(bra, noise_op @ ket)
+                for noise_op, bra, ket in zip(noise_ops, bras, kets)
+            ]
+        )
+    return np.sum(bras.conj() * np.asarray(noise_ops @ kets.T).T, axis=1)
+
+
+def _t1_rate_matrices(
+    noise_ops: Union[ndarray, csc_matrix, List[Union[ndarray, csc_matrix]]],
+    spectral_densities: List[Callable],
+    energy_table: ndarray,
+    state_table: ndarray,
+) -> ndarray:
+    """Returns the Fermi's Golden Rule rates `rates[n, i, j]` of transitions i->j for
+    all points n of a sweep, given the eigenenergies `energy_table` (shape (N, n))
+    and eigenstates `state_table` (shape (N, dim, n)) for each point. `noise_ops` and
+    `spectral_densities` are as for `_sweep_matrix_elements` and
+    `_evaluate_spectral_densities`. Diagonal entries are zero."""
+    if isinstance(noise_ops, list):
+        matrix_elements = np.asarray(
+            [
+                get_matrixelement_table(noise_op, states)
+                for noise_op, states in zip(noise_ops, state_table)
+            ]
+        )
+    else:
+        matrix_elements = get_matrixelement_table_stack(noise_ops, state_table)
+    levels_count = energy_table.shape[1]
+    # spectral densities are only evaluated for the off-diagonal (i != j) entries
+    off_diagonal = ~np.eye(levels_count, dtype=bool)
+    omega = 2 * np.pi * (energy_table[:, :, np.newaxis] - energy_table[:, np.newaxis])
+    rates = np.zeros(omega.shape)
+    rates[:, off_diagonal] = np.abs(
+        matrix_elements[:, off_diagonal]
+    ) ** 2 * _evaluate_spectral_densities(spectral_densities, omega[:, off_diagonal])
+    return rates
+
+
+def _tphi_1_over_f_prefactor(A_noise: float, **kwargs) -> float:
+    """Returns the factor converting the dispersion of the qubit frequency with
+    respect to a noisy parameter into the 1/f dephasing rate."""
+    p = {key: NOISE_PARAMS[key] for key in ["omega_low", "omega_high", "t_exp"]}
+    p.update(kwargs)
+    # We assume that the system energies are given in units of frequency and not the
+    # angular frequency, hence we have to multiply by `2\pi`
+    return (
+        A_noise * np.sqrt(2 * np.abs(np.log(p["omega_low"] * p["t_exp"]))) * 2 * np.pi
+    )
+
+
 class NoisySystem(ABC):
     @abstractmethod
     def supported_noise_channels(self) -> List[str]:
@@ -158,53 +470,18 @@ class NoisySystem(ABC):
         Figure, Axes
 
         """
-        common_noise_options = (
-            {} if common_noise_options is None else common_noise_options
-        )
-
-        # if we're not told what channels to consider, just use the supported list
-        noise_channels = (
-            self.supported_noise_channels()
-            if noise_channels is None
-            else noise_channels
-        )
-
-        # if we only have a single noise channel to consider (and hence are given a
-        # str), put it into a one element list
-        noise_channels = (
-            [noise_channels] if isinstance(noise_channels, str) else noise_channels
+        data = self.coherence_vs_paramvals(
+            param_name,
+            param_vals,
+            noise_channels=noise_channels,
+            common_noise_options=common_noise_options,
+            spectrum_data=spectrum_data,
+            num_cpus=num_cpus,
         )
-        cast(List, noise_channels)
-
-        if spectrum_data is None:
-            # We have to figure out the largest energy level involved in the
-            # calculations, to know how many levels we need from the diagonalization.
-            # This may be hidden in noise-channel-specific options, so have to search
-            # through those, if any were given.
-            max_level = max(
-                common_noise_options.get("i", 1), common_noise_options.get("j", 1)
-            )
-            for noise_channel in noise_channels:
-                if isinstance(noise_channel, tuple):
-                    opts = noise_channel[1]
-                    max_level = max(max_level, opts.get("i", 1), opts.get("j", 1))
-
-            spectrum_data = self.get_spectrum_vs_paramvals(
-                param_name,  # type: ignore
-                param_vals,
-                evals_count=max_level + 1,
-                subtract_ground=True,
-                get_eigenstates=True,
-                filename=None,
-                num_cpus=num_cpus,
-            )
+        channel_count = len(data._datanames)
 
         # figure out how many plots we need to produce
-        plot_grid = (
-            (1, 1)
-            if len(noise_channels) == 1
-            else (math.ceil(len(noise_channels) / 2), 2)
-        )
+        plot_grid = (1, 1) if channel_count == 1 else (math.ceil(channel_count / 2), 2)
 
         # figure out how large the figure should be, based on how many plots we have.
         # We currently assume 2 plots per row
@@ -226,75 +503,510 @@ class NoisySystem(ABC):
             {k: v for (k, v) in kwargs.items() if k not in ["fig_ax", "figsize"]}
         )
 
-        # remember current value of param_name
-        current_val = getattr(self, param_name)
+        for n, (dataname, (noise_channel_method, _)) in enumerate(
+            zip(data._datanames, self._noise_channel_options(noise_channels, {}))
+        ):
+            ax = axes.ravel()[n] if channel_count > 1 else axes
+            plotting_options["fig_ax"] = fig, ax
+            plotting_options["title"] = noise_channel_method
+            plotting.data_vs_paramvals(
+                param_vals,
+                scale * getattr(data, dataname),
+                label_list=None,
+                **plotting_options
+            )
 
-        for n, noise_channel in enumerate(noise_channels):
+        if channel_count > 1 and channel_count % 2:
+            axes.ravel()[-1].set_axis_off()
 
-            # case 1: noise_channel is a string representing the noise method
-            if isinstance(noise_channel, str):
+        fig.tight_layout()
+        return fig, axes
 
-                noise_channel_method = noise_channel
+    def coherence_vs_paramvals(
+        self,
+        param_name: str,
+        param_vals: ndarray,
+        noise_channels: Union[str, List[str], List[Tuple[str, Dict]]] = None,
+        common_noise_options: Dict = None,
+        spectrum_data: SpectrumData = None,
+        get_rate: bool = False,
+        num_cpus: int = settings.NUM_CPUS,
+    ) -> DataStore:
+        r"""
+        Calculates coherence times (or rates) for various noise channels as a
+        function of a changing parameter. Each channel is evaluated for all parameter
+        values at once: noise operators are constructed once per distinct parameter
+        value, and spectral densities are evaluated for arrays of transition
+        frequencies.
 
-                # calculate the noise over the full param span in param_vals
-                noise_vals = [
-                    scale
-                    * getattr(self.set_and_return(param_name, v), noise_channel_method)(
-                        esys=(
-                            spectrum_data.energy_table[v_i, :],
-                            spectrum_data.state_table[v_i],
-                        ),
-                        **common_noise_options
-                    )
-                    for v_i, v in enumerate(param_vals)
-                ]
+        Parameters
+        ----------
+        param_name:
+            name of parameter to be varied
+        param_vals:
+            parameter values to be plugged in
+        noise_channels:
+            channels to be evaluated, if None then noise channels given by
+            `supported_noise_channels` are used
+        common_noise_options:
+            common options used when calculating coherence times
+        spectrum_data:
+            spectral data used during noise calculations
+        get_rate:
+            get rates rather than times
+        num_cpus:
+            number of cores to be used for computing the spectral data
 
-            # case 2: noise_channel is a tuple representing the noise method and
-            # default options
-            elif isinstance(noise_channel, tuple):
+        Returns
+        -------
+            `DataStore` holding, for each channel, an array of coherence times (or
+            rates) over `param_vals`, stored under the channel name (with a numeric
+            suffix for repeated channels)
+        """
+        common_noise_options = (
+            {} if common_noise_options is None else common_noise_options
+        )
+        channel_options = self._noise_channel_options(
+            noise_channels, common_noise_options
+        )
+        if spectrum_data is None:
+            spectrum_data = self.get_spectrum_vs_paramvals(  # type: ignore
+                param_name,
+                param_vals,
+                evals_count=self._noise_evals_count(channel_options),
+                subtract_ground=True,
+                get_eigenstates=True,
+                filename=None,
+                num_cpus=num_cpus,
+            )
+        energy_table = np.asarray(spectrum_data.energy_table)
+        state_table = np.asarray(spectrum_data.state_table)
 
-                noise_channel_method = noise_channel[0]
+        # remember current value of param_name
+        current_val = getattr(self, param_name)
+        data = {}
+        try:
+            for dataname, (noise_channel, options) in zip(
+                self._channel_datanames(channel_options), channel_options
+            ):
+                rates = self._channel_rates_vs_points(
+                    noise_channel,
+                    options,
+                    [param_name],
+                    [(paramval,) for paramval in param_vals],
+                    energy_table,
+                    state_table,
+                )
+                if get_rate:
+                    data[dataname] = rates
+                else:
+                    with np.errstate(divide="ignore"):
+                        data[dataname] = np.where(rates != 0, 1 / rates, np.inf)
+        finally:
+            # Set the parameter we varied to its initial value
+            setattr(self, param_name, current_val)
+
+        return DataStore(
+            self.get_initdata(), param_name, param_vals, **data  # type: ignore
+        )
 
-                options = common_noise_options.copy()
-                # Some of the channel-specific options may be in conflict with the
-                # common options options. In such a case, we let the channel-specific
-                # options take priority.
+    def _noise_channel_options(
+        self,
+        noise_channels: Union[str, List[str], List[Tuple[str, Dict]], None],
+        common_noise_options: Dict,
+    ) -> List[Tuple[str, Dict]]:
+        """Returns the list of (channel name, options) for the given noise channels
+        (default: `supported_noise_channels`). Channel-specific options take
+        priority over common options."""
+        if noise_channels is None:
+            noise_channels = self.supported_noise_channels()
+        if isinstance(noise_channels, str):
+            noise_channels = [noise_channels]
+        channel_options = []
+        for noise_channel in noise_channels:
+            options = common_noise_options.copy()
+            if isinstance(noise_channel, tuple):
                 options.update(noise_channel[1])
-
-                # calculate the noise over the full param span in param_vals
-                noise_vals = [
-                    scale
-                    * getattr(self.set_and_return(param_name, v), noise_channel_method)(
-                        esys=(
-                            spectrum_data.energy_table[v_i, :],
-                            spectrum_data.state_table[v_i],
-                        ),
-                        **options
-                    )
-                    for v_i, v in enumerate(param_vals)
-                ]
-
-            else:
+                noise_channel = noise_channel[0]
+            elif not isinstance(noise_channel, str):
                 raise ValueError(
                     "The `noise_channels` argument should be one of {str, list of str,"
                     " or list of tuples}."
                 )
+            channel_options.append((noise_channel, options))
+        return channel_options
+
+    @staticmethod
+    def _channel_datanames(channel_options: List[Tuple[str, Dict]]) -> List[str]:
+        """Returns the names under which the results for the given channels are
+        stored; repeated channels receive a numeric suffix."""
+        datanames: List[str] = []
+        for noise_channel, _ in channel_options:
+            dataname = noise_channel
+            while dataname in datanames:
+                dataname = "{}_{}".format(noise_channel, len(datanames))
+            datanames.append(dataname)
+        return datanames
+
+    @staticmethod
+    def _noise_evals_count(channel_options: List[Tuple[str, Dict]]) -> int:
+        """Returns the number of eigenvalues needed for evaluating the given
+        channels, considering the level indices `i`, `j` in their options."""
+        max_level = 1
+        for _, options in channel_options:
+            max_level = max(max_level, options.get("i", 1), options.get("j", 1))
+        return max_level + 1
+
+    def _set_paramvals(self, param_names: List[str], point: Tuple) -> None:
+        for param_name, paramval in zip(param_names, point):
+            setattr(self, param_name, paramval)
+
+    def _channel_rates_vs_points(
+        self,
+        noise_channel: str,
+        options: Dict,
+        param_names: List[str],
+        points: List[Tuple],
+        energy_table: ndarray,
+        state_table: ndarray,
+    ) -> ndarray:
+        """Returns the rates of a single noise channel for all points in parameter
+        space, given the eigenenergies and eigenstates for each of them. Each point
+        is a tuple holding the values of the parameters `param_names`."""
+        options = {
+            key: value
+            for key, value in options.items()
+            if key not in ["esys", "get_rate"]
+        }
+        if not self._has_channel_terms(noise_channel):
+            # channels defined or overridden by subclasses are evaluated point by point
+            rates = []
+            for point, evals, evecs in zip(points, energy_table, state_table):
+                self._set_paramvals(param_names, point)
+                rates.append(
+                    getattr(self, noise_channel)(
+                        esys=(evals, evecs), get_rate=True, **options
+                    )
+                )
+            return np.asarray(rates)
 
-            ax = axes.ravel()[n] if len(noise_channels) > 1 else axes
-            plotting_options["fig_ax"] = fig, ax
-            plotting_options["title"] = noise_channel_method
-            plotting.data_vs_paramvals(
-                param_vals, noise_vals, label_list=None, **plotting_options
+        depolarizing = noise_channel.startswith("t1")
+        i = options.pop("i", 1 if depolarizing else 0)
+        j = options.pop("j", 0 if depolarizing else 1)
+        total = options.pop("total", True)
+        if i == j or i < 0 or j < 0:
+            raise ValueError("Level indices 'i' and 'j' must be different, and i,j>=0")
+
+        noise_ops, spectral_densities = self._channel_terms_vs_points(
+            noise_channel, options, param_names, points
+        )
+        if depolarizing:
+            matrix_elements = _sweep_matrix_elements(noise_ops, state_table, i, j)
+            omega = 2 * np.pi * (energy_table[:, i] - energy_table[:, j])
+            s = _evaluate_spectral_densities(spectral_densities, omega)
+            if total:
+                s = s + _evaluate_spectral_densities(spectral_densities, -omega)
+            return np.abs(matrix_elements) ** 2 * s
+
+        dispersion = np.abs(
+            _sweep_matrix_elements(noise_ops, state_table, i, i)
+            - _sweep_matrix_elements(noise_ops, state_table, j, j)
+        )
+        A_noise = options.pop(
+            "A_noise",
+            inspect.signature(getattr(self, noise_channel))
+            .parameters["A_noise"]
+            .default,
+        )
+        return dispersion * _tphi_1_over_f_prefactor(A_noise, **options)
+
+    def _has_channel_terms(self, noise_channel: str) -> bool:
+        """Returns True if `noise_channel` is the implementation provided by
+        NoisySystem, with noise operator and spectral density given by its
+        `_<noise_channel>_terms` method, rather than one defined or overridden by a
+        subclass."""
+        return hasattr(NoisySystem, "_{}_terms".format(noise_channel)) and getattr(
+            type(self), noise_channel
+        ) is getattr(NoisySystem, noise_channel)
+
+    def _channel_terms_vs_points(
+        self,
+        noise_channel: str,
+        options: Dict,
+        param_names: List[str],
+        points: List[Tuple],
+    ) -> Tuple[List[Union[ndarray, csc_matrix]], List[Optional[Callable]]]:
+        """Returns, for each point in parameter space, the noise operator of
+        `noise_channel` and, for depolarizing channels, its spectral density (None
+        otherwise), as given by the `_<noise_channel>_terms` method. Operators are
+        constructed once per distinct point and reused for repeated points."""
+        terms_method = getattr(self, "_{}_terms".format(noise_channel))
+        depolarizing = noise_channel.startswith("t1")
+        terms_by_point: Dict[
+            Tuple, Tuple[Union[ndarray, csc_matrix], Optional[Callable]]
+        ] = {}
+        for point in points:
+            key = tuple(point)
+            if key not in terms_by_point:
+                self._set_paramvals(param_names, point)
+                terms = terms_method(**options)
+                noise_op_func, spectral_density = (
+                    terms if depolarizing else (terms, None)
+                )
+                terms_by_point[key] = (noise_op_func(), spectral_density)
+        point_terms = [terms_by_point[tuple(point)] for point in points]
+        return (
+            [noise_op for noise_op, _ in point_terms],
+            [spectral_density for _, spectral_density in point_terms],
+        )
+
+    def effective_rates_vs_paramvals(
+        self,
+        param_name: str,
+        param_vals: ndarray,
+        noise_type: str = "t2",
+        noise_channels: Union[str, List[str], List[Tuple[str, Dict]]] = None,
+        common_noise_options: Dict = None,
+        spectrum_data: SpectrumData = None,
+        num_cpus: int = settings.NUM_CPUS,
+    ) -> DataStore:
+        r"""
+        Calculates the contributions of the individual noise channels to the
+        effective :math:`T_1` or :math:`T_2` rate as a function of a changing
+        parameter. The parameter values are split into chunks that are processed by
+        the worker pool; within each chunk, one eigensystem per parameter value is
+        shared by all channels, and channels are evaluated for the whole chunk at
+        once.
+
+        The effective rate is the sum of the stored arrays, for example::
+
+            rates = qubit.effective_rates_vs_paramvals('flux', flux_vals)
+            t2_eff = 1 / sum(getattr(rates, name) for name in rates._datanames)
+
+        Parameters
+        ----------
+        param_name:
+            name of parameter to be varied
+        param_vals:
+            parameter values to be plugged in
+        noise_type:
+            't1' or 't2', selecting the effective rate (default value = 't2')
+        noise_channels:
+            channels to be included, if None then the appropriate channels given by
+            `effective_noise_channels` are used
+        common_noise_options:
+            common options used when calculating coherence rates
+        spectrum_data:
+            spectral data used during noise calculations; if None, eigensystems are
+            calculated by the workers
+        num_cpus:
+            number of cores to be used for computation
+
+        Returns
+        -------
+            `DataStore` holding, for each channel, its contribution to the effective
+            rate over `param_vals` (t1 rates enter :math:`1/T_2` with a factor 1/2)
+        """
+        channel_options = self._effective_channel_options(
+            noise_type, noise_channels, common_noise_options
+        )
+        energy_table, state_table = None, None
+        if spectrum_data is not None:
+            energy_table = np.asarray(spectrum_data.energy_table)
+            state_table = np.asarray(spectrum_data.state_table)
+        data = self._effective_rates_vs_points(
+            [param_name],
+            [(paramval,) for paramval in param_vals],
+            channel_options,
+            noise_type,
+            energy_table,
+            state_table,
+            num_cpus,
+        )
+        return DataStore(
+            self.get_initdata(), param_name, param_vals, **data  # type: ignore
+        )
+
+    def effective_rates_vs_paramgrid(
+        self,
+        param_grid: Dict[str, ndarray],
+        noise_type: str = "t2",
+        noise_channels: Union[str, List[str], List[Tuple[str, Dict]]] = None,
+        common_noise_options: Dict = None,
+        num_cpus: int = settings.NUM_CPUS,
+        snake: bool = True,
+    ) -> DataStore:
+        r"""
+        Calculates the contributions of the individual noise channels to the
+        effective :math:`T_1` or :math:`T_2` rate on the Cartesian grid spanned by
+        several varying parameters; see `effective_rates_vs_paramvals`. Entry
+        `[n1, ..., nN]` of each stored array refers to the parameter values
+        `param_vals[0][n1], ..., param_vals[N-1][nN]`.
+
+        Parameters
+        ----------
+        param_grid:
+            dictionary of the form `{param_name: param_vals}`, one entry per grid axis
+        noise_type:
+            't1' or 't2', selecting the effective rate (default value = 't2')
+        noise_channels:
+            channels to be included, if None then the appropriate channels given by
+            `effective_noise_channels` are used
+        common_noise_options:
+            common options used when calculating coherence rates
+        num_cpus:
+            number of cores to be used for computation
+        snake:
+            if True, grid points are visited in snake order, so that the chunks
+            handed to each worker are neighbourhoods on the grid (default value = True)
+
+        Returns
+        -------
+            `DataStore` holding, for each channel, its contribution to the effective
+            rate on the parameter grid
+        """
+        channel_options = self._effective_channel_options(
+            noise_type, noise_channels, common_noise_options
+        )
+        param_names = list(param_grid.keys())
+        param_vals = [np.asarray(axis_vals) for axis_vals in param_grid.values()]
+        grid_shape = tuple(len(axis_vals) for axis_vals in param_vals)
+        traversal = grid_traversal(grid_shape, snake=snake)
+        points = [
+            tuple(axis_vals[index] for axis_vals, index in zip(param_vals, multi_index))
+            for multi_index in traversal
+        ]
+        data = self._effective_rates_vs_points(
+            param_names, points, channel_options, noise_type, None, None, num_cpus
+        )
+        for dataname, rates in data.items():
+            data[dataname] = np.empty(grid_shape)
+            data[dataname][tuple(traversal.T)] = rates
+        return DataStore(
+            self.get_initdata(), param_names, param_vals, **data  # type: ignore
+        )
+
+    def _effective_channel_options(
+        self,
+        noise_type: str,
+        noise_channels: Union[str, List[str], List[Tuple[str, Dict]], None],
+        common_noise_options: Union[Dict, None],
+    ) -> List[Tuple[str, Dict]]:
+        """Returns the list of (channel name, options) entering the effective rate
+        of the given `noise_type` ('t1' or 't2')."""
+        if noise_type not in ["t1", "t2"]:
+            raise ValueError("Effective noise type must be one of 't1' or 't2'.")
+        if noise_channels is None:
+            noise_channels = [
+                channel
+                for channel in self.effective_noise_channels()
+                if noise_type == "t2" or channel.startswith("t1")
+            ]
+        channel_options = self._noise_channel_options(
+            noise_channels, common_noise_options or {}
+        )
+        if noise_type == "t1":
+            for noise_channel, _ in channel_options:
+                if not noise_channel.startswith("t1"):
+                    raise ValueError(
+                        "Only t1 channels can contribute to effective t1 noise."
+                    )
+        return channel_options
+
+    def _effective_rates_vs_points(
+        self,
+        param_names: List[str],
+        points: List[Tuple],
+        channel_options: List[Tuple[str, Dict]],
+        noise_type: str,
+        energy_table: Union[ndarray, None],
+        state_table: Union[ndarray, None],
+        num_cpus: int,
+    ) -> Dict[str, ndarray]:
+        """Returns the contributions of the given channels to the effective rate for
+        all points in parameter space, evaluated chunk by chunk on the worker
+        pool."""
+        chunk_count = 1
+        if num_cpus > 1:
+            chunksize = settings.CHUNKSIZE or math.ceil(len(points) / (4 * num_cpus))
+            chunk_count = math.ceil(len(points) / chunksize)
+        chunks = []
+        for indices in np.array_split(np.arange(len(points)), chunk_count):
+            chunks.append(
+                (
+                    [points[index] for index in indices],
+                    None if energy_table is None else energy_table[indices],
+                    None if state_table is None else state_table[indices],
+                )
             )
 
-        if len(noise_channels) > 1 and len(noise_channels) % 2:
-            axes.ravel()[-1].set_axis_off()
+        current_vals = {name: getattr(self, name) for name in param_names}
+        # No parametric decomposition applies when computing eigensystems here.
+        self._start_sweep(None)  # type: ignore
+        func = functools.partial(
+            self._effective_rates_for_chunk,
+            param_names=param_names,
+            channel_options=channel_options,
+            noise_type=noise_type,
+        )
+        try:
+            with InfoBar(
+                "Parallel computation of noise rates [num_cpus={}]".format(num_cpus),
+                num_cpus,
+            ):
+                chunk_data = list(
+                    tqdm(
+                        imap_ordered(func, chunks, num_cpus, chunksize=1),
+                        total=len(chunks),
+                        desc="Noise rates",
+                        leave=False,
+                        disable=settings.PROGRESSBAR_DISABLED,
+                    )
+                )
+        finally:
+            self._stop_sweep()  # type: ignore
+            self._set_paramvals(param_names, tuple(current_vals.values()))
 
-        # Set the parameter we varied to its initial value
-        setattr(self, param_name, current_val)
+        return {
+            dataname: np.concatenate([rates[dataname] for rates in chunk_data])
+            for dataname in chunk_data[0]
+        }
 
-        fig.tight_layout()
-        return fig, axes
+    def _effective_rates_for_chunk(
+        self,
+        chunk: Tuple[List[Tuple], Union[ndarray, None], Union[ndarray, None]],
+        param_names: List[str],
+        channel_options: List[Tuple[str, Dict]],
+        noise_type: str,
+    ) -> Dict[str, ndarray]:
+        points, energy_table, state_table = chunk
+        if energy_table is None:
+            evals_count = self._noise_evals_count(channel_options)
+            esys_list = [
+                self._esys_for_gridpoint(  # type: ignore
+                    point, param_names=param_names, evals_count=evals_count
+                )
+                for point in points
+            ]
+            energy_table = np.asarray([evals for evals, _ in esys_list])
+            state_table = np.asarray([evecs for _, evecs in esys_list])
+        rates = {}
+        for dataname, (noise_channel, options) in zip(
+            self._channel_datanames(channel_options), channel_options
+        ):
+            # t1 processes contribute to the dephasing rate with a factor of 1/2
+            scale_factor = (
+                0.5 if noise_type == "t2" and noise_channel.startswith("t1") else 1
+            )
+            rates[dataname] = scale_factor * self._channel_rates_vs_points(
+                noise_channel,
+                options,
+                param_names,
+                points,
+                energy_table,
+                state_table,
+            )
+        return rates
 
     def plot_t1_effective_vs_paramvals(
         self,
@@ -352,71 +1064,20 @@ class NoisySystem(ABC):
         Figure, Axes
 
         """
-        common_noise_options = (
-            {} if common_noise_options is None else common_noise_options
-        )
-
-        # If we're not given channels to consider, just use the effective noise
-        # channel list that correspond to t1 processes
-        noise_channels = (
-            [
-                channel
-                for channel in self.effective_noise_channels()
-                if channel.startswith("t1")
-            ]
-            if noise_channels is None
-            else noise_channels
-        )
-
-        # if we only have a single noise channel to consider (and hence are given a
-        # str), put it into a one element list
-        noise_channels = (
-            [noise_channels] if isinstance(noise_channels, str) else noise_channels
+        rates = self.effective_rates_vs_paramvals(
+            param_name,
+            param_vals,
+            noise_type="t1",
+            noise_channels=noise_channels,
+            common_noise_options=common_noise_options,
+            spectrum_data=spectrum_data,
+            num_cpus=num_cpus,
         )
-
-        if spectrum_data is None:
-
-            # We have to figure out the largest energy level involved in the
-            # calculations, to know how many levels we need from the diagonalization.
-            # This may be hidden in noise-channel-specific options, so have to search
-            # through those, if any were given.
-            max_level = max(
-                common_noise_options.get("i", 1), common_noise_options.get("j", 1)
+        effective_rate = sum(getattr(rates, name) for name in rates._datanames)
+        with np.errstate(divide="ignore"):
+            noise_vals = scale * np.where(
+                effective_rate != 0, 1 / effective_rate, np.inf
             )
-            for noise_channel in noise_channels:
-                if isinstance(noise_channel, tuple):
-                    opts = noise_channel[1]
-                    max_level = max(max_level, opts.get("i", 1), opts.get("j", 1))
-
-            spectrum_data = self.get_spectrum_vs_paramvals(
-                param_name,
-                param_vals,
-                evals_count=max_level + 1,  # type: ignore
-                subtract_ground=True,
-                get_eigenstates=True,
-                filename=None,
-                num_cpus=num_cpus,
-            )
-
-        # remember current value of param_name
-        current_val = getattr(self, param_name)
-
-        # calculate the noise over the full param span in param_vals
-        noise_vals = [
-            scale
-            * self.set_and_return(param_name, v).t1_effective(  # type: ignore
-                noise_channels=noise_channels,
-                common_noise_options=common_noise_options,
-                esys=(
-                    spectrum_data.energy_table[v_i, :],
-                    spectrum_data.state_table[v_i],
-                ),
-            )
-            for v_i, v in enumerate(param_vals)
-        ]
-
-        # Set the parameter we varied to its initial value
-        setattr(self, param_name, current_val)
 
         plotting_options = {
             "fig_ax": plt.subplots(1),
@@ -493,67 +1154,20 @@ class NoisySystem(ABC):
         Figure, Axes
 
         """
-        common_noise_options = (
-            {} if common_noise_options is None else common_noise_options
-        )
-
-        # If we're not given channels to consider, just use ones from the effective
-        # noise channel list
-        noise_channels = (
-            [channel for channel in self.effective_noise_channels()]
-            if noise_channels is None
-            else noise_channels
-        )
-
-        # if we only have a single noise channel to consider (and hence are given a
-        # str), put it into a one element list
-        noise_channels = (
-            [noise_channels] if isinstance(noise_channels, str) else noise_channels
+        rates = self.effective_rates_vs_paramvals(
+            param_name,
+            param_vals,
+            noise_type="t2",
+            noise_channels=noise_channels,
+            common_noise_options=common_noise_options,
+            spectrum_data=spectrum_data,
+            num_cpus=num_cpus,
         )
-
-        if spectrum_data is None:
-
-            # We have to figure out the largest energy level involved in the
-            # calculations, to know how many levels we need from the diagonalization.
-            # This may be hidden in noise-channel-specific options, so have to search
-            # through those, if any were given.
-            max_level = max(
-                common_noise_options.get("i", 1), common_noise_options.get("j", 1)
+        effective_rate = sum(getattr(rates, name) for name in rates._datanames)
+        with np.errstate(divide="ignore"):
+            noise_vals = scale * np.where(
+                effective_rate != 0, 1 / effective_rate, np.inf
             )
-            for noise_channel in noise_channels:
-                if isinstance(noise_channel, tuple):
-                    opts = noise_channel[1]
-                    max_level = max(max_level, opts.get("i", 1), opts.get("j", 1))
-
-            spectrum_data = self.get_spectrum_vs_paramvals(
-                param_name,
-                param_vals,
-                evals_count=max_level + 1,  # type: ignore
-                subtract_ground=True,
-                get_eigenstates=True,
-                filename=None,
-                num_cpus=num_cpus,
-            )
-
-        # remember current value of param_name
-        current_val = getattr(self, param_name)
-
-        # calculate the noise over the full param span in param_vals
-        noise_vals = [
-            scale
-            * self.set_and_return(param_name, v).t2_effective(  # type: ignore
-                noise_channels=noise_channels,
-                common_noise_options=common_noise_options,
-                esys=(
-                    spectrum_data.energy_table[v_i, :],
-                    spectrum_data.state_table[v_i],
-                ),
-            )
-            for v_i, v in enumerate(param_vals)
-        ]
-
-        # Set the parameter we varied to its initial value
-        setattr(self, param_name, current_val)
 
         plotting_options = {
             "fig_ax": plt.subplots(1),
@@ -573,8 +1187,7 @@ class NoisySystem(ABC):
 
     def _effective_rate(
         self,
-        noise_channels: Union[List[str], List[Tuple[str, Dict]]],
-        common_noise_options: Dict,
+        channel_options: List[Tuple[str, Dict]],
         esys: Tuple[ndarray, ndarray],
         noise_type: str,
     ) -> float:
@@ -584,11 +1197,8 @@ class NoisySystem(ABC):
 
         Parameters
         ----------
-        noise_channels:
-            channels to be plotted, if None then noise channels given by
-            `supported_noise_channels` are used
-        common_noise_options:
-            common options used when calculating coherence times
+        channel_options:
+            list of (channel name, options) to be included
         esys:
             spectral data used during noise calculations
         noise_type:
@@ -599,63 +1209,15 @@ class NoisySystem(ABC):
             coherence rate
         """
         rate = 0.0
-
-        for n, noise_channel in enumerate(noise_channels):
-
-            # noise_channel is a string representing the noise method
-            if isinstance(noise_channel, str):
-
-                noise_channel_method = noise_channel
-
-                # If dealing with a tphi noise type, the contribution of a t1 process
-                # to the dephasing rate its halved.
-                scale_factor = (
-                    0.5
-                    if noise_type == "tphi" and noise_channel_method.startswith("t1")
-                    else 1
-                )
-
-                options = common_noise_options.copy()
-                # We need to make sure we calculate a rate
-                options["get_rate"] = True
-
-                # calculate the noise over the full param span in param_vals
-                rate += scale_factor * getattr(self, noise_channel_method)(
-                    esys=esys, **options
-                )
-
-            # noise_channel is a tuple representing the noise method and default options
-            elif isinstance(noise_channel, tuple):
-
-                noise_channel_method = noise_channel[0]
-
-                # If dealing with a tphi noise type, the contribution of a t1 process
-                # to the dephasing rate its halved.
-                scale_factor = (
-                    0.5
-                    if noise_type == "tphi" and noise_channel_method.startswith("t1")
-                    else 1
-                )
-
-                options = common_noise_options.copy()
-                # Some of the channel-specific options may be in conflict with the
-                # common options options. In such a case, we let the channel-specific
-                # options take priority.
-                options.update(noise_channel[1])
-                # We need to make sure we calculate a rate
-                options["get_rate"] = True
-
-                # calculate the noise over the full param span in param_vals
-                rate += scale_factor * getattr(self, noise_channel_method)(
-                    esys=esys, **options
-                )
-
-            else:
-                raise ValueError(
-                    "The `noise_channels` argument should be one of {str, list of str,"
-                    " or list of tuples}."
-                )
-
+        for noise_channel, options in channel_options:
+            # If dealing with a tphi noise type, the contribution of a t1 process
+            # to the dephasing rate its halved.
+            scale_factor = (
+                0.5 if noise_type == "tphi" and noise_channel.startswith("t1") else 1
+            )
+            # We need to make sure we calculate a rate
+            options["get_rate"] = True
+            rate += scale_factor * getattr(self, noise_channel)(esys=esys, **options)
         return rate
 
     def t1_effective(
@@ -706,58 +1268,16 @@ class NoisySystem(ABC):
 
 
         """
-        common_noise_options = (
-            {} if common_noise_options is None else common_noise_options
+        channel_options = self._effective_channel_options(
+            "t1", noise_channels, common_noise_options
         )
-
-        # If we're not given channels to consider, just use the effective noise
-        # channel list that correspond to t1 processes
-        noise_channels = (
-            [
-                channel
-                for channel in self.effective_noise_channels()
-                if channel.startswith("t1")
-            ]
-            if noise_channels is None
-            else noise_channels
-        )
-
-        # If we're given only a single channel as a string, make it a one entry list
-        noise_channels = (
-            [noise_channels] if isinstance(noise_channels, str) else noise_channels
-        )
-
-        # Do a sanity check; if we're given a tphi channel, raise an exception
-        for noise_channel in noise_channels:
-            channel = (
-                noise_channel[0] if isinstance(noise_channel, tuple) else noise_channel
-            )
-            if not channel.startswith("t1"):
-                raise ValueError(
-                    "Only t1 channels can contribute to effective t1 noise."
-                )
-
         if esys is None:
-            # We have to figure out the largest energy level involved in the
-            # calculations, to know how many levels we need from the diagonalization.
-            # This may be hidden in noise-channel-specific options, so have to search
-            # through those, if any were given.
-            max_level = max(
-                common_noise_options.get("i", 1), common_noise_options.get("j", 1)
+            esys = self.eigensys(  # type: ignore
+                evals_count=self._noise_evals_count(channel_options)
             )
-            for noise_channel in noise_channels:
-                if isinstance(noise_channel, tuple):
-                    opts = noise_channel[1]
-                    max_level = max(max_level, opts.get("i", 1), opts.get("j", 1))
 
-            esys = self.eigensys(evals_count=max_level + 1)  # type: ignore
+        rate = self._effective_rate(channel_options, esys=esys, noise_type="t1")
 
-        rate = self._effective_rate(
-            noise_channels=noise_channels,
-            common_noise_options=common_noise_options,
-            esys=esys,
-            noise_type="t1",
-        )
         if get_rate:
             return rate
         else:
@@ -811,44 +1331,15 @@ class NoisySystem(ABC):
              rate in inverse units.
 
         """
-        common_noise_options = (
-            {} if common_noise_options is None else common_noise_options
-        )
-
-        # If we're not given channels to consider, just use ones from the effective
-        # noise channels list
-        noise_channels = (
-            [channel for channel in self.effective_noise_channels()]
-            if noise_channels is None
-            else noise_channels
+        channel_options = self._effective_channel_options(
+            "t2", noise_channels, common_noise_options
         )
-
-        # If we're given only a single channel as a string, make it a one entry list
-        noise_channels = (
-            [noise_channels] if isinstance(noise_channels, str) else noise_channels
-        )
-
         if esys is None:
-            # We have to figure out the largest energy level involved in the
-            # calculations, to know how many levels we need from the diagonalization.
-            # This may be hidden in noise-channel-specific options, so have to search
-            # through those, if any were given.
-            max_level = max(
-                common_noise_options.get("i", 1), common_noise_options.get("j", 1)
+            esys = self.eigensys(  # type: ignore
+                evals_count=self._noise_evals_count(channel_options)
             )
-            for noise_channel in noise_channels:
-                if isinstance(noise_channel, tuple):
-                    opts = noise_channel[1]
-                    max_level = max(max_level, opts.get("i", 1), opts.get("j", 1))
 
-            esys = self.eigensys(evals_count=max_level + 1)  # type: ignore
-
-        rate = self._effective_rate(
-            noise_channels=noise_channels,
-            common_noise_options=common_noise_options,
-            esys=esys,
-            noise_type="tphi",
-        )
+        rate = self._effective_rate(channel_options, esys=esys, noise_type="tphi")
 
         if get_rate:
             return rate
@@ -898,9 +1389,6 @@ class NoisySystem(ABC):
         if i == j or i < 0 or j < 0:
             raise ValueError("Level indices 'i' and 'j' must be different, and i,j>=0")
 
-        p = {key: NOISE_PARAMS[key] for key in ["omega_low", "omega_high", "t_exp"]}
-        p.update(kwargs)
-
         evals, evecs = self.eigensys(evals_count=max(j, i) + 1) if esys is None else esys  # type: ignore
 
         if isinstance(
@@ -917,11 +1405,7 @@ class NoisySystem(ABC):
                 - np.vdot(evecs[:, j], noise_op.dot(evecs[:, j]))
             )
 
-        rate *= A_noise * np.sqrt(2 * np.abs(np.log(p["omega_low"] * p["t_exp"])))
-
-        # We assume that the system energies are given in units of frequency and
-        # not the angular frequency, hence we have to multiply by `2\pi`
-        rate *= 2 * np.pi
+        rate *= _tphi_1_over_f_prefactor(A_noise, **kwargs)
 
         if get_rate:
             return rate
@@ -959,18 +1443,13 @@ class NoisySystem(ABC):
             decoherence time in units of :math:`2\pi ({\rm system\,\,units})`, or
             rate in inverse units.
         """
-
-        if "tphi_1_over_f_flux" not in self.supported_noise_channels():
-            raise RuntimeError(
-                "Flux noise channel 'tphi_1_over_f_flux' is not supported in this"
-                " system."
-            )
+        noise_op = self._tphi_1_over_f_flux_terms()
 
         return self.tphi_1_over_f(
             A_noise=A_noise,
             i=i,
             j=j,
-            noise_op=self.d_hamiltonian_d_flux(),  # type: ignore
+            noise_op=noise_op(),
             esys=esys,
             get_rate=get_rate,
             **kwargs
@@ -1008,18 +1487,13 @@ class NoisySystem(ABC):
             rate in inverse units.
 
         """
-
-        if "tphi_1_over_f_cc" not in self.supported_noise_channels():
-            raise RuntimeError(
-                "Critical current noise channel 'tphi_1_over_f_cc' is not supported in"
-                " this system."
-            )
+        noise_op = self._tphi_1_over_f_cc_terms()
 
         return self.tphi_1_over_f(
             A_noise=A_noise,
             i=i,
             j=j,
-            noise_op=self.d_hamiltonian_d_EJ(),  # type: ignore
+            noise_op=noise_op(),
             esys=esys,
             get_rate=get_rate,
             **kwargs
@@ -1057,17 +1531,13 @@ class NoisySystem(ABC):
             decoherence time in units of :math:`2\pi ({\rm system\,\,units})`, or rate
              in inverse units.
         """
-        if "tphi_1_over_f_ng" not in self.supported_noise_channels():
-            raise RuntimeError(
-                "Charge noise channel 'tphi_1_over_f_ng' is not supported in this"
-                " system."
-            )
+        noise_op = self._tphi_1_over_f_ng_terms()
 
         return self.tphi_1_over_f(
             A_noise=A_noise,
             i=i,
             j=j,
-            noise_op=self.d_hamiltonian_d_ng(),  # type: ignore
+            noise_op=noise_op(),
             esys=esys,
             get_rate=get_rate,
             **kwargs
@@ -1156,6 +1626,137 @@ class NoisySystem(ABC):
         else:
             return 1 / rate if rate != 0 else np.inf
 
+    def t1_rate_matrix(
+        self,
+        noise_op: Union[ndarray, csc_matrix],
+        spectral_density: Callable,
+        evals_count: int = 6,
+        esys: Tuple[ndarray, ndarray] = None,
+    ) -> ndarray:
+        r"""
+        Calculate the matrix of transition rates between all pairs of the lowest
+        `evals_count` levels, using Fermi's Golden Rule for a noise channel with
+        spectral density `spectral_density` and system noise operator `noise_op`:
+
+        .. math::
+
+            \Gamma_{ij} = \frac{1}{\hbar^2} |\langle i| A_{\rm noise} | j \rangle|^2
+            S(\omega_{ij})
+
+        All matrix elements are obtained from a single contraction
+        :math:`V^\dagger A_{\rm noise} V` with the matrix of eigenvectors, and the
+        spectral density is evaluated for all transition frequencies at once. Entry
+        `[i, j]` agrees with `t1(i, j, noise_op, spectral_density, total=False,
+        get_rate=True)`.
+
+        Parameters
+        ----------
+        noise_op:
+            noise operator
+        spectral_density:
+            defines a spectral density, must take one argument: `omega`
+            (assumed to be in units of `2 \pi * <system units>`)
+        evals_count:
+            number of levels included (default value = 6)
+        esys:
+            evals, evecs tuple
+
+        Returns
+        -------
+            array of shape (evals_count, evals_count) holding the rates of transitions
+            i->j in inverse units of :math:`2\pi ({\rm system\,\,units})`; diagonal
+            entries are zero
+        """
+        evals, evecs = self.eigensys(evals_count=evals_count) if esys is None else esys  # type: ignore
+        return _t1_rate_matrices(
+            noise_op,
+            [spectral_density],
+            np.asarray(evals)[np.newaxis],
+            np.asarray(evecs)[np.newaxis],
+        )[0]
+
+    def t1_rate_matrix_vs_paramvals(
+        self,
+        noise_channel: str,
+        param_name: str,
+        param_vals: ndarray,
+        evals_count: int = 6,
+        spectrum_data: SpectrumData = None,
+        num_cpus: int = settings.NUM_CPUS,
+        **kwargs
+    ) -> ndarray:
+        r"""
+        Calculate the matrices of transition rates between all pairs of the lowest
+        `evals_count` levels due to the depolarizing noise channel `noise_channel`,
+        for each of the parameter values `param_vals`; see `t1_rate_matrix`. Noise
+        operators are constructed once per distinct parameter value, and spectral
+        densities are evaluated for all transitions and parameter values at once.
+
+        Parameters
+        ----------
+        noise_channel:
+            name of a depolarizing noise channel, e.g. 't1_capacitive'
+        param_name:
+            name of parameter to be varied
+        param_vals:
+            parameter values to be plugged in
+        evals_count:
+            number of levels included (default value = 6)
+        spectrum_data:
+            spectral data used during noise calculations, holding at least
+            `evals_count` eigenvalues and eigenstates per parameter value
+        num_cpus:
+            number of cores to be used for computing the spectral data
+        **kwargs:
+            options of the noise channel, e.g. `T` or `Q_cap`
+
+        Returns
+        -------
+            array of shape (len(param_vals), evals_count, evals_count), holding the
+            rate matrix for each parameter value
+        """
+        if not noise_channel.startswith("t1"):
+            raise ValueError("Rate matrices are only defined for t1 noise channels.")
+        if spectrum_data is None:
+            spectrum_data = self.get_spectrum_vs_paramvals(  # type: ignore
+                param_name,
+                param_vals,
+                evals_count=evals_count,
+                get_eigenstates=True,
+                num_cpus=num_cpus,
+            )
+        energy_table = np.asarray(spectrum_data.energy_table)[:, :evals_count]
+        state_table = np.asarray(spectrum_data.state_table)[:, :, :evals_count]
+
+        points = [(paramval,) for paramval in param_vals]
+        current_val = getattr(self, param_name)
+        if not self._has_channel_terms(noise_channel):
+            # channels defined or overridden by subclasses: evaluate pair by pair
+            rate_matrices = np.zeros(energy_table.shape + (evals_count,))
+            try:
+                for i, j in itertools.permutations(range(evals_count), 2):
+                    rate_matrices[:, i, j] = self._channel_rates_vs_points(
+                        noise_channel,
+                        dict(kwargs, i=i, j=j, total=False),
+                        [param_name],
+                        points,
+                        energy_table,
+                        state_table,
+                    )
+            finally:
+                setattr(self, param_name, current_val)
+            return rate_matrices
+
+        try:
+            noise_ops, spectral_densities = self._channel_terms_vs_points(
+                noise_channel, kwargs, [param_name], points
+            )
+        finally:
+            setattr(self, param_name, current_val)
+        return _t1_rate_matrices(
+            noise_ops, spectral_densities, energy_table, state_table
+        )
+
     def t1_capacitive(
         self,
         i: int = 1,
@@ -1197,47 +1798,12 @@ class NoisySystem(ABC):
              in inverse units.
 
         """
-        if "t1_capacitive" not in self.supported_noise_channels():
-            raise RuntimeError(
-                "Noise channel 't1_capacitive' is not supported in this system."
-            )
-
-        if Q_cap is None:
-            # See Smith et al (2020)
-            def q_cap_fun(omega):
-                return (
-                    1e6
-                    * (2 * np.pi * 6e9 / np.abs(units.to_standard_units(omega))) ** 0.7
-                )
-
-        elif callable(Q_cap):  # Q_cap is a function of omega
-            q_cap_fun = Q_cap
-        else:  # Q_cap is given as a number
-
-            def q_cap_fun(omega):
-                return Q_cap
-
-        def spectral_density(omega):
-            therm_ratio = calc_therm_ratio(omega, T)
-            s = (
-                2
-                * 8
-                * self.EC
-                / q_cap_fun(omega)
-                * (1 / np.tanh(0.5 * np.abs(therm_ratio)))
-                / (1 + np.exp(-therm_ratio))
-            )
-            s *= (
-                2 * np.pi
-            )  # We assume that system energies are given in units of frequency
-            return s
-
-        noise_op = self.n_operator()  # type: ignore
+        noise_op, spectral_density = self._t1_capacitive_terms(Q_cap=Q_cap, T=T)
 
         return self.t1(
             i=i,
             j=j,
-            noise_op=noise_op,
+            noise_op=noise_op(),
             spectral_density=spectral_density,
             total=total,
             esys=esys,
@@ -1283,33 +1849,12 @@ class NoisySystem(ABC):
         time or rate: float
             decoherence time in units of :math:`2\pi ({\rm system\,\,units})`, or rate in inverse units.
         """
-        if "t1_charge_impedance" not in self.supported_noise_channels():
-            raise RuntimeError(
-                "Noise channel 't1_charge_impedance' is not supported in this system."
-            )
-
-        Z_fun = Z if callable(Z) else lambda omega: Z
-
-        def spectral_density(omega):
-            # Note, our definition of Q_c is different from Zhang et al (2020) by a
-            # factor of 2
-            Q_c = NOISE_PARAMS["R_k"] / (8 * np.pi * complex(Z_fun(omega)).real)
-            therm_ratio = calc_therm_ratio(omega, T)
-            s = (
-                2
-                * omega
-                / Q_c
-                * (1 / np.tanh(0.5 * therm_ratio))
-                / (1 + np.exp(-therm_ratio))
-            )
-            return s
-
-        noise_op = self.n_operator()  # type: ignore
+        noise_op, spectral_density = self._t1_charge_impedance_terms(Z=Z, T=T)
 
         return self.t1(
             i=i,
             j=j,
-            noise_op=noise_op,
+            noise_op=noise_op(),
             spectral_density=spectral_density,
             total=total,
             esys=esys,
@@ -1360,40 +1905,12 @@ class NoisySystem(ABC):
             decoherence time in units of :math:`2\pi ({\rm system\,\,units})`,
             or rate in inverse units.
         """
-        if "t1_flux_bias_line" not in self.supported_noise_channels():
-            raise RuntimeError(
-                "Noise channel 't1_flux_bias_line' is not supported in this system."
-            )
-
-        Z_fun = Z if callable(Z) else lambda omega: Z
-
-        def spectral_density(omega, Z=Z):
-            """
-            Our definitions assume that the noise_op is dH/dflux.
-            """
-            therm_ratio = calc_therm_ratio(omega, T)
-            s = (
-                2
-                * (2 * np.pi) ** 2
-                * M ** 2
-                * omega
-                * sp.constants.hbar
-                / complex(Z_fun(omega)).real
-                * (1 / np.tanh(0.5 * therm_ratio))
-                / (1 + np.exp(-therm_ratio))
-            )
-            # We assume that system energies are given in units of frequency and that
-            # the noise operator to be used with this `spectral_density` is dH/dflux.
-            # Hence we have to convert  2 powers of frequency to standard units
-            s *= (units.to_standard_units(1)) ** 2.0
-            return s
-
-        noise_op = self.d_hamiltonian_d_flux()  # type: ignore
+        noise_op, spectral_density = self._t1_flux_bias_line_terms(M=M, Z=Z, T=T)
 
         return self.t1(
             i=i,
             j=j,
-            noise_op=noise_op,
+            noise_op=noise_op(),
             spectral_density=spectral_density,
             total=total,
             esys=esys,
@@ -1443,58 +1960,12 @@ class NoisySystem(ABC):
             decoherence time in units of :math:`2\pi ({\rm system\,\,units})`, or rate
             in inverse units.
         """
-        if "t1_inductive" not in self.supported_noise_channels():
-            raise RuntimeError(
-                "Noise channel 't1_inductive' is not supported in this system."
-            )
-
-        if Q_ind is None:
-            # See Smith et al (2020)
-            def q_ind_fun(omega):
-                therm_ratio = abs(calc_therm_ratio(omega, T))
-                therm_ratio_500MHz = calc_therm_ratio(
-                    2 * np.pi * 500e6, T, omega_in_standard_units=True
-                )
-                return (
-                    500e6
-                    * (
-                        sp.special.kv(0, 1 / 2 * therm_ratio_500MHz)
-                        * np.sinh(1 / 2 * therm_ratio_500MHz)
-                    )
-                    / (
-                        sp.special.kv(0, 1 / 2 * therm_ratio)
-                        * np.sinh(1 / 2 * therm_ratio)
-                    )
-                )
-
-        elif callable(Q_ind):  # Q_ind is a function of omega
-            q_ind_fun = Q_ind
-
-        else:  # Q_ind is given as a number
-
-            def q_ind_fun(omega):
-                return Q_ind
-
-        def spectral_density(omega):
-            therm_ratio = calc_therm_ratio(omega, T)
-            s = (
-                2
-                * self.EL
-                / q_ind_fun(omega)
-                * (1 / np.tanh(0.5 * np.abs(therm_ratio)))
-                / (1 + np.exp(-therm_ratio))
-            )
-            s *= (
-                2 * np.pi
-            )  # We assume that system energies are given in units of frequency
-            return s
-
-        noise_op = self.phi_operator()  # type: ignore
+        noise_op, spectral_density = self._t1_inductive_terms(Q_ind=Q_ind, T=T)
 
         return self.t1(
             i=i,
             j=j,
-            noise_op=noise_op,
+            noise_op=noise_op(),
             spectral_density=spectral_density,
             total=total,
             esys=esys,
@@ -1547,75 +2018,121 @@ class NoisySystem(ABC):
         time or rate: float
             decoherence time in units of :math:`2\pi ({\rm system\,\,units})`, or rate in inverse units.
         """
-        if "t1_quasiparticle_tunneling" not in self.supported_noise_channels():
-            raise RuntimeError(
-                "Noise channel 't1_quasiparticle_tunneling' is not supported in this"
-                " system."
-            )
-
-        if Y_qp is None:
-
-            def y_qp_fun(omega):
+        noise_op, spectral_density = self._t1_quasiparticle_tunneling_terms(
+            Y_qp=Y_qp, x_qp=x_qp, T=T, Delta=Delta
+        )
 
-                # Note that y_qp_fun is always symmetric in omega, i.e. In Smith et al 2020,
-                # we essentially have something proportional to sinh(omega)/omega
-                omega = abs(omega)
+        return self.t1(
+            i=i,
+            j=j,
+            noise_op=noise_op(),
+            spectral_density=spectral_density,
+            total=total,
+            esys=esys,
+            get_rate=get_rate,
+            **kwargs
+        )
 
-                Delta_in_Hz = convert_eV_to_Hz(Delta)
-                omega_in_Hz = units.to_standard_units(omega) / (2 * np.pi)
-                EJ_in_Hz = units.to_standard_units(self.EJ)
+    # NoisySystem: noise terms of the individual channels ------------------------------
+    # Each method returns the noise operator (as a function without arguments, so that
+    # constructing it can be skipped where possible) and, for depolarizing channels,
+    # the spectral density with all options bound by keyword.
 
-                therm_ratio = calc_therm_ratio(omega, T)
-                Delta_over_T = calc_therm_ratio(
-                    2 * np.pi * Delta_in_Hz, T, omega_in_standard_units=True
+    def _check_channel_support(self, noise_channel: str, description: str) -> None:
+        if noise_channel not in self.supported_noise_channels():
+            raise RuntimeError(
+                "{} '{}' is not supported in this system.".format(
+                    description, noise_channel
                 )
+            )
 
-                re_y_qp = (
-                    np.sqrt(2 / np.pi)
-                    * (8 / NOISE_PARAMS["R_k"])
-                    * (EJ_in_Hz / Delta_in_Hz)
-                    * (2 * Delta_in_Hz / omega_in_Hz) ** (3 / 2)
-                    * x_qp
-                    * np.sqrt(1 / 2 * therm_ratio)
-                    * sp.special.kv(0, 1 / 2 * abs(therm_ratio))
-                    * np.sinh(1 / 2 * therm_ratio)
-                )
+    def _tphi_1_over_f_flux_terms(self, **kwargs) -> Callable:
+        self._check_channel_support("tphi_1_over_f_flux", "Flux noise channel")
+        return self.d_hamiltonian_d_flux  # type: ignore
 
-                return re_y_qp
+    def _tphi_1_over_f_cc_terms(self, **kwargs) -> Callable:
+        self._check_channel_support(
+            "tphi_1_over_f_cc", "Critical current noise channel"
+        )
+        return self.d_hamiltonian_d_EJ  # type: ignore
 
-        elif callable(Y_qp):  # Y_qp is a function of omega
-            y_qp_fun = Y_qp
+    def _tphi_1_over_f_ng_terms(self, **kwargs) -> Callable:
+        self._check_channel_support("tphi_1_over_f_ng", "Charge noise channel")
+        return self.d_hamiltonian_d_ng  # type: ignore
 
-        else:  # Y_qp is given as a number
+    def _t1_capacitive_terms(
+        self,
+        Q_cap: Union[float, Callable] = None,
+        T: float = NOISE_PARAMS["T"],
+        **kwargs
+    ) -> Tuple[Callable, Callable]:
+        self._check_channel_support("t1_capacitive", "Noise channel")
+        spectral_density = functools.partial(
+            _spectral_density_capacitive, EC=self.EC, Q_cap=Q_cap, T=T  # type: ignore
+        )
+        return self.n_operator, spectral_density  # type: ignore
+
+    def _t1_charge_impedance_terms(
+        self,
+        Z: Union[float, Callable] = NOISE_PARAMS["R_0"],
+        T: float = NOISE_PARAMS["T"],
+        **kwargs
+    ) -> Tuple[Callable, Callable]:
+        self._check_channel_support("t1_charge_impedance", "Noise channel")
+        spectral_density = functools.partial(
+            _spectral_density_charge_impedance, Z=Z, T=T
+        )
+        return self.n_operator, spectral_density  # type: ignore
 
-            def y_qp_fun(omega):
-                return Y_qp
+    def _t1_flux_bias_line_terms(
+        self,
+        M: float = NOISE_PARAMS["M"],
+        Z: Union[complex, float, Callable] = NOISE_PARAMS["R_0"],
+        T: float = NOISE_PARAMS["T"],
+        **kwargs
+    ) -> Tuple[Callable, Callable]:
+        self._check_channel_support("t1_flux_bias_line", "Noise channel")
+        spectral_density = functools.partial(
+            _spectral_density_flux_bias_line, M=M, Z=Z, T=T
+        )
+        return self.d_hamiltonian_d_flux, spectral_density  # type: ignore
 
-        def spectral_density(omega):
-            """Eq. 38 in Catalani et al (2011). """
-            therm_ratio = calc_therm_ratio(omega, T)
-            return (
-                omega
-                * NOISE_PARAMS["R_k"]
-                / np.pi
-                * complex(y_qp_fun(omega)).real
-                * (1 / np.tanh(0.5 * np.abs(therm_ratio)))
-                / (1 + np.exp(-therm_ratio))
-            )
+    def _t1_inductive_terms(
+        self,
+        Q_ind: Union[float, Callable] = None,
+        T: float = NOISE_PARAMS["T"],
+        **kwargs
+    ) -> Tuple[Callable, Callable]:
+        self._check_channel_support("t1_inductive", "Noise channel")
+        spectral_density = functools.partial(
+            _spectral_density_inductive, EL=self.EL, Q_ind=Q_ind, T=T  # type: ignore
+        )
+        return self.phi_operator, spectral_density  # type: ignore
 
+    def _t1_quasiparticle_tunneling_terms(
+        self,
+        Y_qp: Union[float, Callable] = None,
+        x_qp: float = NOISE_PARAMS["x_qp"],
+        T: float = NOISE_PARAMS["T"],
+        Delta: float = NOISE_PARAMS["Delta"],
+        **kwargs
+    ) -> Tuple[Callable, Callable]:
+        self._check_channel_support("t1_quasiparticle_tunneling", "Noise channel")
+        spectral_density = functools.partial(
+            _spectral_density_quasiparticle_tunneling,
+            EJ=self.EJ,  # type: ignore
+            Y_qp=Y_qp,
+            x_qp=x_qp,
+            T=T,
+            Delta=Delta,
+        )
         # In some literature the operator sin(phi/2) is used, which assumes
         # that the flux is grouped with the inductive term in the Hamiltonian.
         # Here we assume a grouping with the cosine term, which requires us to
         # transform the operator using phi -> phi + 2*pi*flux
-        noise_op = self.sin_phi_operator(alpha=0.5, beta=0.5 * (2 * np.pi * self.flux))  # type: ignore
-
-        return self.t1(
-            i=i,
-            j=j,
-            noise_op=noise_op,
-            spectral_density=spectral_density,
-            total=total,
-            esys=esys,
-            get_rate=get_rate,
-            **kwargs
+        noise_op = functools.partial(
+            self.sin_phi_operator,  # type: ignore
+            alpha=0.5,
+            beta=0.5 * (2 * np.pi * self.flux),  # type: ignore
         )
+        return noise_op, spectral_density
@@ -0,0 +1,177 @@
+# param_hamiltonian.py
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019 and later, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+"""
+Affine decomposition of Hamiltonians with respect to a single parameter,
+:math:`H(p) = H_0 + \\sum_k f_k(p) H_k`, for fast re-assembly in parameter sweeps.
+"""
+
+from typing import Callable, List, Sequence, Union
+
+import numpy as np
+
+from numpy import ndarray
+from scipy import sparse
+from scipy.sparse import csc_matrix
+
+Matrix = Union[ndarray, sparse.spmatrix]
+
+# five-point central finite-difference stencils (offsets, weights) for the first and
+# second derivatives of the scalar functions f_k
+_STENCIL_STEP = 1e-3
+_STENCILS = {
+    1: (np.arange(-2.0, 3.0), np.array([1.0, -8.0, 0.0, 8.0, -1.0]) / 12.0),
+    2: (np.arange(-2.0, 3.0), np.array([-1.0, 16.0, -30.0, 16.0, -1.0]) / 12.0),
+}
+
+
+# scalar functions of the parameter, commonly used in decompositions; all of them
+# act elementwise on arrays of parameter values
+def linear(x: Union[float, ndarray]) -> Union[float, ndarray]:
+    return x
+
+
+def quadratic(x: Union[float, ndarray]) -> Union[float, ndarray]:
+    return x * x
+
+
+def cos_pi(x: Union[float, ndarray]) -> Union[float, ndarray]:
+    return np.cos(np.pi * x)
+
+
+def sin_pi(x: Union[float, ndarray]) -> Union[float, ndarray]:
+    return np.sin(np.pi * x)
+
+
+def cos_2pi(x: Union[float, ndarray]) -> Union[float, ndarray]:
+    return np.cos(2.0 * np.pi * x)
+
+
+def sin_2pi(x: Union[float, ndarray]) -> Union[float, ndarray]:
+    return np.sin(2.0 * np.pi * x)
+
+
+class ParametricHamiltonian:
+    """Stores the terms of the affine decomposition
+    :math:`H(p) = H_0 + \\sum_k f_k(p) H_k` of a Hamiltonian, and assembles
+    :math:`H(p)` for given values of the parameter `p` by a weighted sum. Sparse
+    terms are brought onto a common sparsity pattern, so that assembly reduces to
+    a linear combination of the stored data vectors.
+
+    Parameters
+    ----------
+    terms:
+        matrices [H_0, H_1, ..., H_K]; either all dense or all sparse
+    functions:
+        scalar functions [f_1, ..., f_K] of the parameter
+    """
+
+    def __init__(self, terms: List[Matrix], functions: List[Callable]) -> None:
+        if len(terms) != len(functions) + 1:
+            raise ValueError("Expected exactly one more term than functions.")
+        self.functions = functions
+        self.shape = terms[0].shape
+        self.is_sparse = sparse.issparse(terms[0])
+        if self.is_sparse:
+            pattern = sum(abs(term) for term in terms).tocsc()
+            pattern.sort_indices()
+            self._indices = pattern.indices
+            self._indptr = pattern.indptr
+            pattern_coo = pattern.tocoo()
+            self.terms = [
+                np.asarray(
+                    term.tocsr()[pattern_coo.row, pattern_coo.col], dtype=term.dtype
+                ).ravel()
+                for term in terms
+            ]
+        else:
+            self.terms = [np.asarray(term) for term in terms]
+
+    @classmethod
+    def from_samples(
+        cls,
+        hamiltonian_func: Callable[[float], Matrix],
+        functions: List[Callable],
+        sample_vals: Sequence[float],
+    ) -> "ParametricHamiltonian":
+        """Extracts the terms H_k from Hamiltonians sampled at `len(functions) + 1`
+        parameter values, by inverting the linear system
+        :math:`H(p_j) = H_0 + \\sum_k f_k(p_j) H_k`.
+
+        Parameters
+        ----------
+        hamiltonian_func:
+            returns the Hamiltonian for a given parameter value
+        functions:
+            scalar functions [f_1, ..., f_K] of the parameter
+        sample_vals:
+            K+1 parameter values for which the linear system is well conditioned
+        """
+        coefficients = np.asarray(
+            [[1.0] + [func(val) for func in functions] for val in sample_vals]
+        )
+        inverse = np.linalg.inv(coefficients)
+        samples = [hamiltonian_func(val) for val in sample_vals]
+        terms = [
+            sum(weight * sample for weight, sample in zip(inverse_row, samples))
+            for inverse_row in inverse
+        ]
+        return cls(terms, functions)
+
+    def coefficients(self, paramvals: ndarray) -> ndarray:
+        """Returns the array of weights [1, f_1(p), ..., f_K(p)] for each entry p of
+        `paramvals`, of shape (len(paramvals), K+1)."""
+        paramvals = np.asarray(paramvals, dtype=np.float_)
+        return np.column_stack(
+            [np.ones_like(paramvals)] + [func(paramvals) for func in self.functions]
+        )
+
+    def evaluate(self, paramval: float) -> Matrix:
+        """Returns the Hamiltonian for the parameter value `paramval`."""
+        return self._combine(self.coefficients(np.asarray([paramval]))[0])
+
+    def derivative(self, paramval: float, order: int = 1) -> Matrix:
+        """Returns the first or second derivative of the Hamiltonian with respect to
+        the parameter, at the parameter value `paramval`. Derivatives of the scalar
+        functions f_k are obtained from five-point finite-difference stencils.
+
+        Parameters
+        ----------
+        paramval:
+            value of the parameter
+        order:
+            1 or 2, order of the derivative (default value = 1)
+        """
+        if order not in _STENCILS:
+            raise ValueError("Only first and second derivatives are supported.")
+        offsets, stencil_weights = _STENCILS[order]
+        step = _STENCIL_STEP * max(1.0, abs(paramval))
+        coefficients = self.coefficients(paramval + step * offsets)
+        weights = stencil_weights @ coefficients / step ** order
+        weights[0] = 0.0
+        return self._combine(weights)
+
+    def _combine(self, weights: ndarray) -> Matrix:
+        """Returns the linear combination of the terms with the given weights."""
+        data = self.terms[0] * weights[0]
+        for weight, term in zip(weights[1:], self.terms[1:]):
+            data = data + weight * term
+        if self.is_sparse:
+            return csc_matrix((data, self._indices, self._indptr), shape=self.shape)
+        return data
+
+    def evaluate_stack(self, paramvals: ndarray) -> ndarray:
+        """Returns the stack of dense Hamiltonians of shape (len(paramvals), dim,
+        dim) for all entries of `paramvals`."""
+        if self.is_sparse:
+            raise TypeError("Stacked evaluation requires dense terms.")
+        return np.tensordot(
+            self.coefficients(paramvals), np.asarray(self.terms), axes=1
+        )
@@ -11,26 +11,35 @@
 
 
 import functools
+import hashlib
+import os
+import types
 import weakref
 
 from abc import ABC
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Union
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
+import h5py
 import numpy as np
 
 from numpy import ndarray
-from qutip.qobj import Qobj
+from scipy import sparse
+from scipy.sparse import csr_matrix
 
 import scqubits.core.central_dispatch as dispatch
 import scqubits.core.descriptors as descriptors
 import scqubits.core.hilbert_space as hspace
 import scqubits.core.spec_lookup as spec_lookup
 import scqubits.core.storage as storage
+import scqubits.io_utils.fileio as io
+import scqubits.io_utils.fileio_backends as io_backends
 import scqubits.io_utils.fileio_qutip as qutip_serializer
 import scqubits.io_utils.fileio_serializers as serializers
 import scqubits.settings as settings
 import scqubits.utils.cpu_switch as cpu_switch
 import scqubits.utils.misc as utils
+import scqubits.utils.spectrum_utils as spec_utils
 
 from scqubits.core.harmonic_osc import Oscillator
 from scqubits.core.hilbert_space import HilbertSpace
@@ -50,6 +59,13 @@ else:
 
 QuantumSys = Union[QubitBaseClass, Oscillator]
 
+# locations of the per-point data of a sweep within its h5 file, following the layout
+# produced by H5Writer for `ParameterSweep.serialize()`
+_H5_LOOKUP = "__objects/_lookup/"
+_H5_BARE_SPECDATA = _H5_LOOKUP + "__lists/_bare_specdata_list/__objects/{}/"
+_H5_DRESSED_SPECDATA = _H5_LOOKUP + "__objects/_dressed_specdata/"
+_H5_DRESSED_STATES = _H5_DRESSED_SPECDATA + "__lists/state_table/__objects/{}/evecs"
+
 
 class ParameterSweepBase(ABC):
     """
@@ -117,13 +133,128 @@ class ParameterSweepBase(ABC):
     def system_params(self) -> Dict[str, Any]:
         return self._hilbertspace.get_initdata()
 
+    @property
+    def grid_shape(self) -> Tuple[int, ...]:
+        """Shape of the parameter grid: `(param_count,)` for sweeps over a single
+        parameter, `(n1, ..., nN)` for sweeps over an N-dimensional grid."""
+        if isinstance(self.param_name, list):
+            return tuple(len(axis_vals) for axis_vals in self.param_vals)
+        return (self.param_count,)
+
+    def param_index(self, grid_index: Tuple[int, ...]) -> int:
+        """Returns the position index of the grid point with axis indices
+        `grid_index` = (n1, ..., nN). Data of grid sweeps are stored for the flattened
+        grid, with the last axis varying fastest."""
+        return int(np.ravel_multi_index(grid_index, self.grid_shape))
+
+    def reshape_to_grid(self, table: Union[ndarray, List]) -> ndarray:
+        """Reshapes `table`, holding one entry per position index along its first
+        axis, into an array of shape `grid_shape + table.shape[1:]`. Leaves tables of
+        sweeps over a single parameter unchanged."""
+        table = np.asarray(table)
+        return table.reshape(self.grid_shape + table.shape[1:])
+
     def new_datastore(self, **kwargs) -> DataStore:
-        """Return DataStore object with system/sweep information obtained from self."""
+        """Return DataStore object with system/sweep information obtained from self.
+        Data of grid sweeps are reshaped to the grid, see `reshape_to_grid`."""
+        kwargs = {
+            dataname: self.reshape_to_grid(data) for dataname, data in kwargs.items()
+        }
         return storage.DataStore(
             self.system_params, self.param_name, self.param_vals, **kwargs
         )
 
 
+def _param_count(
+    param_name: Union[str, List[str]], param_vals: Union[ndarray, List[ndarray]]
+) -> int:
+    """Returns the number of parameter values of a sweep over a single parameter, or
+    the number of grid points of a sweep over a grid."""
+    if isinstance(param_name, list):
+        return int(np.prod([len(axis_vals) for axis_vals in param_vals]))
+    return len(param_vals)
+
+
+def _update_fingerprint(digest: Any, obj: Any) -> None:
+    """Feeds a representation of `obj` into the hash object `digest`. Arrays enter
+    by their full content, containers and objects providing `get_initdata` are
+    traversed, and code objects enter by their bytecode and constants."""
+    if isinstance(obj, ndarray) and obj.dtype != object:
+        digest.update(repr((obj.shape, obj.dtype.str)).encode())
+        digest.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, ndarray):
+        _update_fingerprint(digest, obj.tolist())
+    elif sparse.issparse(obj):
+        _update_fingerprint(digest, obj.toarray())
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=str):
+            _update_fingerprint(digest, [key, obj[key]])
+    elif isinstance(obj, (list, tuple)):
+        digest.update("[{}]".format(len(obj)).encode())
+        for item in obj:
+            _update_fingerprint(digest, item)
+    elif isinstance(obj, (set, frozenset)):
+        _update_fingerprint(digest, sorted(repr(item) for item in obj))
+    elif isinstance(obj, types.CodeType):
+        digest.update(obj.co_code)
+        _update_fingerprint(digest, obj.co_consts)
+    elif hasattr(obj, "get_initdata"):
+        _update_fingerprint(digest, [type(obj).__name__, obj.get_initdata()])
+    else:
+        digest.update(repr(obj).encode())
+
+
+class _H5StateTable(Sequence):
+    """
+    Read-only state table of a sweep streamed to an h5 file. Eigenstates are read
+    from the file for a single parameter value at a time, upon access, so that the
+    state table is never held in memory as a whole.
+
+    Parameters
+    ----------
+    filename:
+        name of the h5 file holding the sweep
+    path:
+        location of the data set with one row of eigenvectors per parameter value
+        (bare states), or format string for the location of the eigenvectors of a
+        given parameter value (dressed states)
+    param_count:
+        number of parameter values
+    subsystem_dims:
+        for dressed states, the subsystem dimensions; eigenstates are then returned
+        as qutip kets
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        path: str,
+        param_count: int,
+        subsystem_dims: Optional[List[int]] = None,
+    ) -> None:
+        self._filename = filename
+        self._path = path
+        self._param_count = param_count
+        self._subsystem_dims = subsystem_dims
+
+    def __len__(self) -> int:
+        return self._param_count
+
+    def __getitem__(
+        self, param_index: Union[int, slice]
+    ) -> Union[ndarray, QutipEigenstates, List[Union[ndarray, QutipEigenstates]]]:
+        if isinstance(param_index, slice):
+            return [self[index] for index in range(len(self))[param_index]]
+        param_index = range(len(self))[param_index]
+        with h5py.File(self._filename, "r") as h5file:
+            if self._subsystem_dims is None:
+                return h5file[self._path][param_index]
+            evecs = h5file[self._path.format(param_index)][:, :, 0]
+        return spec_utils.convert_ndarray_to_esys(evecs.T, self._subsystem_dims).view(
+            QutipEigenstates
+        )
+
+
 class ParameterSweep(
     ParameterSweepBase, dispatch.DispatchClient, serializers.Serializable
 ):
@@ -136,9 +267,13 @@ class ParameterSweep(
     Parameters
     ----------
     param_name:
-        name of external parameter to be varied
+        name of external parameter to be varied; for sweeps over an N-dimensional grid,
+        list of the names of the N parameters
     param_vals:
-        array of parameter values
+        array of parameter values; for sweeps over an N-dimensional grid, list of the N
+        arrays of values along the grid axes. Spectral data and the lookup of grid
+        sweeps are stored for the flattened grid (last axis varying fastest), see
+        `param_index` and `reshape_to_grid`.
     evals_count:
         number of eigenvalues and eigenstates to be calculated for the composite Hilbert space
     hilbertspace:
@@ -147,9 +282,28 @@ class ParameterSweep(
         list of subsys_list in the Hilbert space which get modified when the external parameter changes
     update_hilbertspace:
         update_hilbertspace(param_val) specifies how a change in the external parameter affects
-        the Hilbert space components
+        the Hilbert space components; for grid sweeps, it is called as
+        update_hilbertspace(param_val1, ..., param_valN)
     num_cpus:
         number of CPUS requested for computing the sweep (default value settings.NUM_CPUS)
+    checkpoint_file:
+        if given, the sweep is streamed to this h5 file: results are written as soon as
+        each parameter value is done, and a sweep found partially completed in an
+        existing file is resumed. Resuming is refused if the HilbertSpace or the sweep
+        definition differ from those the file was written for. The file can be opened
+        with `scqubits.read` at any time, yielding a StoredSweep. Eigenstates are not
+        kept in memory: they are read from the file for one parameter value at a time.
+    refine_tol:
+        if given (sweeps over a single parameter only), the sweep is adaptive:
+        `param_vals` only serves as the initial coarse grid, and parameter values are
+        inserted where the dressed energies are poorly resolved (strong curvature,
+        narrow avoided crossings), until the estimated error of interpolating them
+        linearly is below `refine_tol`.
+        `param_vals` is replaced by the resulting non-uniform grid; later runs start
+        again from the initial coarse grid.
+    max_points:
+        maximum number of parameter values in an adaptive sweep
+        (default value: ten times the length of the initial `param_vals`)
     """
 
     param_name = descriptors.WatchedProperty("PARAMETERSWEEP_UPDATE")
@@ -162,26 +316,40 @@ class ParameterSweep(
 
     def __init__(
         self,
-        param_name: str,
-        param_vals: ndarray,
+        param_name: Union[str, List[str]],
+        param_vals: Union[ndarray, List[ndarray]],
         evals_count: int,
         hilbertspace: HilbertSpace,
         subsys_update_list: List[QuantumSys],
         update_hilbertspace: Callable,
         num_cpus: int = settings.NUM_CPUS,
+        checkpoint_file: str = None,
+        refine_tol: float = None,
+        max_points: int = None,
     ) -> None:
+        if checkpoint_file is not None and refine_tol is not None:
+            raise ValueError("Adaptive sweeps cannot be streamed to a checkpoint file.")
+        if isinstance(param_name, list) and refine_tol is not None:
+            raise ValueError("Adaptive sweeps require a single sweep parameter.")
         self.param_name = param_name
         self.param_vals = param_vals
-        self.param_count = len(param_vals)
+        self.param_count = _param_count(param_name, param_vals)
         self.evals_count = evals_count
         self._hilbertspace = hilbertspace
         self.subsys_update_list = tuple(subsys_update_list)
         self.update_hilbertspace = update_hilbertspace
         self.num_cpus = num_cpus
+        self.checkpoint_file = checkpoint_file
+        self.refine_tol = refine_tol
+        self.max_points = max_points
+        # adaptive sweeps: initial coarse grid, and refined grid of the latest run
+        self._coarse_param_vals = param_vals
+        self._refined_param_vals: Union[ndarray, None] = None
         self._lookup: Union[SpectrumLookup, None] = None
-        self._bare_hamiltonian_constant: Qobj
+        self._hamiltonian_constant: csr_matrix
+        self._interaction_ops_constant: Dict[int, List[Optional[csr_matrix]]]
 
-        self.tqdm_disabled = settings.PROGRESSBAR_DISABLED or (num_cpus > 1)
+        self.tqdm_disabled = settings.PROGRESSBAR_DISABLED
 
         dispatch.CENTRAL_DISPATCH.register("PARAMETERSWEEP_UPDATE", self)
         dispatch.CENTRAL_DISPATCH.register("HILBERTSPACE_UPDATE", self)
@@ -194,16 +362,44 @@ class ParameterSweep(
         """Top-level method for generating all parameter sweep data"""
         self.cause_dispatch()  # generate one dispatch before temporarily disabling CENTRAL_DISPATCH
         settings.DISPATCH_ENABLED = False
-        bare_specdata_list = self._compute_bare_specdata_sweep()
-        dressed_specdata = self._compute_dressed_specdata_sweep(bare_specdata_list)
-        self._lookup = spec_lookup.SpectrumLookup(
-            self, dressed_specdata, bare_specdata_list
-        )
-        settings.DISPATCH_ENABLED = True
+        try:
+            if self.checkpoint_file is not None:
+                self._lookup = self._run_streaming(self.checkpoint_file)
+            elif self.refine_tol is not None:
+                self._lookup = self._run_adaptive()
+            else:
+                bare_specdata_list = self._compute_bare_specdata_sweep()
+                dressed_specdata = self._compute_dressed_specdata_sweep(
+                    bare_specdata_list
+                )
+                self._lookup = spec_lookup.SpectrumLookup(
+                    self, dressed_specdata, bare_specdata_list
+                )
+        finally:
+            settings.DISPATCH_ENABLED = True
 
     # HilbertSpace: methods for CentralDispatch ----------------------------------------------------
     def cause_dispatch(self) -> None:
-        self.update_hilbertspace(self.param_vals[0])
+        self._update_hilbertspace_at(self._param_point(0))
+
+    def _param_point(self, param_index: int) -> Any:
+        """Returns the parameter value with position index `param_index`; for grid
+        sweeps, the tuple of parameter values of the grid point."""
+        if isinstance(self.param_name, list):
+            grid_index = np.unravel_index(param_index, self.grid_shape)
+            return tuple(
+                axis_vals[index]
+                for axis_vals, index in zip(self.param_vals, grid_index)
+            )
+        return self.param_vals[param_index]
+
+    def _update_hilbertspace_at(self, param_point: Any) -> None:
+        """Updates the Hilbert space to the parameter value (grid sweeps: tuple of
+        parameter values) `param_point`."""
+        if isinstance(self.param_name, list):
+            self.update_hilbertspace(*param_point)
+        else:
+            self.update_hilbertspace(param_point)
 
     def receive(self, event: str, sender: object, **kwargs) -> None:
         """Hook to CENTRAL_DISPATCH. This method is accessed by the global CentralDispatch instance whenever an event
@@ -249,15 +445,30 @@ class ParameterSweep(
         new_storedsweep._lookup = lookup
         return new_storedsweep
 
-    def serialize(self) -> "IOData":
+    def serialize(self, lookup: SpectrumLookup = None) -> "IOData":
         """
         Convert the content of the current class instance into IOData format.
 
+        Parameters
+        ----------
+        lookup:
+            lookup data to be stored instead of the lookup generated by the sweep;
+            for a sweep streamed to a checkpoint file, the lookup is read from that
+            file, including all eigenstates
+
         Returns
         -------
         IOData
         """
-        if self._lookup is None:
+        if (
+            lookup is None
+            and self.checkpoint_file is not None
+            and self._lookup is not None
+        ):
+            lookup = io.read(self.checkpoint_file)._lookup
+        if lookup is None:
+            lookup = self._lookup
+        if lookup is None:
             raise ValueError("Nothing to save - no lookup data has been generated yet.")
 
         initdata = {
@@ -265,7 +476,7 @@ class ParameterSweep(
             "param_vals": self.param_vals,
             "evals_count": self.evals_count,
             "hilbertspace": self._hilbertspace,
-            "_lookup": self._lookup,
+            "_lookup": lookup,
         }
         iodata = serializers.dict_serialize(initdata)
         iodata.typename = "StoredSweep"
@@ -279,20 +490,24 @@ class ParameterSweep(
         bare_eigendata_constant = [
             self._compute_bare_spectrum_constant()
         ] * self.param_count
-        target_map = cpu_switch.get_map_method(self.num_cpus)
         with utils.InfoBar(
             "Parallel compute bare eigensys [num_cpus={}]".format(self.num_cpus),
             self.num_cpus,
         ):
             bare_eigendata_varying = list(
-                target_map(
-                    self._compute_bare_spectrum_varying,
-                    tqdm(
-                        self.param_vals,
-                        desc="Bare spectra",
-                        leave=False,
-                        disable=self.tqdm_disabled,
+                tqdm(
+                    cpu_switch.imap_ordered(
+                        self._compute_bare_spectrum_varying,
+                        [
+                            self._param_point(param_index)
+                            for param_index in range(self.param_count)
+                        ],
+                        self.num_cpus,
                     ),
+                    total=self.param_count,
+                    desc="Bare spectra",
+                    leave=False,
+                    disable=self.tqdm_disabled,
                 )
             )
         bare_specdata_list = self._recast_bare_eigendata(
@@ -308,33 +523,401 @@ class ParameterSweep(
         """
         Calculates and returns all dressed spectral data.
         """
-        self._bare_hamiltonian_constant = self._compute_bare_hamiltonian_constant(
-            bare_specdata_list
-        )
+        self._compute_hamiltonian_constant(bare_specdata_list)
         param_indices = range(self.param_count)
         func = functools.partial(
             self._compute_dressed_eigensystem, bare_specdata_list=bare_specdata_list
         )
-        target_map = cpu_switch.get_map_method(self.num_cpus)
-
         with utils.InfoBar(
             "Parallel compute dressed eigensys [num_cpus={}]".format(self.num_cpus),
             self.num_cpus,
         ):
             dressed_eigendata = list(
-                target_map(
-                    func,
+                tqdm(
+                    cpu_switch.imap_ordered(func, param_indices, self.num_cpus),
+                    total=self.param_count,
+                    desc="Dressed spectrum",
+                    leave=False,
+                    disable=self.tqdm_disabled,
+                )
+            )
+        dressed_specdata = self._recast_dressed_eigendata(dressed_eigendata)
+        del dressed_eigendata
+        return dressed_specdata
+
+    def _compute_hamiltonian_constant(
+        self, bare_specdata_list: List[Optional[SpectrumData]]
+    ) -> None:
+        """Precomputes the parameter-independent part of the dressed Hamiltonian
+        (not needed in matrix-free mode). Only entries of `bare_specdata_list`
+        belonging to static subsystems are accessed."""
+        if self._hilbertspace._matrix_free():
+            return
+        (
+            interaction_hamiltonian_constant,
+            self._interaction_ops_constant,
+        ) = self._compute_interaction_constant(bare_specdata_list)
+        self._hamiltonian_constant = (
+            self._compute_bare_hamiltonian_constant(bare_specdata_list)
+            + interaction_hamiltonian_constant
+        )
+
+    # ParameterSweep: adaptive refinement ------------------------------------------------------------------
+    def _run_adaptive(self) -> SpectrumLookup:
+        """
+        Runs the sweep with adaptive refinement of the parameter grid, based on the
+        dressed energies. Refinement always starts from the coarse grid given by the
+        user, unless `param_vals` has been set to a new grid since the last run. Upon
+        completion, `param_vals` holds the refined grid, and the lookup is generated
+        from the data of all computed parameter values.
+        """
+        if self.param_vals is not self._refined_param_vals:
+            self._coarse_param_vals = self.param_vals
+        bare_eigendata_constant = self._compute_bare_spectrum_constant()
+        self._compute_hamiltonian_constant(
+            self._point_specdata_list(bare_eigendata_constant)
+        )
+        func = functools.partial(
+            self._compute_point_eigendata,
+            bare_eigendata_constant=bare_eigendata_constant,
+        )
+
+        def compute_points(param_vals: ndarray) -> List[Any]:
+            with utils.InfoBar(
+                "Parallel compute sweep [num_cpus={}]".format(self.num_cpus),
+                self.num_cpus,
+            ):
+                return list(
                     tqdm(
-                        param_indices,
-                        desc="Dressed spectrum",
+                        cpu_switch.imap_ordered(func, param_vals, self.num_cpus),
+                        total=len(param_vals),
+                        desc="Sweep",
                         leave=False,
                         disable=self.tqdm_disabled,
+                    )
+                )
+
+        param_vals, point_data = spec_utils.refine_sweep(
+            compute_points,
+            lambda point: np.real_if_close(point[1]),
+            self._coarse_param_vals,
+            self.refine_tol,
+            self.max_points,
+        )
+        self._refined_param_vals = param_vals
+        self.param_vals = param_vals
+        self.param_count = len(param_vals)
+        bare_specdata_list = self._recast_bare_eigendata(
+            [bare_eigendata_constant] * self.param_count,
+            [bare_eigendata for bare_eigendata, _, _ in point_data],
+        )
+        dressed_specdata = self._recast_dressed_eigendata(
+            [(evals, evecs) for _, evals, evecs in point_data]
+        )
+        return spec_lookup.SpectrumLookup(self, dressed_specdata, bare_specdata_list)
+
+    # ParameterSweep: streaming to h5 file ------------------------------------------------------------------
+    def _run_streaming(self, filename: str) -> SpectrumLookup:
+        """
+        Runs the sweep point by point, writing bare and dressed eigendata as well as
+        the lookup mapping for each parameter value to the h5 file `filename` as soon
+        as it is available. Parameter values already completed in an existing file
+        are skipped. Returns a lookup backed by the completed file, see
+        `_streamed_lookup`.
+        """
+        bare_eigendata_constant = self._compute_bare_spectrum_constant()
+        if not os.path.isfile(filename):
+            self._create_checkpoint(filename, bare_eigendata_constant)
+        self._compute_hamiltonian_constant(
+            self._point_specdata_list(bare_eigendata_constant)
+        )
+
+        with h5py.File(filename, "r") as h5file:
+            self._check_checkpoint(h5file, filename)
+            pending_indices = np.flatnonzero(~h5file["completed"][:])
+        func = functools.partial(
+            self._compute_sweep_point,
+            bare_eigendata_constant=bare_eigendata_constant,
+        )
+        with utils.InfoBar(
+            "Parallel compute sweep [num_cpus={}]".format(self.num_cpus),
+            self.num_cpus,
+        ):
+            for param_index, point_data in zip(
+                pending_indices,
+                tqdm(
+                    cpu_switch.imap_ordered(func, pending_indices, self.num_cpus),
+                    total=len(pending_indices),
+                    desc="Sweep",
+                    leave=False,
+                    disable=self.tqdm_disabled,
+                ),
+            ):
+                # The file is only open while a point is written: worker processes
+                # started during the sweep would otherwise inherit the open file
+                # handle, and with it the file lock.
+                with h5py.File(filename, "r+") as h5file:
+                    self._write_sweep_point(h5file, param_index, *point_data)
+                    h5file["completed"][param_index] = True
+
+        return self._streamed_lookup(filename)
+
+    def _streamed_lookup(self, filename: str) -> SpectrumLookup:
+        """
+        Returns the lookup for the sweep streamed to the h5 file `filename`. Energies
+        and dressed indices are read into memory, whereas eigenstates remain in the
+        file and are read for one parameter value at a time, upon access.
+        """
+        with h5py.File(filename, "r") as h5file:
+            bare_energy_tables = [
+                h5file[_H5_BARE_SPECDATA.format(subsys_index) + "energy_table"][:]
+                for subsys_index in range(self.subsystem_count)
+            ]
+            dressed_energy_table = h5file[_H5_DRESSED_SPECDATA + "energy_table"][:]
+            dressed_indices = h5file[_H5_LOOKUP + "_dressed_indices"][:]
+
+        bare_specdata_list = [
+            storage.SpectrumData(
+                energy_table,
+                system_params={},
+                param_name=self.param_name,
+                param_vals=self.param_vals,
+                state_table=_H5StateTable(
+                    filename,
+                    _H5_BARE_SPECDATA.format(subsys_index) + "state_table",
+                    self.param_count,
+                ),
+            )
+            for subsys_index, energy_table in enumerate(bare_energy_tables)
+        ]
+        dressed_specdata = storage.SpectrumData(
+            dressed_energy_table,
+            system_params={},
+            param_name=self.param_name,
+            param_vals=self.param_vals,
+            state_table=_H5StateTable(
+                filename,
+                _H5_DRESSED_STATES,
+                self.param_count,
+                subsystem_dims=self._hilbertspace.subsystem_dims,
+            ),
+        )
+        lookup = spec_lookup.SpectrumLookup(
+            self, dressed_specdata, bare_specdata_list, auto_run=False
+        )
+        lookup._canonical_bare_labels = lookup._generate_bare_labels()
+        lookup._dressed_indices = dressed_indices.astype(np.int_)
+        return lookup
+
+    def _compute_sweep_point(
+        self,
+        param_index: int,
+        bare_eigendata_constant: List[Optional[Tuple[ndarray, ndarray]]],
+    ) -> Tuple[List[Tuple[ndarray, ndarray]], ndarray, ndarray, ndarray]:
+        """
+        Computes all data for a single parameter value. Formulated to be used with
+        Pool.map()
+
+        Returns
+        -------
+            bare eigendata for each subsystem, dressed eigenvalues, dressed
+            eigenvectors as rows of an array, and dressed indices for the lookup
+        """
+        bare_eigendata, evals, evecs = self._compute_point_eigendata(
+            self._param_point(param_index), bare_eigendata_constant
+        )
+        evecs = spec_utils.convert_esys_to_ndarray(evecs)
+        dressed_indices = spec_lookup.dressed_indices_from_overlaps(
+            np.abs(evecs)[np.newaxis], assignment=settings.LOOKUP_ASSIGNMENT
+        )[0]
+        return bare_eigendata, np.real_if_close(evals), evecs, dressed_indices
+
+    def _compute_point_eigendata(
+        self,
+        param_val: Any,
+        bare_eigendata_constant: List[Optional[Tuple[ndarray, ndarray]]],
+    ) -> Tuple[List[Tuple[ndarray, ndarray]], ndarray, QutipEigenstates]:
+        """
+        Computes bare and dressed eigendata for a single parameter value, given the
+        eigendata of the static subsystems. Requires the parameter-independent part
+        of the dressed Hamiltonian to be precomputed. Formulated to be used with
+        Pool.map()
+
+        Returns
+        -------
+            bare eigendata for each subsystem, dressed eigenvalues and eigenstates
+        """
+        bare_eigendata_varying = self._compute_bare_spectrum_varying(param_val)
+        bare_eigendata = [
+            constant if varying is None else varying
+            for constant, varying in zip(
+                bare_eigendata_constant, bare_eigendata_varying
+            )
+        ]
+        evals, evecs = self._compute_dressed_eigensystem(
+            0, self._point_specdata_list(bare_eigendata)
+        )
+        return bare_eigendata, evals, evecs
+
+    @staticmethod
+    def _point_specdata_list(
+        bare_eigendata: List[Optional[Tuple[ndarray, ndarray]]]
+    ) -> List[Optional[SpectrumData]]:
+        """Wraps bare eigendata for a single parameter value (None for subsystems
+        without data) into single-row SpectrumData objects."""
+        return [
+            None
+            if eigendata is None
+            else storage.SpectrumData(
+                eigendata[0][np.newaxis], {}, state_table=eigendata[1][np.newaxis]
+            )
+            for eigendata in bare_eigendata
+        ]
+
+    def _create_checkpoint(
+        self,
+        filename: str,
+        bare_eigendata_constant: List[Optional[Tuple[ndarray, ndarray]]],
+    ) -> None:
+        """
+        Creates the h5 file for a streamed sweep. The file has the same layout as one
+        written by `filewrite`; per-point data sets are allocated at full size (chunked
+        by parameter value, initialized to NaN energies and unassigned dressed
+        indices) without being held in memory. A data set `completed` marks the
+        parameter values computed so far, and the attribute `checkpoint_fingerprint`
+        identifies the sweep that the file belongs to.
+        """
+        bare_specdata_list = []
+        for subsys in self._hilbertspace:
+            evals_count = subsys.truncated_dim
+            bare_specdata_list.append(
+                storage.SpectrumData(
+                    np.empty((1, evals_count)),
+                    system_params={},
+                    param_name=self.param_name,
+                    param_vals=self.param_vals,
+                    state_table=np.empty(
+                        (1, subsys.hilbertdim(), evals_count), dtype=subsys._evec_dtype
                     ),
                 )
             )
-        dressed_specdata = self._recast_dressed_eigendata(dressed_eigendata)
-        del dressed_eigendata
-        return dressed_specdata
+        dimension = self._hilbertspace.dimension
+        placeholder_evecs = spec_utils.convert_ndarray_to_esys(
+            np.zeros((dimension, self.evals_count), dtype=np.complex_),
+            self._hilbertspace.subsystem_dims,
+        ).view(qutip_serializer.QutipEigenstates)
+        dressed_specdata = storage.SpectrumData(
+            np.empty((1, self.evals_count)),
+            system_params={},
+            param_name=self.param_name,
+            param_vals=self.param_vals,
+            state_table=[placeholder_evecs] * self.param_count,
+        )
+        lookup = spec_lookup.SpectrumLookup(
+            self, dressed_specdata, bare_specdata_list, auto_run=False
+        )
+        lookup._canonical_bare_labels = lookup._generate_bare_labels()
+        lookup._dressed_indices = np.empty((1, dimension), dtype=np.int_)
+
+        iodata = self.serialize(lookup=lookup)
+        iodata.ndarrays["completed"] = np.zeros(self.param_count, dtype=np.bool_)
+        iodata.attributes["checkpoint_fingerprint"] = self._checkpoint_fingerprint()
+        io_backends.H5Writer(filename).to_file(iodata)
+
+        with h5py.File(filename, "r+") as h5file:
+            for subsys_index in range(self.subsystem_count):
+                group = h5file[_H5_BARE_SPECDATA.format(subsys_index)]
+                self._allocate_dataset(group, "energy_table", np.nan)
+                self._allocate_dataset(group, "state_table", 0)
+            self._allocate_dataset(h5file[_H5_DRESSED_SPECDATA], "energy_table", np.nan)
+            self._allocate_dataset(h5file[_H5_LOOKUP], "_dressed_indices", -1)
+
+    def _allocate_dataset(
+        self, h5group: h5py.Group, name: str, fillvalue: Union[float, int]
+    ) -> None:
+        """Replaces the single-row data set `name` by a data set with one row per
+        parameter value, chunked by rows and initialized to `fillvalue`."""
+        row_shape = h5group[name].shape[1:]
+        dtype = h5group[name].dtype
+        del h5group[name]
+        h5group.create_dataset(
+            name,
+            shape=(self.param_count,) + row_shape,
+            dtype=dtype,
+            chunks=(1,) + row_shape,
+            compression="gzip",
+            fillvalue=fillvalue,
+        )
+
+    def _check_checkpoint(self, h5file: h5py.File, filename: str) -> None:
+        """Raises ValueError if the h5 file does not hold a streamed run of this
+        sweep, with identical HilbertSpace and sweep definition."""
+        if (
+            "completed" not in h5file
+            or h5file.attrs.get("checkpoint_fingerprint")
+            != self._checkpoint_fingerprint()
+            or h5file["completed"].shape != (self.param_count,)
+            or not (
+                isinstance(self.param_name, list)
+                or np.allclose(h5file["param_vals"][:], self.param_vals)
+            )
+            or h5file[_H5_DRESSED_SPECDATA + "energy_table"].shape
+            != (self.param_count, self.evals_count)
+            or h5file[_H5_LOOKUP + "_dressed_indices"].shape
+            != (self.param_count, self._hilbertspace.dimension)
+        ):
+            raise ValueError(
+                "File {} does not contain a checkpoint of this sweep.".format(filename)
+            )
+
+    def _checkpoint_fingerprint(self) -> str:
+        """Returns a hash of the HilbertSpace (subsystem parameters and interaction
+        terms) and of the sweep definition, identifying the sweep a checkpoint file
+        was written for."""
+        digest = hashlib.sha256()
+        update_hilbertspace = self.update_hilbertspace
+        _update_fingerprint(
+            digest,
+            [
+                self.param_name,
+                self.param_vals,
+                self.evals_count,
+                [self.get_subsys_index(subsys) for subsys in self.subsys_update_list],
+                getattr(update_hilbertspace, "__qualname__", None),
+                getattr(update_hilbertspace, "__code__", None),
+            ],
+        )
+        for subsys in self._hilbertspace:
+            _update_fingerprint(digest, [type(subsys).__name__, subsys.get_initdata()])
+        for interaction_term in self._hilbertspace.interaction_list:
+            term_data = {}
+            for name in interaction_term._init_params:
+                value = getattr(interaction_term, name)
+                if isinstance(value, (QubitBaseClass, Oscillator)):
+                    value = self.get_subsys_index(value)
+                term_data[name] = value
+            _update_fingerprint(digest, [type(interaction_term).__name__, term_data])
+        return digest.hexdigest()
+
+    @staticmethod
+    def _write_sweep_point(
+        h5file: h5py.File,
+        param_index: int,
+        bare_eigendata: List[Tuple[ndarray, ndarray]],
+        dressed_evals: ndarray,
+        dressed_evecs: ndarray,
+        dressed_indices: ndarray,
+    ) -> None:
+        """Writes the data for a single parameter value to the h5 file."""
+        for subsys_index, (evals, evecs) in enumerate(bare_eigendata):
+            group = h5file[_H5_BARE_SPECDATA.format(subsys_index)]
+            group["energy_table"][param_index] = evals
+            group["state_table"][param_index] = evecs
+        h5file[_H5_DRESSED_SPECDATA + "energy_table"][param_index] = dressed_evals
+        h5file[_H5_DRESSED_STATES.format(param_index)][...] = dressed_evecs[
+            :, :, np.newaxis
+        ]
+        h5file[_H5_LOOKUP + "_dressed_indices"][param_index] = dressed_indices
 
     def _recast_bare_eigendata(
         self,
@@ -391,22 +974,25 @@ class ParameterSweep(
 
     def _compute_bare_hamiltonian_constant(
         self, bare_specdata_list: List[SpectrumData]
-    ) -> Qobj:
+    ) -> csr_matrix:
         """
         Returns
         -------
             composite Hamiltonian composed of bare Hamiltonians of subsys_list independent of the external parameter
         """
-        static_hamiltonian = 0
+        dimension = self._hilbertspace.dimension
+        static_hamiltonian = sparse.csr_matrix((dimension, dimension))
         for index, subsys in enumerate(self._hilbertspace):
             if subsys not in self.subsys_update_list:
                 evals = bare_specdata_list[index].energy_table[0]
-                static_hamiltonian += self._hilbertspace.diag_hamiltonian(subsys, evals)
+                static_hamiltonian += self._hilbertspace._diag_hamiltonian_csr(
+                    subsys, evals
+                )
         return static_hamiltonian
 
     def _compute_bare_hamiltonian_varying(
         self, bare_specdata_list: List[SpectrumData], param_index: int
-    ) -> Qobj:
+    ) -> csr_matrix:
         """
         Parameters
         ----------
@@ -417,13 +1003,60 @@ class ParameterSweep(
         -------
             composite Hamiltonian consisting of all bare Hamiltonians which depend on the external parameter
         """
-        hamiltonian = 0
+        dimension = self._hilbertspace.dimension
+        hamiltonian = sparse.csr_matrix((dimension, dimension))
         for index, subsys in enumerate(self._hilbertspace):
             if subsys in self.subsys_update_list:
                 evals = bare_specdata_list[index].energy_table[param_index]
-                hamiltonian += self._hilbertspace.diag_hamiltonian(subsys, evals)
+                hamiltonian += self._hilbertspace._diag_hamiltonian_csr(subsys, evals)
         return hamiltonian
 
+    def _compute_interaction_constant(
+        self, bare_specdata_list: List[SpectrumData]
+    ) -> Tuple[csr_matrix, Dict[int, List[Optional[csr_matrix]]]]:
+        """
+        Precomputes the parts of the interaction Hamiltonian that are independent of
+        the external parameter. Terms coupling two static subsystems are summed up
+        completely. For all other terms, the identity-wrapped operators of static
+        subsystems are computed once; operators of parameter-dependent subsystems
+        are marked by None.
+
+        Returns
+        -------
+            interaction Hamiltonian of all static terms, and dict mapping the index of
+            each remaining term to the list of its two (precomputed or None)
+            identity-wrapped operators
+        """
+        dimension = self._hilbertspace.dimension
+        static_hamiltonian = sparse.csr_matrix(
+            (dimension, dimension), dtype=np.complex_
+        )
+        interaction_ops = {}
+        for term_index, term in enumerate(self._hilbertspace.interaction_list):
+            wrapped_ops = []
+            for operator, subsys in [
+                (term.op1, term.subsys1),
+                (term.op2, term.subsys2),
+            ]:
+                if subsys in self.subsys_update_list:
+                    wrapped_ops.append(None)
+                    continue
+                evecs = self._lookup_bare_eigenstates(0, subsys, bare_specdata_list)
+                wrapped_ops.append(
+                    self._hilbertspace._identity_wrap_csr(operator, subsys, evecs=evecs)
+                )
+            if any(wrapped_op is None for wrapped_op in wrapped_ops):
+                interaction_ops[term_index] = wrapped_ops
+            else:
+                static_hamiltonian += (
+                    self._hilbertspace._interactionterm_hamiltonian_csr(
+                        term,
+                        interaction_op1=wrapped_ops[0],
+                        interaction_op2=wrapped_ops[1],
+                    )
+                )
+        return static_hamiltonian, interaction_ops
+
     def _compute_bare_spectrum_constant(self) -> List[Tuple[ndarray, ndarray]]:
         """
         Returns
@@ -440,7 +1073,7 @@ class ParameterSweep(
         return eigendata
 
     def _compute_bare_spectrum_varying(
-        self, param_val: float
+        self, param_val: Any
     ) -> List[Tuple[ndarray, ndarray]]:
         """
         For given external parameter value obtain the bare eigenspectra of each bare subsystem that is affected by
@@ -451,7 +1084,7 @@ class ParameterSweep(
             (evals, evecs) bare eigendata for each subsystem that is parameter-dependent
         """
         eigendata = []
-        self.update_hilbertspace(param_val)
+        self._update_hilbertspace_at(param_val)
         for subsys in self._hilbertspace:
             if subsys in self.subsys_update_list:
                 evals_count = subsys.truncated_dim
@@ -466,24 +1099,60 @@ class ParameterSweep(
     def _compute_dressed_eigensystem(
         self, param_index: int, bare_specdata_list: List[SpectrumData]
     ) -> Tuple[ndarray, QutipEigenstates]:
+        if self._hilbertspace._matrix_free():
+            hamiltonian = self._dressed_hamiltonian_operator(
+                param_index, bare_specdata_list
+            )
+        else:
+            hamiltonian = self._dressed_hamiltonian_csr(param_index, bare_specdata_list)
+        evals, evecs = spec_utils.lowest_eigsh(hamiltonian, self.evals_count)
+        evecs = spec_utils.convert_ndarray_to_esys(
+            evecs, self._hilbertspace.subsystem_dims
+        )
+        evecs = evecs.view(qutip_serializer.QutipEigenstates)
+        return evals, evecs
+
+    def _dressed_hamiltonian_operator(
+        self, param_index: int, bare_specdata_list: List[SpectrumData]
+    ) -> hspace.CompositeHamiltonianOperator:
+        """Returns the dressed Hamiltonian at the given parameter index in matrix-free
+        form."""
+        bare_evals = [
+            specdata.energy_table[param_index] for specdata in bare_specdata_list
+        ]
+        bare_evecs = [
+            self._lookup_bare_eigenstates(param_index, subsys, bare_specdata_list)
+            for subsys in self._hilbertspace
+        ]
+        return self._hilbertspace._hamiltonian_linear_operator(bare_evals, bare_evecs)
+
+    def _dressed_hamiltonian_csr(
+        self, param_index: int, bare_specdata_list: List[SpectrumData]
+    ) -> csr_matrix:
+        """Returns the dressed Hamiltonian at the given parameter index as a sparse
+        matrix, reusing the precomputed parameter-independent parts."""
         hamiltonian = (
-            self._bare_hamiltonian_constant
+            self._hamiltonian_constant
             + self._compute_bare_hamiltonian_varying(bare_specdata_list, param_index)
         )
 
-        for interaction_term in self._hilbertspace.interaction_list:
+        interaction_list = self._hilbertspace.interaction_list
+        for term_index, wrapped_ops in self._interaction_ops_constant.items():
+            interaction_term = interaction_list[term_index]
             evecs1 = self._lookup_bare_eigenstates(
                 param_index, interaction_term.subsys1, bare_specdata_list
             )
             evecs2 = self._lookup_bare_eigenstates(
                 param_index, interaction_term.subsys2, bare_specdata_list
             )
-            hamiltonian += self._hilbertspace.interactionterm_hamiltonian(
-                interaction_term, evecs1=evecs1, evecs2=evecs2
+            hamiltonian += self._hilbertspace._interactionterm_hamiltonian_csr(
+                interaction_term,
+                evecs1=evecs1,
+                evecs2=evecs2,
+                interaction_op1=wrapped_ops[0],
+                interaction_op2=wrapped_ops[1],
             )
-        evals, evecs = hamiltonian.eigenstates(eigvals=self.evals_count)
-        evecs = evecs.view(qutip_serializer.QutipEigenstates)
-        return evals, evecs
+        return hamiltonian
 
     def _lookup_bare_eigenstates(
         self,
@@ -521,18 +1190,28 @@ class StoredSweep(
 
     def __init__(
         self,
-        param_name: str,
-        param_vals: ndarray,
+        param_name: Union[str, List[str]],
+        param_vals: Union[ndarray, List[ndarray]],
         evals_count: int,
         hilbertspace: HilbertSpace,
         dressed_specdata: SpectrumData,
         bare_specdata_list: List[SpectrumData],
+        completed: ndarray = None,
+        checkpoint_fingerprint: str = None,
     ) -> None:
         self.param_name = param_name
         self.param_vals = param_vals
-        self.param_count = len(param_vals)
+        self.param_count = _param_count(param_name, param_vals)
         self.evals_count = evals_count
         self._hilbertspace = hilbertspace
+        # for sweeps streamed to file, marks the parameter values computed so far
+        self.completed = (
+            np.ones(self.param_count, dtype=np.bool_)
+            if completed is None
+            else completed
+        )
+        # identifies the HilbertSpace and sweep definition of a streamed sweep
+        self.checkpoint_fingerprint = checkpoint_fingerprint
         self._lookup = spec_lookup.SpectrumLookup(
             hilbertspace, dressed_specdata, bare_specdata_list, auto_run=False
         )
@@ -14,9 +14,11 @@ Provides the base classes for qubits
 
 import functools
 import inspect
+import weakref
 
 from abc import ABC, ABCMeta, abstractmethod
-from typing import Any, Dict, Iterable, List, Tuple, Union
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -34,15 +36,27 @@ import scqubits.utils.plotting as plot
 
 from scqubits.core.central_dispatch import DispatchClient
 from scqubits.core.discretization import Grid1d
+from scqubits.core.param_hamiltonian import ParametricHamiltonian
 from scqubits.core.storage import DataStore, SpectrumData
 from scqubits.settings import IN_IPYTHON
-from scqubits.utils.cpu_switch import get_map_method
-from scqubits.utils.misc import InfoBar, drop_private_keys, process_which
+from scqubits.utils.cpu_switch import imap_ordered
+from scqubits.utils.misc import (
+    InfoBar,
+    drop_private_keys,
+    grid_traversal,
+    process_which,
+)
 from scqubits.utils.plot_defaults import set_wavefunction_scaling
 from scqubits.utils.spectrum_utils import (
+    batched_eigh,
+    continued_eigsh,
+    energy_curvatures,
     get_matrixelement_table,
+    get_matrixelement_table_stack,
+    hermite_interpolation,
     order_eigensystem,
     recast_esys_mapdata,
+    refine_sweep,
     standardize_sign,
 )
 
@@ -51,6 +65,63 @@ if IN_IPYTHON:
 else:
     from tqdm import tqdm
 
+# relative step for finite-difference derivatives of the Hamiltonian
+_DERIVATIVE_STEP = 1e-4
+# cached Hamiltonian decompositions, per qubit instance and parameter name
+_DECOMPOSITION_CACHE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+# memoized operators, per qubit instance (see `cached_operator`)
+_OPERATOR_CACHE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+# memoized eigensystems, shared by all qubit instances in least-recently-used order,
+# and the cache keys associated with each qubit instance
+_ESYS_CACHE: "OrderedDict" = OrderedDict()
+_ESYS_CACHE_KEYS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def cached_operator(method: Callable) -> Callable:
+    """Decorator for operator methods of qubit classes. Return values are memoized
+    per instance (and per set of arguments) in a least-recently-used cache holding
+    up to `settings.OPERATOR_CACHE_SIZE` operators. The cache of an instance is
+    cleared whenever the instance broadcasts a `QUANTUMSYSTEM_UPDATE` or
+    `GRID_UPDATE` event. Cached operators are shared by all callers: dense
+    operators are returned as read-only arrays, and sparse operators, for which
+    scipy.sparse offers no read-only flag, must not be modified in place."""
+
+    @functools.wraps(method)
+    def wrapper(self: "QubitBaseClass", *args, **kwargs):
+        if not settings.OPERATOR_CACHE_SIZE:
+            return method(self, *args, **kwargs)
+        key = (
+            method.__qualname__,
+            args,
+            tuple(sorted(kwargs.items())),
+            self._operator_cache_key(),
+        )
+        try:
+            hash(key)
+        except TypeError:  # unhashable arguments, such as arrays: do not cache
+            return method(self, *args, **kwargs)
+
+        cache = _OPERATOR_CACHE.setdefault(self, OrderedDict())
+        if key in cache:
+            cache.move_to_end(key)
+            operator = cache[key]
+        else:
+            operator = method(self, *args, **kwargs)
+            if isinstance(operator, ndarray):
+                operator.setflags(write=False)
+            cache[key] = operator
+            while len(cache) > settings.OPERATOR_CACHE_SIZE:
+                cache.popitem(last=False)
+        return operator
+
+    if method.__doc__:
+        wrapper.__doc__ = method.__doc__.rstrip() + (
+            "\n\n        If `settings.OPERATOR_CACHE_SIZE` is nonzero, the operator is"
+            " memoized and\n        shared: use `.copy()` before modifying it in"
+            " place.\n        "
+        )
+    return wrapper
+
 
 # —Generic quantum system container and Qubit base class——————————————————————————————
 
@@ -86,7 +157,7 @@ class QuantumSystem(DispatchClient, ABC):
 
     def __init_subclass__(cls):
         """Used to register all non-abstract subclasses as a list in
-        `QuantumSystem.subclasses`. """
+        `QuantumSystem.subclasses`."""
         super().__init_subclass__()
         if not inspect.isabstract(cls):
             cls.subclasses.append(cls)
@@ -123,7 +194,7 @@ class QuantumSystem(DispatchClient, ABC):
 
     def get_initdata(self) -> Dict[str, Any]:
         """Returns dict appropriate for creating/initializing a new Serializable
-        object. """
+        object."""
         return {name: getattr(self, name) for name in self._init_params}
 
     @abstractmethod
@@ -149,7 +220,7 @@ class QuantumSystem(DispatchClient, ABC):
     @abstractmethod
     def default_params():
         """Return dictionary with default parameter values for initialization of
-        class instance """
+        class instance"""
 
     def set_params(self, **kwargs):
         """
@@ -180,26 +251,195 @@ class QubitBaseClass(QuantumSystem, ABC):
     _evec_dtype: type
     _sys_type: str
     _init_params: list
+    # Parameters entering the Hamiltonian only through a few scalar functions, such
+    # that H(p) = H_0 + sum_k f_k(p) H_k. Maps parameter names to the functions f_k
+    # and to the parameter values at which H(p) is sampled to extract the H_k.
+    _parametric_terms: Dict[str, Tuple[List[Callable], Tuple[float, ...]]] = {}
+    # state of an ongoing parameter sweep (swept parameter, continuation data for
+    # warm-starting sparse eigensolvers); only set for the duration of a sweep
+    _sweep: Union[Dict[str, Any], None] = None
 
     @abstractmethod
     def hamiltonian(self):
         """Returns the Hamiltonian"""
 
+    def broadcast(self, event: str, **kwargs) -> None:
+        if event in ["QUANTUMSYSTEM_UPDATE", "GRID_UPDATE"]:
+            self.clear_operator_cache()
+            self.clear_eigensystem_cache()
+        super().broadcast(event, **kwargs)
+
+    def clear_operator_cache(self) -> None:
+        """Discards all operators memoized for this instance."""
+        _OPERATOR_CACHE.pop(self, None)
+
+    def clear_eigensystem_cache(self) -> None:
+        """Discards all eigensystems cached for this instance."""
+        for key in _ESYS_CACHE_KEYS.pop(self, ()):
+            _ESYS_CACHE.pop(key, None)
+
+    def _cached_eigensystem(
+        self, evals_count: int, eigenvectors: bool
+    ) -> Union[ndarray, Tuple[ndarray, ndarray], None]:
+        """Returns copies of cached eigenvalues (and eigenvectors, if requested) for
+        the present parameters, or None if no cached result with at least
+        `evals_count` levels is available."""
+        if not settings.CACHE_EIGENSYSTEMS:
+            return None
+        fingerprint = repr(self.get_initdata())
+        kinds = ["esys"] if eigenvectors else ["esys", "evals"]
+        for kind in kinds:
+            key = (type(self), kind, fingerprint)
+            if key in _ESYS_CACHE and len(_ESYS_CACHE[key][0]) >= evals_count:
+                _ESYS_CACHE.move_to_end(key)
+                evals, evecs = _ESYS_CACHE[key]
+                if eigenvectors:
+                    return evals[:evals_count].copy(), evecs[:, :evals_count].copy()
+                return evals[:evals_count].copy()
+        return None
+
+    def _cache_eigensystem(self, evals: ndarray, evecs: ndarray = None) -> None:
+        """Caches eigenvalues (and eigenvectors) for the present parameters, evicting
+        least recently used entries beyond `settings.ESYS_CACHE_MEMORY_LIMIT`."""
+        if not settings.CACHE_EIGENSYSTEMS:
+            return
+        kind = "evals" if evecs is None else "esys"
+        key = (type(self), kind, repr(self.get_initdata()))
+        _ESYS_CACHE[key] = (evals.copy(), None if evecs is None else evecs.copy())
+        _ESYS_CACHE.move_to_end(key)
+        _ESYS_CACHE_KEYS.setdefault(self, set()).add(key)
+
+        def entry_nbytes(entry):
+            return sum(array.nbytes for array in entry if array is not None)
+
+        memory = sum(entry_nbytes(entry) for entry in _ESYS_CACHE.values())
+        while memory > settings.ESYS_CACHE_MEMORY_LIMIT:
+            _, entry = _ESYS_CACHE.popitem(last=False)
+            memory -= entry_nbytes(entry)
+
+    def _operator_cache_key(self) -> Tuple:
+        """Returns the part of the operator cache key reflecting state that may
+        change without a broadcast from this instance (e.g., an inner grid)."""
+        return ()
+
+    def hamiltonian_decomposition(
+        self, param_name: str
+    ) -> Union[ParametricHamiltonian, None]:
+        """Returns the affine decomposition :math:`H(p) = H_0 + \\sum_k f_k(p) H_k`
+        of the Hamiltonian with respect to the parameter `param_name`, or None if no
+        such decomposition is available for this parameter. The decomposition is
+        cached, and recomputed only when any of the other parameters change.
+
+        Parameters
+        ----------
+        param_name:
+            name of the parameter p
+        """
+        if param_name not in self._parametric_terms:
+            return None
+        fingerprint = repr(
+            {
+                name: value
+                for name, value in self.get_initdata().items()
+                if name != param_name
+            }
+        )
+        cache = _DECOMPOSITION_CACHE.setdefault(self, {})
+        if param_name in cache and cache[param_name][0] == fingerprint:
+            return cache[param_name][1]
+
+        functions, sample_vals = self._parametric_terms[param_name]
+        previous_paramval = getattr(self, param_name)
+        previous_dispatch_status = settings.DISPATCH_ENABLED
+        settings.DISPATCH_ENABLED = False
+        try:
+            decomposition = ParametricHamiltonian.from_samples(
+                functools.partial(self._sampled_hamiltonian, param_name),
+                functions,
+                sample_vals,
+            )
+        finally:
+            setattr(self, param_name, previous_paramval)
+            settings.DISPATCH_ENABLED = previous_dispatch_status
+        cache[param_name] = (fingerprint, decomposition)
+        return decomposition
+
+    def _sampled_hamiltonian(self, param_name: str, paramval: float):
+        setattr(self, param_name, paramval)
+        return self.hamiltonian()
+
+    def _sweep_hamiltonian(self):
+        """Returns the Hamiltonian to be diagonalized. Within sweeps of a parameter
+        with affine decomposition, the Hamiltonian is assembled from the cached
+        terms rather than constructed from scratch."""
+        if self._sweep is not None:
+            param_name = self._sweep["param_name"]
+            decomposition = self.hamiltonian_decomposition(param_name)
+            if decomposition is not None:
+                return decomposition.evaluate(getattr(self, param_name))
+        return self.hamiltonian()
+
     def _evals_calc(self, evals_count: int) -> ndarray:
-        hamiltonian_mat = self.hamiltonian()
+        hamiltonian_mat = self._sweep_hamiltonian()
         evals = sp.linalg.eigh(
             hamiltonian_mat, eigvals_only=True, eigvals=(0, evals_count - 1)
         )
         return np.sort(evals)
 
     def _esys_calc(self, evals_count: int) -> Tuple[ndarray, ndarray]:
-        hamiltonian_mat = self.hamiltonian()
+        hamiltonian_mat = self._sweep_hamiltonian()
         evals, evecs = sp.linalg.eigh(
             hamiltonian_mat, eigvals_only=False, eigvals=(0, evals_count - 1)
         )
         evals, evecs = order_eigensystem(evals, evecs)
         return evals, evecs
 
+    def _sparse_eigsh(
+        self,
+        hamiltonian_mat: Union[ndarray, sp.sparse.spmatrix],
+        evals_count: int,
+        return_eigenvectors: bool,
+        v0: ndarray = None,
+    ) -> Union[ndarray, Tuple[ndarray, ndarray]]:
+        """Shift-invert `eigsh` for the lowest eigenvalues of a sparse Hamiltonian.
+        Within parameter sweeps run with `settings.SWEEP_CONTINUATION` enabled, each
+        call is warm-started from the eigensystem of the previous sweep point."""
+        if self._sweep is None or self._sweep["continuation"] is None:
+            return continued_eigsh(
+                hamiltonian_mat,
+                evals_count,
+                return_eigenvectors=return_eigenvectors,
+                v0=v0,
+            )
+        continuation = self._sweep["continuation"]
+        result = continued_eigsh(
+            hamiltonian_mat,
+            evals_count,
+            previous_evals=continuation["evals"],
+            previous_evecs=continuation["evecs"],
+            return_eigenvectors=return_eigenvectors,
+            v0=v0,
+            method=continuation["method"],
+        )
+        if return_eigenvectors:
+            continuation["evals"], continuation["evecs"] = result
+        else:
+            continuation["evals"] = result
+        return result
+
+    def _start_sweep(self, param_name: str) -> None:
+        continuation = None
+        if settings.SWEEP_CONTINUATION is not None:
+            continuation = {
+                "method": settings.SWEEP_CONTINUATION,
+                "evals": None,
+                "evecs": None,
+            }
+        self._sweep = {"param_name": param_name, "continuation": continuation}
+
+    def _stop_sweep(self) -> None:
+        self.__dict__.pop("_sweep", None)
+
     def eigenvals(
         self,
         evals_count: int = 6,
@@ -207,7 +447,7 @@ class QubitBaseClass(QuantumSystem, ABC):
         return_spectrumdata: bool = False,
     ) -> ndarray:
         """Calculates eigenvalues using `scipy.linalg.eigh`, returns numpy array of
-        eigenvalues.
+        eigenvalues. Results are memoized if `settings.CACHE_EIGENSYSTEMS` is set.
 
         Parameters
         ----------
@@ -224,7 +464,10 @@ class QubitBaseClass(QuantumSystem, ABC):
         -------
             eigenvalues as ndarray or in form of a SpectrumData object
         """
-        evals = self._evals_calc(evals_count)
+        evals = self._cached_eigensystem(evals_count, eigenvectors=False)
+        if evals is None:
+            evals = self._evals_calc(evals_count)
+            self._cache_eigensystem(evals)
         if filename or return_spectrumdata:
             specdata = SpectrumData(
                 energy_table=evals, system_params=self.get_initdata()
@@ -241,7 +484,8 @@ class QubitBaseClass(QuantumSystem, ABC):
     ) -> Tuple[ndarray, ndarray]:
         """Calculates eigenvalues and corresponding eigenvectors using
         `scipy.linalg.eigh`. Returns two numpy arrays containing the eigenvalues and
-        eigenvectors, respectively.
+        eigenvectors, respectively. Results are memoized if
+        `settings.CACHE_EIGENSYSTEMS` is set.
 
         Parameters
         ----------
@@ -258,7 +502,11 @@ class QubitBaseClass(QuantumSystem, ABC):
         -------
             eigenvalues, eigenvectors as numpy arrays or in form of a SpectrumData object
         """
-        evals, evecs = self._esys_calc(evals_count)
+        esys = self._cached_eigensystem(evals_count, eigenvectors=True)
+        if esys is None:
+            esys = self._esys_calc(evals_count)
+            self._cache_eigensystem(*esys)
+        evals, evecs = esys
         if filename or return_spectrumdata:
             specdata = SpectrumData(
                 energy_table=evals, system_params=self.get_initdata(), state_table=evecs
@@ -316,12 +564,196 @@ class QubitBaseClass(QuantumSystem, ABC):
         setattr(self, param_name, paramval)
         return self.eigensys(evals_count)
 
+    def _esys_matelem_for_paramval(
+        self, paramval: float, param_name: str, evals_count: int, operator: str
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        evals, evecs = self._esys_for_paramval(paramval, param_name, evals_count)
+        return evals, evecs, get_matrixelement_table(getattr(self, operator)(), evecs)
+
     def _evals_for_paramval(
         self, paramval: float, param_name: str, evals_count: int
     ) -> ndarray:
         setattr(self, param_name, paramval)
         return self.eigenvals(evals_count)
 
+    def _esys_for_gridpoint(
+        self,
+        gridpoint_vals: Tuple[float, ...],
+        param_names: List[str],
+        evals_count: int,
+    ) -> Tuple[ndarray, ndarray]:
+        for param_name, paramval in zip(param_names, gridpoint_vals):
+            setattr(self, param_name, paramval)
+        return self.eigensys(evals_count)
+
+    def _evals_for_gridpoint(
+        self,
+        gridpoint_vals: Tuple[float, ...],
+        param_names: List[str],
+        evals_count: int,
+    ) -> ndarray:
+        for param_name, paramval in zip(param_names, gridpoint_vals):
+            setattr(self, param_name, paramval)
+        return self.eigenvals(evals_count)
+
+    def _hamiltonian_derivatives(
+        self, param_name: str, second_order: bool
+    ) -> Tuple[Any, Any]:
+        """Returns the first and (if `second_order` is set, else None) second
+        derivative of the Hamiltonian with respect to `param_name` at its current
+        value. The derivatives are taken from the affine decomposition of the
+        Hamiltonian where available, and by central finite differences of the
+        Hamiltonian otherwise."""
+        paramval = getattr(self, param_name)
+        decomposition = self.hamiltonian_decomposition(param_name)
+        if decomposition is not None:
+            return (
+                decomposition.derivative(paramval),
+                decomposition.derivative(paramval, order=2) if second_order else None,
+            )
+        step = _DERIVATIVE_STEP * max(1.0, abs(paramval))
+        hamiltonian_plus = self._sampled_hamiltonian(param_name, paramval + step)
+        hamiltonian_minus = self._sampled_hamiltonian(param_name, paramval - step)
+        setattr(self, param_name, paramval)
+        first_derivative = (hamiltonian_plus - hamiltonian_minus) / (2.0 * step)
+        if not second_order:
+            return first_derivative, None
+        second_derivative = (
+            hamiltonian_plus - 2.0 * self.hamiltonian() + hamiltonian_minus
+        ) / step ** 2
+        return first_derivative, second_derivative
+
+    def _energy_derivatives_for_paramval(
+        self, paramval: float, param_name: str, evals_count: int, second_order: bool
+    ) -> List[ndarray]:
+        """Returns the eigenvalues and their first (and, if `second_order` is set,
+        second) derivatives with respect to `param_name`, by the Hellmann-Feynman
+        theorem and second-order perturbation theory."""
+        setattr(self, param_name, paramval)
+        first_derivative, second_derivative = self._hamiltonian_derivatives(
+            param_name, second_order
+        )
+        if not second_order:
+            evals, evecs = self.eigensys(evals_count)
+            slopes = np.real(np.sum(evecs.conj() * (first_derivative @ evecs), axis=0))
+            return [evals, slopes]
+
+        hamiltonian = self._sweep_hamiltonian()
+        if isinstance(hamiltonian, ndarray):
+            # dense Hamiltonian: the perturbative sum runs over all eigenstates
+            evals, evecs = self.eigensys(self.hilbertdim())
+            hamiltonian = None
+        else:
+            evals, evecs = self.eigensys(evals_count)
+        slopes = np.real(np.sum(evecs.conj() * (first_derivative @ evecs), axis=0))
+        curvatures = energy_curvatures(
+            evals, evecs, first_derivative, second_derivative, hamiltonian
+        )
+        return [
+            evals[:evals_count],
+            slopes[:evals_count],
+            curvatures[:evals_count],
+        ]
+
+    def _hamiltonian_for_paramval(self, paramval: float, param_name: str) -> ndarray:
+        setattr(self, param_name, paramval)
+        hamiltonian_mat = self.hamiltonian()
+        if not isinstance(hamiltonian_mat, ndarray):
+            raise TypeError(
+                "Batched sweeps require a dense Hamiltonian; {} provides a {}.".format(
+                    type(self).__name__, type(hamiltonian_mat).__name__
+                )
+            )
+        return hamiltonian_mat
+
+    def _batched_spectrum_vs_paramvals(
+        self,
+        param_name: str,
+        param_vals: ndarray,
+        evals_count: int,
+        get_eigenstates: bool,
+        operator: str = None,
+    ) -> Tuple[ndarray, Union[ndarray, None], Union[ndarray, None]]:
+        """Diagonalizes stacks of Hamiltonians for chunks of parameter values at
+        once; chunk lengths are chosen such that each stack of Hamiltonians stays
+        within `settings.BATCH_MEMORY_LIMIT`. If `operator` is given, the matrix
+        elements of the operator (evaluated at each parameter value) are computed
+        for each chunk by a single stacked contraction."""
+        param_count = len(param_vals)
+        first_hamiltonian = self._hamiltonian_for_paramval(param_vals[0], param_name)
+        decomposition = self.hamiltonian_decomposition(param_name)
+        dim = first_hamiltonian.shape[0]
+        chunk_length = max(
+            1,
+            settings.BATCH_MEMORY_LIMIT // (dim * dim * first_hamiltonian.itemsize),
+        )
+        eigenvalue_table = np.empty((param_count, evals_count), dtype=np.float_)
+        eigenstate_table = (
+            np.empty((param_count, dim, evals_count), dtype=first_hamiltonian.dtype)
+            if get_eigenstates
+            else None
+        )
+        matelem_table = (
+            np.empty((param_count, evals_count, evals_count), dtype=np.complex_)
+            if operator
+            else None
+        )
+        for start in tqdm(
+            range(0, param_count, chunk_length),
+            desc="Spectral data",
+            leave=False,
+            disable=settings.PROGRESSBAR_DISABLED,
+        ):
+            chunk_vals = param_vals[start : start + chunk_length]
+            if decomposition is not None:
+                hamiltonian_stack = decomposition.evaluate_stack(chunk_vals)
+            else:
+                hamiltonian_stack = np.asarray(
+                    [
+                        self._hamiltonian_for_paramval(paramval, param_name)
+                        for paramval in chunk_vals
+                    ]
+                )
+            chunk_slice = slice(start, start + len(chunk_vals))
+            if get_eigenstates:
+                (
+                    eigenvalue_table[chunk_slice],
+                    eigenstate_table[chunk_slice],
+                ) = batched_eigh(hamiltonian_stack, evals_count)
+            else:
+                eigenvalue_table[chunk_slice] = batched_eigh(
+                    hamiltonian_stack, evals_count, eigvals_only=True
+                )
+            if operator:
+                matelem_table[chunk_slice] = self._matelem_stack(
+                    operator, param_name, chunk_vals, eigenstate_table[chunk_slice]
+                )
+        return eigenvalue_table, eigenstate_table, matelem_table
+
+    def _matelem_stack(
+        self,
+        operator: str,
+        param_name: str,
+        param_vals: ndarray,
+        eigenstate_table: ndarray,
+    ) -> ndarray:
+        """Returns the matrix elements of `operator` for a chunk of parameter values,
+        with the operator evaluated at each parameter value."""
+        operator_list = []
+        for paramval in param_vals:
+            setattr(self, param_name, paramval)
+            operator_list.append(getattr(self, operator)())
+        if all(isinstance(op_matrix, ndarray) for op_matrix in operator_list):
+            return get_matrixelement_table_stack(
+                np.asarray(operator_list), eigenstate_table
+            )
+        return np.asarray(
+            [
+                get_matrixelement_table(op_matrix, evecs)
+                for op_matrix, evecs in zip(operator_list, eigenstate_table)
+            ]
+        )
+
     def get_spectrum_vs_paramvals(
         self,
         param_name: str,
@@ -331,12 +763,20 @@ class QubitBaseClass(QuantumSystem, ABC):
         get_eigenstates: bool = False,
         filename: str = None,
         num_cpus: int = settings.NUM_CPUS,
+        batched: bool = False,
+        refine_tol: float = None,
+        max_points: int = None,
     ) -> SpectrumData:
         """Calculates eigenvalues/eigenstates for a varying system parameter,
         given an array of parameter values. Returns a `SpectrumData` object with
         `energy_data[n]` containing eigenvalues calculated for parameter value
         `param_vals[n]`.
 
+        With `refine_tol` set, the sweep is adaptive: `param_vals` only serves as the
+        initial coarse grid, and points are inserted where the spectrum is poorly
+        resolved (strong curvature, narrow avoided crossings). The returned
+        `SpectrumData` then holds the resulting non-uniform, sorted `param_vals`.
+
         Parameters
         ----------
         param_name:
@@ -356,63 +796,102 @@ class QubitBaseClass(QuantumSystem, ABC):
         num_cpus:
             number of cores to be used for computation
             (default value: settings.NUM_CPUS)
+        batched:
+            if True, Hamiltonians for chunks of parameter values are stacked and
+            diagonalized by a single batched `numpy.linalg.eigh` call; meant for
+            qubits with small, dense Hamiltonians (e.g., Transmon, Fluxonium,
+            FluxQubit). `num_cpus` is ignored in this mode. (default value = False)
+        refine_tol:
+            if given, tolerance for the estimated error of linearly interpolating the
+            eigenvalues between neighboring parameter values (default value = None,
+            no refinement)
+        max_points:
+            maximum number of parameter values in an adaptive sweep
+            (default value: ten times the length of `param_vals`)
         """
-        previous_paramval = getattr(self, param_name)
-        tqdm_disable = num_cpus > 1 or settings.PROGRESSBAR_DISABLED
-
-        target_map = get_map_method(num_cpus)
-        if not get_eigenstates:
-            func = functools.partial(
-                self._evals_for_paramval, param_name=param_name, evals_count=evals_count
-            )
-            with InfoBar(
-                "Parallel computation of eigensystems [num_cpus={}]".format(num_cpus),
+        if refine_tol is not None:
+            return self._adaptive_spectrum_vs_paramvals(
+                param_name,
+                param_vals,
+                evals_count,
+                subtract_ground,
+                get_eigenstates,
+                filename,
                 num_cpus,
-            ):
-                eigenvalue_table = list(
-                    target_map(
-                        func,
+                batched,
+                refine_tol,
+                max_points,
+            )
+        previous_paramval = getattr(self, param_name)
+        tqdm_disable = settings.PROGRESSBAR_DISABLED
+        self._start_sweep(param_name)
+        try:
+            if batched:
+                (
+                    eigenvalue_table,
+                    eigenstate_table,
+                    _,
+                ) = self._batched_spectrum_vs_paramvals(
+                    param_name, param_vals, evals_count, get_eigenstates
+                )
+            elif not get_eigenstates:
+                func = functools.partial(
+                    self._evals_for_paramval,
+                    param_name=param_name,
+                    evals_count=evals_count,
+                )
+                with InfoBar(
+                    "Parallel computation of eigensystems [num_cpus={}]".format(
+                        num_cpus
+                    ),
+                    num_cpus,
+                ):
+                    eigenvalue_table = list(
                         tqdm(
-                            param_vals,
+                            imap_ordered(func, param_vals, num_cpus),
+                            total=len(param_vals),
                             desc="Spectral data",
                             leave=False,
                             disable=tqdm_disable,
-                        ),
+                        )
                     )
+                eigenvalue_table = np.asarray(eigenvalue_table)
+                eigenstate_table = None
+            else:
+                func = functools.partial(
+                    self._esys_for_paramval,
+                    param_name=param_name,
+                    evals_count=evals_count,
                 )
-            eigenvalue_table = np.asarray(eigenvalue_table)
-            eigenstate_table = None
-        else:
-            func = functools.partial(
-                self._esys_for_paramval, param_name=param_name, evals_count=evals_count
-            )
-            with InfoBar(
-                "Parallel computation of eigenvalues [num_cpus={}]".format(num_cpus),
-                num_cpus,
-            ):
-                # Note that it is useful here that the outermost eigenstate object is
-                # a list, as for certain applications the necessary hilbert space
-                # dimension can vary with paramvals
-                eigensystem_mapdata = list(
-                    target_map(
-                        func,
+                with InfoBar(
+                    "Parallel computation of eigenvalues [num_cpus={}]".format(
+                        num_cpus
+                    ),
+                    num_cpus,
+                ):
+                    # Note that it is useful here that the outermost eigenstate object is
+                    # a list, as for certain applications the necessary hilbert space
+                    # dimension can vary with paramvals
+                    eigensystem_mapdata = list(
                         tqdm(
-                            param_vals,
+                            imap_ordered(func, param_vals, num_cpus),
+                            total=len(param_vals),
                             desc="Spectral data",
                             leave=False,
                             disable=tqdm_disable,
-                        ),
+                        )
                     )
+                eigenvalue_table, eigenstate_table = recast_esys_mapdata(
+                    eigensystem_mapdata
                 )
-            eigenvalue_table, eigenstate_table = recast_esys_mapdata(
-                eigensystem_mapdata
-            )
+        finally:
+            self._stop_sweep()
+            setattr(self, param_name, previous_paramval)
 
         if subtract_ground:
             for param_index, _ in enumerate(param_vals):
                 eigenvalue_table[param_index] -= eigenvalue_table[param_index][0]
 
-        setattr(self, param_name, previous_paramval)
         specdata = SpectrumData(
             eigenvalue_table,
             self.get_initdata(),
@@ -431,6 +910,303 @@ class QubitBaseClass(QuantumSystem, ABC):
             state_table=eigenstate_table,
         )
 
+    def _adaptive_spectrum_vs_paramvals(
+        self,
+        param_name: str,
+        param_vals: ndarray,
+        evals_count: int,
+        subtract_ground: bool,
+        get_eigenstates: bool,
+        filename: Union[str, None],
+        num_cpus: int,
+        batched: bool,
+        refine_tol: float,
+        max_points: Union[int, None],
+    ) -> SpectrumData:
+        """Adaptive version of `get_spectrum_vs_paramvals`, see there."""
+
+        def compute_points(new_vals: ndarray) -> List[Tuple[ndarray, Any]]:
+            specdata = self.get_spectrum_vs_paramvals(
+                param_name,
+                new_vals,
+                evals_count=evals_count,
+                get_eigenstates=get_eigenstates,
+                num_cpus=num_cpus,
+                batched=batched,
+            )
+            if get_eigenstates:
+                return list(zip(specdata.energy_table, specdata.state_table))
+            return [(evals, None) for evals in specdata.energy_table]
+
+        param_vals, results = refine_sweep(
+            compute_points,
+            lambda result: result[0],
+            param_vals,
+            refine_tol,
+            max_points,
+        )
+        eigenvalue_table = np.asarray([evals for evals, _ in results])
+        eigenstate_table = None
+        if get_eigenstates:
+            eigenstate_table = np.asarray([evecs for _, evecs in results])
+        if subtract_ground:
+            eigenvalue_table -= eigenvalue_table[:, 0:1]
+
+        specdata = SpectrumData(
+            eigenvalue_table,
+            self.get_initdata(),
+            param_name,
+            param_vals,
+            state_table=eigenstate_table,
+        )
+        if filename:
+            specdata.filewrite(filename)
+        return specdata
+
+    def get_spectrum_vs_paramvals_interpolated(
+        self,
+        param_name: str,
+        param_vals: ndarray,
+        evals_count: int = 6,
+        tol: float = 1e-4,
+        anchor_count: int = 11,
+        second_order: bool = False,
+        subtract_ground: bool = False,
+        filename: str = None,
+        num_cpus: int = settings.NUM_CPUS,
+    ) -> SpectrumData:
+        """Calculates eigenvalues for a varying system parameter on a fine grid of
+        parameter values, diagonalizing the Hamiltonian only at a subset of anchor
+        points. At the anchor points, energy derivatives are obtained from the
+        Hellmann-Feynman theorem (and optionally from second-order perturbation
+        theory); in between, energies are interpolated by Hermite polynomials.
+        Wherever the estimated interpolation error exceeds `tol`, further anchor
+        points are inserted, down to exact diagonalization at every grid point if
+        needed (e.g., close to narrow avoided crossings).
+
+        The returned `SpectrumData` object additionally holds `error_estimate`, the
+        estimated interpolation error for each parameter value (zero at anchor
+        points), and `anchor_indices`, the indices of the anchor points.
+
+        Parameters
+        ----------
+        param_name:
+            name of parameter to be varied
+        param_vals:
+            parameter values to be plugged in, in ascending order
+        evals_count:
+            number of desired eigenvalues (sorted from smallest to largest)
+            (default value = 6)
+        tol:
+            tolerance for the estimated interpolation error (default value = 1e-4)
+        anchor_count:
+            number of initial, evenly spaced anchor points (default value = 11)
+        second_order:
+            if True, second derivatives of the energies are included, and quintic
+            rather than cubic Hermite interpolation is used (default value = False)
+        subtract_ground:
+            if True, eigenvalues are returned relative to the ground state eigenvalue
+            (default value = False)
+        filename:
+            file name if direct output to disk is wanted
+        num_cpus:
+            number of cores to be used for computation
+            (default value: settings.NUM_CPUS)
+        """
+        param_vals = np.asarray(param_vals, dtype=np.float_)
+        if np.any(np.diff(param_vals) <= 0.0):
+            raise ValueError("Parameter values must be in ascending order.")
+        previous_paramval = getattr(self, param_name)
+        self._start_sweep(param_name)
+        try:
+            func = functools.partial(
+                self._energy_derivatives_for_paramval,
+                param_name=param_name,
+                evals_count=evals_count,
+                second_order=second_order,
+            )
+
+            anchor_data: Dict[int, List[ndarray]] = {}
+            new_indices = np.unique(
+                np.linspace(0, len(param_vals) - 1, max(anchor_count, 2)).round()
+            ).astype(int)
+            with tqdm(
+                total=len(param_vals),
+                desc="Anchor points",
+                leave=False,
+                disable=settings.PROGRESSBAR_DISABLED,
+            ) as progress_bar:
+                while len(new_indices) > 0:
+                    with InfoBar(
+                        "Parallel computation of eigensystems [num_cpus={}]".format(
+                            num_cpus
+                        ),
+                        num_cpus,
+                    ):
+                        anchor_data.update(
+                            zip(
+                                new_indices,
+                                imap_ordered(func, param_vals[new_indices], num_cpus),
+                            )
+                        )
+                    progress_bar.update(len(new_indices))
+                    anchor_indices = np.asarray(sorted(anchor_data))
+                    _, _, interval_errors = hermite_interpolation(
+                        param_vals[anchor_indices],
+                        self._stack_anchor_data(anchor_data, anchor_indices),
+                        param_vals[anchor_indices],
+                    )
+                    refine = (interval_errors > tol) & (np.diff(anchor_indices) > 1)
+                    new_indices = (
+                        anchor_indices[:-1][refine] + anchor_indices[1:][refine]
+                    ) // 2
+        finally:
+            self._stop_sweep()
+            setattr(self, param_name, previous_paramval)
+        eigenvalue_table, error_estimate, _ = hermite_interpolation(
+            param_vals[anchor_indices],
+            self._stack_anchor_data(anchor_data, anchor_indices),
+            param_vals,
+        )
+        eigenvalue_table[anchor_indices] = np.asarray(
+            [anchor_data[index][0] for index in anchor_indices]
+        )
+        error_estimate[anchor_indices] = 0.0
+        if subtract_ground:
+            eigenvalue_table -= eigenvalue_table[:, 0:1]
+
+        specdata = SpectrumData(
+            eigenvalue_table,
+            self.get_initdata(),
+            param_name,
+            param_vals,
+            error_estimate=error_estimate,
+            anchor_indices=anchor_indices,
+        )
+        if filename:
+            specdata.filewrite(filename)
+        return specdata
+
+    @staticmethod
+    def _stack_anchor_data(
+        anchor_data: Dict[int, List[ndarray]], anchor_indices: ndarray
+    ) -> List[ndarray]:
+        """Returns the energies and energy derivatives at the given anchor points, as
+        a list of arrays of shape (len(anchor_indices), evals_count)."""
+        return [
+            np.asarray([anchor_data[index][order] for index in anchor_indices])
+            for order in range(len(anchor_data[anchor_indices[0]]))
+        ]
+
+    def get_spectrum_vs_paramgrid(
+        self,
+        param_grid: Dict[str, ndarray],
+        evals_count: int = 6,
+        subtract_ground: bool = False,
+        get_eigenstates: bool = False,
+        filename: str = None,
+        num_cpus: int = settings.NUM_CPUS,
+        snake: bool = True,
+    ) -> SpectrumData:
+        """Calculates eigenvalues/eigenstates on the Cartesian grid spanned by several
+        varying system parameters. Returns a `SpectrumData` object with
+        `energy_table[n1, ..., nN]` containing the eigenvalues for the parameter values
+        `param_vals[0][n1], ..., param_vals[N-1][nN]`.
+
+        Parameters
+        ----------
+        param_grid:
+            dictionary of the form `{param_name: param_vals}`, one entry per grid axis;
+            the order of entries sets the order of the axes in the output tables
+        evals_count:
+            number of desired eigenvalues (sorted from smallest to largest)
+            (default value = 6)
+        subtract_ground:
+            if True, eigenvalues are returned relative to the ground state eigenvalue
+            (default value = False)
+        get_eigenstates:
+            return eigenstates along with eigenvalues (default value = False)
+        filename:
+            file name if direct output to disk is wanted
+        num_cpus:
+            number of cores to be used for computation
+            (default value: settings.NUM_CPUS)
+        snake:
+            if True, grid points are visited in snake order so that consecutive
+            points, and hence the tiles handed to each worker, are neighbours on the
+            grid; this lets warm-started solvers (`settings.SWEEP_CONTINUATION`)
+            reuse the previous solution (default value = True)
+        """
+        param_names = list(param_grid.keys())
+        param_vals = [np.asarray(axis_vals) for axis_vals in param_grid.values()]
+        grid_shape = tuple(len(axis_vals) for axis_vals in param_vals)
+        traversal = grid_traversal(grid_shape, snake=snake)
+        gridpoint_vals = [
+            tuple(axis_vals[index] for axis_vals, index in zip(param_vals, multi_index))
+            for multi_index in traversal
+        ]
+
+        previous_paramvals = {name: getattr(self, name) for name in param_names}
+        # No parametric decomposition applies when several parameters vary at once.
+        self._start_sweep(None)
+        try:
+            if get_eigenstates:
+                func = functools.partial(
+                    self._esys_for_gridpoint,
+                    param_names=param_names,
+                    evals_count=evals_count,
+                )
+            else:
+                func = functools.partial(
+                    self._evals_for_gridpoint,
+                    param_names=param_names,
+                    evals_count=evals_count,
+                )
+            with InfoBar(
+                "Parallel computation of eigensystems [num_cpus={}]".format(num_cpus),
+                num_cpus,
+            ):
+                mapdata = list(
+                    tqdm(
+                        imap_ordered(func, gridpoint_vals, num_cpus),
+                        total=len(gridpoint_vals),
+                        desc="Spectral data",
+                        leave=False,
+                        disable=settings.PROGRESSBAR_DISABLED,
+                    )
+                )
+        finally:
+            self._stop_sweep()
+            for name, value in previous_paramvals.items():
+                setattr(self, name, value)
+
+        eigenvalue_table = np.empty(grid_shape + (evals_count,))
+        eigenstate_table = None
+        if get_eigenstates:
+            eigenstate_table = np.empty(
+                grid_shape + mapdata[0][1].shape, dtype=mapdata[0][1].dtype
+            )
+        for multi_index, result in zip(traversal, mapdata):
+            multi_index = tuple(multi_index)
+            if get_eigenstates:
+                eigenvalue_table[multi_index], eigenstate_table[multi_index] = result
+            else:
+                eigenvalue_table[multi_index] = result
+
+        if subtract_ground:
+            eigenvalue_table -= eigenvalue_table[..., 0:1]
+
+        specdata = SpectrumData(
+            eigenvalue_table,
+            self.get_initdata(),
+            param_names,
+            param_vals,
+            state_table=eigenstate_table,
+        )
+        if filename:
+            specdata.filewrite(filename)
+        return specdata
+
     def get_matelements_vs_paramvals(
         self,
         operator: str,
@@ -438,10 +1214,12 @@ class QubitBaseClass(QuantumSystem, ABC):
         param_vals: ndarray,
         evals_count: int = 6,
         num_cpus: int = settings.NUM_CPUS,
+        batched: bool = False,
     ) -> SpectrumData:
         """Calculates matrix elements for a varying system parameter, given an array
         of parameter values. Returns a `SpectrumData` object containing matrix
-        element data, eigenvalue data, and eigenstate data..
+        element data, eigenvalue data, and eigenstate data. The operator is evaluated
+        at each of the parameter values.
 
         Parameters
         ----------
@@ -457,33 +1235,65 @@ class QubitBaseClass(QuantumSystem, ABC):
         num_cpus:
             number of cores to be used for computation
             (default value: settings.NUM_CPUS)
+        batched:
+            if True, eigensystems and matrix elements are computed for stacks of
+            parameter values at once, see `get_spectrum_vs_paramvals`
+            (default value = False)
         """
-        spectrumdata = self.get_spectrum_vs_paramvals(
+        previous_paramval = getattr(self, param_name)
+        self._start_sweep(param_name)
+        try:
+            if batched:
+                (
+                    eigenvalue_table,
+                    eigenstate_table,
+                    matelem_table,
+                ) = self._batched_spectrum_vs_paramvals(
+                    param_name, param_vals, evals_count, True, operator=operator
+                )
+            else:
+                func = functools.partial(
+                    self._esys_matelem_for_paramval,
+                    param_name=param_name,
+                    evals_count=evals_count,
+                    operator=operator,
+                )
+                matelem_table = np.empty(
+                    shape=(len(param_vals), evals_count, evals_count), dtype=np.complex_
+                )
+                eigensystem_mapdata = []
+                with InfoBar(
+                    "Parallel computation of eigensystems [num_cpus={}]".format(
+                        num_cpus
+                    ),
+                    num_cpus,
+                ):
+                    for index, (evals, evecs, table) in enumerate(
+                        tqdm(
+                            imap_ordered(func, param_vals, num_cpus),
+                            total=len(param_vals),
+                            desc="Matrix elements",
+                            leave=False,
+                            disable=settings.PROGRESSBAR_DISABLED,
+                        )
+                    ):
+                        eigensystem_mapdata.append((evals, evecs))
+                        matelem_table[index] = table
+                eigenvalue_table, eigenstate_table = recast_esys_mapdata(
+                    eigensystem_mapdata
+                )
+        finally:
+            self._stop_sweep()
+            setattr(self, param_name, previous_paramval)
+        return SpectrumData(
+            eigenvalue_table,
+            self.get_initdata(),
             param_name,
             param_vals,
-            evals_count=evals_count,
-            get_eigenstates=True,
-            num_cpus=num_cpus,
-        )
-        paramvals_count = len(param_vals)
-        matelem_table = np.empty(
-            shape=(paramvals_count, evals_count, evals_count), dtype=np.complex_
+            state_table=eigenstate_table,
+            matrixelem_table=matelem_table,
         )
 
-        for index, paramval in tqdm(
-            enumerate(param_vals),
-            total=len(param_vals),
-            disable=settings.PROGRESSBAR_DISABLED,
-            leave=False,
-        ):
-            evecs = spectrumdata.state_table[index]  # type: ignore
-            matelem_table[index] = self.matrixelement_table(
-                operator, evecs=evecs, evals_count=evals_count
-            )
-
-        spectrumdata.matrixelem_table = matelem_table
-        return spectrumdata
-
     def plot_evals_vs_paramvals(
         self,
         param_name: str,
@@ -647,7 +1457,6 @@ class QubitBaseClass(QuantumSystem, ABC):
 # —QubitBaseClass1d——————————————————————————————————————————————————————————————————
 
 
-
 class QubitBaseClass1d(QubitBaseClass):
     """Base class for superconducting qubit objects with one degree of freedom.
     Provide general mechanisms and routines for plotting spectra, matrix elements,
@@ -21,9 +21,11 @@ import qutip as qt
 
 from numpy import ndarray
 from qutip import Qobj
+from scipy.optimize import linear_sum_assignment
 
 import scqubits
 import scqubits.io_utils.fileio_serializers as serializers
+import scqubits.settings as settings
 import scqubits.utils.spectrum_utils as spec_utils
 
 if TYPE_CHECKING:
@@ -49,6 +51,59 @@ def check_sync_status(func: Callable) -> Callable:
     return wrapper
 
 
+def dressed_indices_from_overlaps(
+    overlap_stack: ndarray, assignment: str = "argmax"
+) -> ndarray:
+    """For a stack of overlap matrices, determine for each bare basis state the index
+    of the dressed state it maps to. Bare states whose largest overlap with any
+    dressed state is below 0.5 remain unassigned.
+
+    Parameters
+    ----------
+    overlap_stack:
+        absolute values of overlaps <dressed|bare>, of shape
+        `(param_count, dressed_count, bare_dimension)`
+    assignment:
+        'argmax': each bare state is mapped to the dressed state of largest overlap;
+        'hungarian': one-to-one mapping maximizing the total overlap probability
+
+    Returns
+    -------
+        integer array of dressed indices, shape `(param_count, bare_dimension)`;
+        -1 marks unassigned bare states
+    """
+    if assignment == "argmax":
+        dressed_indices = overlap_stack.argmax(axis=1)
+        max_overlaps = np.take_along_axis(
+            overlap_stack, dressed_indices[:, np.newaxis, :], axis=1
+        )[:, 0, :]
+        dressed_indices[max_overlaps < 0.5] = -1
+        return dressed_indices
+    if assignment == "hungarian":
+        dressed_indices = np.full(
+            (overlap_stack.shape[0], overlap_stack.shape[2]), -1, dtype=np.int_
+        )
+        for param_index, overlap_matrix in enumerate(overlap_stack):
+            rows, cols = linear_sum_assignment(overlap_matrix ** 2, maximize=True)
+            assigned = overlap_matrix[rows, cols] >= 0.5
+            dressed_indices[param_index, cols[assigned]] = rows[assigned]
+        return dressed_indices
+    raise ValueError("Unknown assignment method: {}".format(assignment))
+
+
+def as_dressed_index_array(
+    dressed_indices: Union[ndarray, List[List[Union[int, None]]]]
+) -> ndarray:
+    """Converts dressed-index data, possibly in the legacy form of nested lists with
+    None for unassigned states, into an integer array with -1 for unassigned."""
+    if isinstance(dressed_indices, ndarray) and dressed_indices.dtype != object:
+        return dressed_indices.astype(np.int_)
+    return np.asarray(
+        [[-1 if index is None else index for index in row] for row in dressed_indices],
+        dtype=np.int_,
+    )
+
+
 class SpectrumLookup(serializers.Serializable):
     """
     The `SpectrumLookup` is an integral building block of the `HilbertSpace` and
@@ -83,7 +138,10 @@ class SpectrumLookup(serializers.Serializable):
         self._dressed_specdata = dressed_specdata
         self._bare_specdata_list = bare_specdata_list
         self._canonical_bare_labels: List[Tuple[int, ...]]
-        self._dressed_indices: List[List[Union[int, None]]]
+        self._dressed_indices: ndarray
+        # index tables for constant-time lookups, derived from `_dressed_indices`
+        self._index_tables: Union[Tuple[ndarray, ndarray, ndarray, ndarray], None]
+        self._index_tables = None
         self._out_of_sync = False
         self._init_params = [
             "_dressed_specdata",
@@ -112,8 +170,8 @@ class SpectrumLookup(serializers.Serializable):
         self._canonical_bare_labels = self._generate_bare_labels()
         self._dressed_indices = (
             self._generate_mappings()
-        )  # lists of as many elements as there are parameter values.
-        # For HilbertSpace objects the above is a single-element list.
+        )  # array with as many rows as there are parameter values.
+        # For HilbertSpace objects the above has a single row.
 
     @classmethod
     def deserialize(cls, io_data: "IOData") -> "SpectrumLookup":
@@ -131,7 +189,9 @@ class SpectrumLookup(serializers.Serializable):
         new_spectrum_lookup._canonical_bare_labels = alldata_dict[
             "_canonical_bare_labels"
         ]
-        new_spectrum_lookup._dressed_indices = alldata_dict["_dressed_indices"]
+        new_spectrum_lookup._dressed_indices = as_dressed_index_array(
+            alldata_dict["_dressed_indices"]
+        )
         return new_spectrum_lookup
 
     def _generate_bare_labels(self) -> List[Tuple[int, ...]]:
@@ -155,54 +215,88 @@ class SpectrumLookup(serializers.Serializable):
         )  # generate list of bare basis states (tuples)
         return basis_labels_list
 
-    def _generate_mappings(self) -> List[List[Union[int, None]]]:
+    def _generate_mappings(self) -> ndarray:
         """
         For each parameter value of the parameter sweep (may only be one if called
         from HilbertSpace, so no sweep), generate the map between bare states and
-        dressed states.
-
-        Returns ------- each list item is a list of dressed indices whose order
-        corresponds to the ordering of bare indices (as stored in
-        .canonical_bare_labels, thus establishing the mapping
-        """
-        param_indices = range(self._dressed_specdata.param_count)
-        dressed_indices_list = []
-        for index in param_indices:
-            dressed_indices = self._generate_single_mapping(index)
-            dressed_indices_list.append(dressed_indices)
-        return dressed_indices_list
-
-    def _generate_single_mapping(self, param_index: int) -> List[Union[int, None]]:
-        """
-        For a single parameter value with index `param_index`, create a list of the
-        dressed-state indices in an order that corresponds one to one to the
-        canonical bare-state product states with largest overlap (whenever possible).
-
-        Parameters
-        ----------
-        param_index:
-            index of the parameter value
+        dressed states. Overlap matrices are processed as stacks, in chunks of
+        parameter values limited by `settings.BATCH_MEMORY_LIMIT`.
 
         Returns
         -------
-            dressed-state indices
+            integer array of shape (param_count, dimension); each row holds the
+            dressed indices whose order corresponds to the ordering of bare indices
+            (as stored in ._canonical_bare_labels), thus establishing the mapping;
+            -1 marks bare states without assignment
         """
-        overlap_matrix = spec_utils.convert_esys_to_ndarray(
-            self._dressed_specdata.state_table[param_index]
+        param_count = self._dressed_specdata.param_count
+        dimension = self._hilbertspace.dimension
+        dressed_count = len(self._dressed_specdata.state_table[0])
+        chunk_length = max(
+            1, settings.BATCH_MEMORY_LIMIT // (8 * dressed_count * dimension)
         )
 
-        dressed_indices: List[Union[int, None]] = []
-        for bare_basis_index in range(
-            self._hilbertspace.dimension
-        ):  # for given bare basis index, find dressed index
-            max_position = (np.abs(overlap_matrix[:, bare_basis_index])).argmax()
-            max_overlap = np.abs(overlap_matrix[max_position, bare_basis_index])
-            if max_overlap < 0.5:  # overlap too low, make no assignment
-                dressed_indices.append(None)
-            else:
-                dressed_indices.append(max_position)
+        # Overlaps are obtained from the dressed eigenstates held by this process, so
+        # chunks are processed serially: handing them to worker processes would cost
+        # more than the assignment itself.
+        dressed_indices = np.empty((param_count, dimension), dtype=np.int_)
+        for start in range(0, param_count, chunk_length):
+            stop = min(start + chunk_length, param_count)
+            overlap_stack = np.asarray(
+                [
+                    self._overlap_matrix(param_index)
+                    for param_index in range(start, stop)
+                ]
+            )
+            dressed_indices[start:stop] = dressed_indices_from_overlaps(
+                overlap_stack, assignment=settings.LOOKUP_ASSIGNMENT
+            )
         return dressed_indices
 
+    def _overlap_matrix(self, param_index: int) -> ndarray:
+        """Returns the absolute overlaps of dressed states with the bare product
+        states, as an array of shape (dressed_count, dimension)."""
+        return np.abs(
+            spec_utils.convert_esys_to_ndarray(
+                self._dressed_specdata.state_table[param_index]
+            )
+        )
+
+    def _get_index_tables(self) -> Tuple[ndarray, ndarray, ndarray, ndarray]:
+        """Returns the subsystem dimensions and the mixed-radix strides translating
+        bare labels into positions in the canonical ordering of bare labels, along
+        with the table of dressed indices and the inverse table of bare positions
+        (shape (param_count, dimension), -1 marking dressed states without bare
+        assignment). The tables are built once for each set of `_dressed_indices`."""
+        if (
+            self._index_tables is not None
+            and self._index_tables[2] is self._dressed_indices
+        ):
+            return self._index_tables
+
+        dressed_indices = self._dressed_indices
+        dims = np.asarray(self._canonical_bare_labels).max(axis=0) + 1
+        strides = np.append(np.cumprod(dims[:0:-1])[::-1], 1)
+        param_count, dimension = dressed_indices.shape
+        params, positions = np.nonzero(dressed_indices >= 0)
+        bare_positions = np.full((param_count, dimension), dimension, dtype=np.int_)
+        # if several bare states map onto the same dressed state, the first one wins
+        np.minimum.at(
+            bare_positions, (params, dressed_indices[params, positions]), positions
+        )
+        bare_positions[bare_positions == dimension] = -1
+        self._index_tables = (dims, strides, dressed_indices, bare_positions)
+        return self._index_tables
+
+    def _bare_position(self, bare_labels: Tuple[int, ...]) -> Union[int, None]:
+        """Returns the position of `bare_labels` in the canonical ordering of bare
+        labels, or None if the labels are invalid."""
+        dims, strides, _, _ = self._get_index_tables()
+        labels = np.asarray(bare_labels)
+        if labels.shape != dims.shape or np.any(labels < 0) or np.any(labels >= dims):
+            return None
+        return int(labels @ strides)
+
     @check_sync_status
     def dressed_index(
         self, bare_labels: Tuple[int, ...], param_index: int = 0
@@ -221,11 +315,31 @@ class SpectrumLookup(serializers.Serializable):
         -------
             dressed state index closest to the specified bare state
         """
-        try:
-            lookup_position = self._canonical_bare_labels.index(bare_labels)
-        except ValueError:
+        lookup_position = self._bare_position(bare_labels)
+        if lookup_position is None:
             return None
-        return self._dressed_indices[param_index][lookup_position]
+        dressed_index = self._dressed_indices[param_index, lookup_position]
+        return None if dressed_index < 0 else int(dressed_index)
+
+    @check_sync_status
+    def dressed_index_vs_paramvals(self, bare_labels: Tuple[int, ...]) -> ndarray:
+        """
+        For given bare product state return the corresponding dressed-state indices
+        for all parameter values.
+
+        Parameters
+        ----------
+        bare_labels:
+            bare_labels = (index, index2, ...)
+
+        Returns
+        -------
+            integer array of dressed-state indices, -1 where no assignment exists
+        """
+        lookup_position = self._bare_position(bare_labels)
+        if lookup_position is None:
+            return np.full(len(self._dressed_indices), -1, dtype=np.int_)
+        return self._dressed_indices[:, lookup_position]
 
     @check_sync_status
     def bare_index(
@@ -240,12 +354,13 @@ class SpectrumLookup(serializers.Serializable):
             is in bare state 1, subsystem 2 in bare state 0, and subsystem 3 in bare
             state 3.
         """
-        try:
-            lookup_position = self._dressed_indices[param_index].index(dressed_index)
-        except ValueError:
+        dims, _, _, bare_positions = self._get_index_tables()
+        if not 0 <= dressed_index < bare_positions.shape[1]:
             return None
-        basis_labels = self._canonical_bare_labels[lookup_position]
-        return basis_labels
+        lookup_position = bare_positions[param_index, dressed_index]
+        if lookup_position < 0:
+            return None
+        return tuple(int(label) for label in np.unravel_index(lookup_position, dims))
 
     @check_sync_status
     def dressed_eigenstates(self, param_index: int = 0) -> List["QutipEigenstates"]:
@@ -304,6 +419,29 @@ class SpectrumLookup(serializers.Serializable):
             return None
         return self._dressed_specdata.energy_table[param_index][dressed_index]
 
+    @check_sync_status
+    def energy_bare_index_vs_paramvals(self, bare_tuple: Tuple[int, ...]) -> ndarray:
+        """
+        Look up dressed energies most closely corresponding to the given bare-state
+        labels, for all parameter values
+
+        Parameters
+        ----------
+        bare_tuple:
+            bare state indices
+
+        Returns
+        -------
+            dressed energies; NaN where lookup is unsuccessful
+        """
+        dressed_indices = self.dressed_index_vs_paramvals(bare_tuple)
+        energy_table = np.asarray(self._dressed_specdata.energy_table)
+        energies = np.take_along_axis(
+            energy_table, np.maximum(dressed_indices, 0)[:, np.newaxis], axis=1
+        )[:, 0].astype(np.float_)
+        energies[dressed_indices < 0] = np.nan
+        return energies
+
     @check_sync_status
     def energy_dressed_index(self, dressed_index: int, param_index: int = 0) -> float:
         """
@@ -11,12 +11,15 @@
 
 from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
 
+import numpy as np
+
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 from numpy import ndarray
 
 import scqubits.io_utils.fileio_serializers as serializers
 import scqubits.utils.plotting as plot
+import scqubits.utils.spectrum_utils as spec_utils
 
 from scqubits.io_utils.fileio_qutip import QutipEigenstates
 
@@ -85,9 +88,11 @@ class DataStore(serializers.Serializable):
     system_params:
         info about system parameters
     param_name:
-        name of parameter being varies
+        name of parameter being varies; for sweeps over an N-dimensional grid, list of
+        the names of the N parameters
     param_vals:
-        parameter values for which spectrum data are stored
+        parameter values for which spectrum data are stored; for sweeps over an
+        N-dimensional grid, list of the N arrays of values along the grid axes
     **kwargs:
         keyword arguments for data to be stored: ``dataname=data``, where data should be an array-like object
     """
@@ -95,14 +100,18 @@ class DataStore(serializers.Serializable):
     def __init__(
         self,
         system_params: Dict[str, Any],
-        param_name: str = None,
-        param_vals: ndarray = None,
+        param_name: Union[str, List[str]] = None,
+        param_vals: Union[ndarray, List[ndarray]] = None,
         **kwargs
     ) -> None:
         self.system_params = system_params
         self.param_name = param_name
         self.param_vals = param_vals
-        if isinstance(param_vals, ndarray):
+        if isinstance(param_name, list):
+            self.param_count = int(
+                np.prod([len(axis_vals) for axis_vals in param_vals])  # type: ignore
+            )
+        elif isinstance(param_vals, ndarray):
             self.param_count = len(self.param_vals)  # type: ignore
         else:
             self.param_count = 1  # just one value if there is no parameter sweep
@@ -145,13 +154,15 @@ class SpectrumData(DataStore):
     ----------
     energy_table:
         energy eigenvalues stored for each `param_vals` point,
-        [[evals for first param_val], [evals for second param_val], ...]
+        [[evals for first param_val], [evals for second param_val], ...]; for
+        N-dimensional grid sweeps, array of shape (n1, ..., nN, evals_count)
     system_params:
         info about system parameters
     param_name:
-        name of parameter being varies
+        name of parameter being varies (list of names for grid sweeps)
     param_vals:
-        parameter values for which spectrum data are stored
+        parameter values for which spectrum data are stored (list of axis value
+        arrays for grid sweeps)
     state_table: Union[List[QutipEigenstates], ndarray, List[ndarray]]
         eigenstate data stored for each `param_vals` point, either as pure ndarray or list of qutip.qobj
     matrixelem_table:
@@ -163,8 +174,8 @@ class SpectrumData(DataStore):
         self,
         energy_table: ndarray,
         system_params: Dict[str, Any],
-        param_name: str = None,
-        param_vals: ndarray = None,
+        param_name: Union[str, List[str]] = None,
+        param_vals: Union[ndarray, List[ndarray]] = None,
         state_table: Union[List[QutipEigenstates], ndarray, List[ndarray]] = None,
         matrixelem_table: ndarray = None,
         **kwargs
@@ -187,7 +198,34 @@ class SpectrumData(DataStore):
 
     def subtract_ground(self) -> None:
         """Subtract ground state energies from spectrum"""
-        self.energy_table -= self.energy_table[:, 0]
+        self.energy_table -= self.energy_table[..., 0:1]
+
+    def track_levels(self) -> "SpectrumData":
+        """Returns a copy of the spectrum in which levels are followed through the
+        sweep by eigenvector overlaps, so that each column of `energy_table` (and of
+        `state_table`, `matrixelem_table`) keeps its identity through level
+        crossings. The permutation relating the tracked to the energy-ordered data is
+        stored as `level_permutation`. Requires `state_table`.
+        """
+        if self.state_table is None:
+            raise ValueError("Level tracking requires eigenstates in state_table.")
+        permutation = spec_utils.track_levels(self.state_table)
+        (
+            energy_table,
+            state_table,
+            matrixelem_table,
+        ) = spec_utils.apply_level_permutation(
+            permutation, self.energy_table, self.state_table, self.matrixelem_table
+        )
+        return SpectrumData(
+            energy_table,
+            self.system_params,
+            self.param_name,
+            self.param_vals,
+            state_table=state_table,
+            matrixelem_table=matrixelem_table,
+            level_permutation=permutation,
+        )
 
     def plot_evals_vs_paramvals(
         self,
@@ -140,7 +140,10 @@ def generate_diffspec_sweep(sweep, initial_state_ind=0):
         diff_eigenenergies = eigenenergies - eigenenergies[eigenenergy_index]
         diff_eigenenergy_table[param_index] = diff_eigenenergies
     return storage.SpectrumData(
-        diff_eigenenergy_table, sweep.system_params, sweep.param_name, sweep.param_vals
+        sweep.reshape_to_grid(diff_eigenenergy_table),
+        sweep.system_params,
+        sweep.param_name,
+        sweep.param_vals,
     )
 
 
@@ -167,23 +170,16 @@ def generate_qubit_transitions_sweep(sweep, photonnumber, initial_state_labels):
     target_states_list = spec_utils.generate_target_states_list(
         sweep, initial_state_labels
     )
-    difference_energies_table = []
-
-    for param_index in range(sweep.param_count):
-        difference_energies = []
-        initial_energy = lookup.energy_bare_index(initial_state_labels, param_index)
-        for target_labels in target_states_list:
-            target_energy = lookup.energy_bare_index(target_labels, param_index)
-            if target_energy is None or initial_energy is None:
-                difference_energies.append(np.NaN)
-            else:
-                difference_energies.append(
-                    (target_energy - initial_energy) / photonnumber
-                )
-        difference_energies_table.append(difference_energies)
+    initial_energies = lookup.energy_bare_index_vs_paramvals(initial_state_labels)
+    data = np.empty((sweep.param_count, len(target_states_list)), dtype=np.float_)
+    for target_index, target_labels in enumerate(target_states_list):
+        target_energies = lookup.energy_bare_index_vs_paramvals(target_labels)
+        data[:, target_index] = (target_energies - initial_energies) / photonnumber
 
-    data = np.asarray(difference_energies_table)
     specdata = storage.SpectrumData(
-        data, sweep.system_params, sweep.param_name, sweep.param_vals
+        sweep.reshape_to_grid(data),
+        sweep.system_params,
+        sweep.param_name,
+        sweep.param_vals,
     )
     return target_states_list, specdata
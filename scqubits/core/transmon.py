@@ -15,6 +15,7 @@ import os
 from typing import Any, Dict, List, Tuple, Union
 
 import numpy as np
+import scipy as sp
 
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
@@ -23,11 +24,13 @@ from numpy import ndarray
 import scqubits.core.constants as constants
 import scqubits.core.descriptors as descriptors
 import scqubits.core.discretization as discretization
+import scqubits.core.param_hamiltonian as ph
 import scqubits.core.qubit_base as base
 import scqubits.core.storage as storage
 import scqubits.io_utils.fileio_serializers as serializers
 import scqubits.utils.plot_defaults as defaults
 import scqubits.utils.plotting as plot
+import scqubits.utils.spectrum_utils as spec_utils
 
 from scqubits.core.discretization import Grid1d
 from scqubits.core.noise import NoisySystem
@@ -60,6 +63,7 @@ class Transmon(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
     EC = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     ng = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     ncut = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
+    _parametric_terms = {"ng": ([ph.linear, ph.quadratic], (0.0, 0.5, 1.0))}
 
     def __init__(
         self, EJ: float, EC: float, ng: float, ncut: int, truncated_dim: int = 6
@@ -122,18 +126,46 @@ class Transmon(base.QubitBaseClass1d, serializers.Serializable, NoisySystem):
 
     def hamiltonian(self) -> ndarray:
         """Returns Hamiltonian in charge basis"""
-        dimension = self.hilbertdim()
-        hamiltonian_mat = np.diag(
-            [
-                4.0 * self.EC * (ind - self.ncut - self.ng) ** 2
-                for ind in range(dimension)
-            ]
-        )
-        ind = np.arange(dimension - 1)
-        hamiltonian_mat[ind, ind + 1] = -self.EJ / 2.0
-        hamiltonian_mat[ind + 1, ind] = -self.EJ / 2.0
+        diag_elements, offdiag_elements = self.hamiltonian_banded()
+        hamiltonian_mat = np.diag(diag_elements)
+        ind = np.arange(self.hilbertdim() - 1)
+        hamiltonian_mat[ind, ind + 1] = offdiag_elements
+        hamiltonian_mat[ind + 1, ind] = offdiag_elements
         return hamiltonian_mat
 
+    def hamiltonian_banded(self) -> Tuple[ndarray, ndarray]:
+        """Returns the real symmetric tridiagonal Hamiltonian in the charge basis in
+        banded form, i.e., as the vectors of its diagonal and first off-diagonal
+        entries."""
+        diag_elements = (
+            4.0 * self.EC * (np.arange(self.hilbertdim()) - self.ncut - self.ng) ** 2
+        )
+        offdiag_elements = np.full(self.hilbertdim() - 1, -self.EJ / 2.0)
+        return diag_elements, offdiag_elements
+
+    def _evals_calc(self, evals_count: int) -> ndarray:
+        diag_elements, offdiag_elements = self.hamiltonian_banded()
+        evals = sp.linalg.eigh_tridiagonal(
+            diag_elements,
+            offdiag_elements,
+            eigvals_only=True,
+            select="i",
+            select_range=(0, evals_count - 1),
+        )
+        return np.sort(evals)
+
+    def _esys_calc(self, evals_count: int) -> Tuple[ndarray, ndarray]:
+        diag_elements, offdiag_elements = self.hamiltonian_banded()
+        evals, evecs = sp.linalg.eigh_tridiagonal(
+            diag_elements,
+            offdiag_elements,
+            eigvals_only=False,
+            select="i",
+            select_range=(0, evals_count - 1),
+        )
+        evals, evecs = spec_utils.order_eigensystem(evals, evecs)
+        return evals, evecs
+
     def d_hamiltonian_d_ng(self) -> ndarray:
         """Returns operator representing a derivative of the Hamiltonian with respect to charge offset `ng`."""
         return -8 * self.EC * self.n_operator()
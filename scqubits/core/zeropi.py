@@ -27,6 +27,7 @@ import scqubits.core.central_dispatch as dispatch
 import scqubits.core.constants as constants
 import scqubits.core.descriptors as descriptors
 import scqubits.core.discretization as discretization
+import scqubits.core.param_hamiltonian as ph
 import scqubits.core.qubit_base as base
 import scqubits.core.storage as storage
 import scqubits.io_utils.fileio_serializers as serializers
@@ -103,7 +104,12 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
     dEJ = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     dCJ = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     ng = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
+    flux = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
     ncut = descriptors.WatchedProperty("QUANTUMSYSTEM_UPDATE")
+    _parametric_terms = {
+        "flux": ([ph.cos_pi, ph.sin_pi], (0.0, 0.5, 1.0)),
+        "ng": ([ph.linear, ph.quadratic], (0.0, 0.5, 1.0)),
+    }
 
     def __init__(
         self,
@@ -211,25 +217,21 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         if sender is self.grid:
             self.broadcast("QUANTUMSYSTEM_UPDATE")
 
+    def _operator_cache_key(self) -> Tuple:
+        # the grid may be replaced, or changed while dispatch is disabled
+        return self.grid.min_val, self.grid.max_val, self.grid.pt_count
+
     def _evals_calc(self, evals_count: int) -> ndarray:
-        hamiltonian_mat = self.hamiltonian()
-        evals = sparse.linalg.eigsh(
-            hamiltonian_mat,
-            k=evals_count,
-            sigma=0.0,
-            which="LM",
-            return_eigenvectors=False,
+        hamiltonian_mat = self._sweep_hamiltonian()
+        evals = self._sparse_eigsh(
+            hamiltonian_mat, evals_count, return_eigenvectors=False
         )
         return np.sort(evals)
 
     def _esys_calc(self, evals_count: int) -> Tuple[ndarray, ndarray]:
-        hamiltonian_mat = self.hamiltonian()
-        evals, evecs = sparse.linalg.eigsh(
-            hamiltonian_mat,
-            k=evals_count,
-            sigma=0.0,
-            which="LM",
-            return_eigenvectors=True,
+        hamiltonian_mat = self._sweep_hamiltonian()
+        evals, evecs = self._sparse_eigsh(
+            hamiltonian_mat, evals_count, return_eigenvectors=True
         )
         # TODO consider normalization of zeropi wavefunctions
         # evecs /= np.sqrt(self.grid.grid_spacing())
@@ -454,6 +456,7 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         dim_theta = 2 * self.ncut + 1
         return sparse.identity(dim_theta, format="csc")
 
+    @base.cached_operator
     def i_d_dphi_operator(self) -> csc_matrix:
         r"""
         Operator :math:`i d/d\phi`.
@@ -475,12 +478,14 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         phi_matrix.setdiag(diag_elements)
         return phi_matrix
 
+    @base.cached_operator
     def phi_operator(self) -> csc_matrix:
         r"""
         Operator :math:`\phi`.
         """
         return sparse.kron(self._phi_operator(), self._identity_theta(), format="csc")
 
+    @base.cached_operator
     def n_theta_operator(self) -> csc_matrix:
         r"""
         Operator :math:`n_\theta`.
@@ -534,6 +539,7 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         )
         return cos_theta_matrix
 
+    @base.cached_operator
     def cos_theta_operator(self) -> csc_matrix:
         r"""
         Operator :math:`\cos(\theta)`.
@@ -561,6 +567,7 @@ class ZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyZeroPi):
         )
         return sin_theta_matrix
 
+    @base.cached_operator
     def sin_theta_operator(self) -> csc_matrix:
         r"""
         Operator :math:`\sin(\theta)`.
@@ -310,10 +310,7 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
         )
 
         gmat = self.g_coupling_matrix(zeropi_evecs)
-        zeropi_coupling = sparse.dia_matrix((zeropi_dim, zeropi_dim), dtype=np.complex_)
-        for l1 in range(zeropi_dim):
-            for l2 in range(zeropi_dim):
-                zeropi_coupling += gmat[l1, l2] * op.hubbard_sparse(l1, l2, zeropi_dim)
+        zeropi_coupling = sparse.csc_matrix(gmat, dtype=np.complex_)
         hamiltonian_mat += sparse.kron(
             zeropi_coupling, op.annihilation_sparse(zeta_dim)
         ) + sparse.kron(zeropi_coupling.conjugate().T, op.creation_sparse(zeta_dim))
@@ -375,14 +372,8 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
         if zeropi_evecs is None:
             _, zeropi_evecs = self._zeropi.eigensys(evals_count=zeropi_dim)
 
-        op_eigen_basis = sparse.dia_matrix(
-            (zeropi_dim, zeropi_dim), dtype=np.complex_
-        )  # guaranteed to be zero?
-
         op_zeropi = spec_utils.get_matrixelement_table(zeropi_operator, zeropi_evecs)
-        for n in range(zeropi_dim):
-            for m in range(zeropi_dim):
-                op_eigen_basis += op_zeropi[n, m] * op.hubbard_sparse(n, m, zeropi_dim)
+        op_eigen_basis = sparse.csc_matrix(op_zeropi, dtype=np.complex_)
 
         return sparse.kron(
             op_eigen_basis,
@@ -432,12 +423,8 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
     ) -> ndarray:
         if hamiltonian_mat is None:
             hamiltonian_mat = self.hamiltonian()
-        evals = sparse.linalg.eigsh(
-            hamiltonian_mat,
-            k=evals_count,
-            sigma=0.0,
-            which="LM",
-            return_eigenvectors=False,
+        evals = self._sparse_eigsh(
+            hamiltonian_mat, evals_count, return_eigenvectors=False
         )
         return np.sort(evals)
 
@@ -446,12 +433,8 @@ class FullZeroPi(base.QubitBaseClass, serializers.Serializable, NoisyFullZeroPi)
     ) -> Tuple[ndarray, ndarray]:
         if hamiltonian_mat is None:
             hamiltonian_mat = self.hamiltonian()
-        evals, evecs = sparse.linalg.eigsh(
-            hamiltonian_mat,
-            k=evals_count,
-            sigma=0.0,
-            which="LM",
-            return_eigenvectors=True,
+        evals, evecs = self._sparse_eigsh(
+            hamiltonian_mat, evals_count, return_eigenvectors=True
         )
         evals, evecs = spec_utils.order_eigensystem(evals, evecs)
         return evals, evecs
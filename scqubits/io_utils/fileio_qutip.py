@@ -30,14 +30,13 @@ class QutipEigenstates(np.ndarray, Serializable):
         qobj_dims = io_data.ndarrays["qobj_dims"]
         qobj_shape = io_data.ndarrays["qobj_shape"]
         evec_array = io_data.ndarrays["evecs"]
-        qt_eigenstates = np.asarray(
-            [
-                qt.Qobj(inpt=evec, dims=qobj_dims, shape=qobj_shape, type="ket")
-                for evec in evec_array
-            ],
-            dtype=np.dtype("O"),
-        )
-        return qt_eigenstates
+        # fill an object array element-wise, as numpy would otherwise unpack the kets
+        qt_eigenstates = np.empty(len(evec_array), dtype=np.dtype("O"))
+        for index, evec in enumerate(evec_array):
+            qt_eigenstates[index] = qt.Qobj(
+                inpt=evec, dims=qobj_dims.tolist(), shape=qobj_shape, type="ket"
+            )
+        return qt_eigenstates.view(cls)
 
     def serialize(self) -> IOData:
         """
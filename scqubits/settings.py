@@ -73,11 +73,42 @@ AUTORUN_SWEEP = True
 # enable/disable the CENTRAL_DISPATCH system
 DISPATCH_ENABLED = True
 
+# maximum number of operators memoized per qubit instance (0: disable operator caching);
+# cached operators are shared by all callers and must not be modified in place, and
+# they are discarded upon QUANTUMSYSTEM_UPDATE and GRID_UPDATE events
+OPERATOR_CACHE_SIZE = 0
+
+# memoize results of `eigenvals` and `eigensys` of qubits; cached eigensystems are
+# discarded upon QUANTUMSYSTEM_UPDATE and GRID_UPDATE events
+CACHE_EIGENSYSTEMS = False
+# memory budget (in bytes) for all cached eigensystems combined
+ESYS_CACHE_MEMORY_LIMIT = 2 ** 28
+
 # For parallel processing ----------------------------------------------------------------------------------------------
-# store processing pool once generated
+# most recently used processing pool (pools are managed and reused by utils.cpu_switch)
 POOL: Any = None
 # number of cores to be used by default in methods that enable parallel processing
 NUM_CPUS = 1
+# number of parameter values handed to a worker per task in parallel sweeps;
+# None: choose automatically (about four chunks per worker)
+CHUNKSIZE: Union[int, None] = None
+# continuation mode for sparse eigensolvers along parameter sweeps
+# Options:  None        (independent shift-invert eigsh call at every sweep point)
+#           'eigsh'     (shift-invert eigsh, warm-started from previous sweep point)
+#           'lobpcg'    (LOBPCG block-seeded by previous eigenvectors, eigsh fallback)
+SWEEP_CONTINUATION: Union[str, None] = None
+# memory budget (in bytes) for the stack of Hamiltonian matrices diagonalized at once
+# in batched parameter sweeps
+BATCH_MEMORY_LIMIT = 2 ** 27
+# composite Hilbert-space dimension from which HilbertSpace and ParameterSweep apply
+# the Hamiltonian matrix-free (as a LinearOperator) in eigsh instead of assembling it
+# as a sparse matrix; None: always assemble the matrix
+MATRIX_FREE_MIN_DIMENSION: Union[int, None] = None
+
+# assignment of dressed to bare states in SpectrumLookup
+# Options:  'argmax'     (each bare state maps to the dressed state of largest overlap)
+#           'hungarian'  (one-to-one assignment maximizing the total overlap)
+LOOKUP_ASSIGNMENT = "argmax"
 
 # Select multiprocessing library
 # Options:  'multiprocessing'
@@ -10,14 +10,21 @@
 #######################################################################################################################
 
 
+import json
 import os
+import platform
+import time
+import tracemalloc
 
 import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 import pytest
+import scipy
+import scipy.sparse
 
 import scqubits as scq
+import scqubits.core.qubit_base as qubit_base
 import scqubits.settings
 import scqubits.utils.plotting as plot
 
@@ -43,6 +50,157 @@ def pytest_addoption(parser):
         default="hdf5",
         help="Serializable file type to be used",
     )
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        default=False,
+        help="run the benchmarks (skipped otherwise)",
+    )
+    parser.addoption(
+        "--benchmark_rounds",
+        action="store",
+        default=3,
+        help="number of timed rounds per benchmark",
+    )
+    parser.addoption(
+        "--benchmark_file",
+        action="store",
+        default=None,
+        help="JSON file that benchmark results are written to",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "scq_benchmark: performance benchmark, only run with --benchmarks"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("benchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmarks only run with --benchmarks")
+    for item in items:
+        if item.get_closest_marker("scq_benchmark"):
+            item.add_marker(skip_benchmark)
+
+
+BENCHMARK_RESULTS = []
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not BENCHMARK_RESULTS:
+        return
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        "{:<80} {:>12} {:>12} {:>14}".format(
+            "name", "min [s]", "mean [s]", "peak mem [MB]"
+        )
+    )
+    for result in BENCHMARK_RESULTS:
+        terminalreporter.write_line(
+            "{:<80} {:>12.4g} {:>12.4g} {:>14.4g}".format(
+                result["name"][-80:],
+                result["stats"]["min"],
+                result["stats"]["mean"],
+                result["peak_memory"] / 2 ** 20,
+            )
+        )
+
+
+def pytest_sessionfinish(session):
+    filename = session.config.getoption("benchmark_file")
+    if not (filename and BENCHMARK_RESULTS):
+        return
+    machine_info = {
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "scqubits": getattr(scq, "__version__", None),
+        "datetime": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    with open(filename, "w") as json_file:
+        json.dump(
+            {"machine_info": machine_info, "benchmarks": BENCHMARK_RESULTS},
+            json_file,
+            indent=2,
+        )
+
+
+class BenchmarkFixture:
+    """Times a function in the style of pytest-benchmark: `scq_benchmark(func, *args,
+    **kwargs)` calls `func` for several rounds and returns the result of the last
+    call. In addition to wall-clock times, the peak of memory allocated during a
+    separate, traced call is recorded (via `tracemalloc`; this does not include
+    memory allocated by worker processes)."""
+
+    def __init__(self, name: str, params: dict, rounds: int):
+        self.name = name
+        self.params = params
+        self.rounds = rounds
+        self.extra_info = {}
+
+    def __call__(self, func, *args, **kwargs):
+        return self.pedantic(func, args=args, kwargs=kwargs)
+
+    def pedantic(self, target, args=(), kwargs=None, setup=None, rounds=None):
+        """Like `__call__`; `setup` is called before each round, outside of the
+        timed region (e.g., to clear caches)."""
+        kwargs = kwargs or {}
+        rounds = rounds or self.rounds
+        timings = []
+        for _ in range(rounds):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            result = target(*args, **kwargs)
+            timings.append(time.perf_counter() - start)
+
+        if setup is not None:
+            setup()
+        tracemalloc.start()
+        try:
+            target(*args, **kwargs)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        BENCHMARK_RESULTS.append(
+            {
+                "name": self.name,
+                "params": self.params,
+                "extra_info": self.extra_info,
+                "stats": {
+                    "min": min(timings),
+                    "max": max(timings),
+                    "mean": float(np.mean(timings)),
+                    "median": float(np.median(timings)),
+                    "stddev": float(np.std(timings)),
+                    "rounds": rounds,
+                    "data": timings,
+                },
+                "peak_memory": peak_memory,
+            }
+        )
+        return result
+
+
+@pytest.fixture
+def scq_benchmark(request):
+    """Pytest fixture providing a `BenchmarkFixture` for the requesting test; named
+    so as not to collide with the `benchmark` fixture of pytest-benchmark"""
+    callspec = getattr(request.node, "callspec", None)
+    params = (
+        {key: str(value) for key, value in callspec.params.items()} if callspec else {}
+    )
+    return BenchmarkFixture(
+        request.node.nodeid,
+        params,
+        int(request.config.getoption("benchmark_rounds")),
+    )
 
 
 @pytest.fixture(scope="session")
@@ -119,6 +277,45 @@ class BaseTest:
             np.abs(evecs_reference), np.abs(calculated_spectrum.state_table), atol=1e-07
         )
 
+    def get_spectrum_vs_paramvals_variant(self, io_type, **kwargs):
+        testname = self.file_str + "_4." + io_type
+        specdata = SpectrumData.create_from_file(DATADIR + testname)
+        self.qbt = self.qbt_type(**specdata.system_params)
+        evals_count = len(specdata.energy_table[0])
+        calculated_spectrum = self.qbt.get_spectrum_vs_paramvals(
+            self.param_name,
+            specdata.param_vals,
+            evals_count=evals_count,
+            get_eigenstates=True,
+            **kwargs,
+        )
+        assert np.allclose(specdata.energy_table, calculated_spectrum.energy_table)
+        assert np.allclose(
+            np.abs(specdata.state_table),
+            np.abs(calculated_spectrum.state_table),
+            atol=1e-07,
+        )
+
+    def get_matelements_vs_paramvals_variant(self, io_type, **kwargs):
+        testname = self.file_str + "_1." + io_type
+        specdata = SpectrumData.create_from_file(DATADIR + testname)
+        self.qbt = self.qbt_type(**specdata.system_params)
+        param_count = len(self.param_list)
+        param_vals = self.param_list[[param_count // 3, 2 * param_count // 3]]
+        calculated_data = self.qbt.get_matelements_vs_paramvals(
+            self.op1_str, self.param_name, param_vals, evals_count=4, **kwargs
+        )
+        for index, paramval in enumerate(param_vals):
+            setattr(self.qbt, self.param_name, paramval)
+            matelem_reference = self.qbt.matrixelement_table(
+                self.op1_str, evals_count=4
+            )
+            assert np.allclose(
+                np.abs(matelem_reference),
+                np.abs(calculated_data.matrixelem_table[index]),
+                atol=1e-07,
+            )
+
     def matrixelement_table(self, io_type, op, matelem_reference):
         evals_count = len(matelem_reference)
         calculated_matrix = self.qbt.matrixelement_table(
@@ -174,6 +371,45 @@ class StandardTests(BaseTest):
         hamiltonian = self.qbt.hamiltonian()
         assert np.isclose(np.max(np.abs(hamiltonian - hamiltonian.conj().T)), 0.0)
 
+    def test_hamiltonian_decomposition(self, io_type):
+        testname = self.file_str + "_1." + io_type
+        specdata = SpectrumData.create_from_file(DATADIR + testname)
+        self.qbt = self.qbt_type(**specdata.system_params)
+        decomposition = self.qbt.hamiltonian_decomposition(self.param_name)
+        if decomposition is None:
+            pytest.skip("No Hamiltonian decomposition for this parameter.")
+        paramval = self.param_list[len(self.param_list) // 3]
+        setattr(self.qbt, self.param_name, paramval)
+        difference = self.qbt.hamiltonian() - decomposition.evaluate(paramval)
+        assert np.isclose(np.max(np.abs(difference)), 0.0)
+
+    def test_operator_in_place(self, io_type):
+        testname = self.file_str + "_1." + io_type
+        specdata = SpectrumData.create_from_file(DATADIR + testname)
+        self.qbt = self.qbt_type(**specdata.system_params)
+        operator = getattr(self.qbt, self.op1_str)()
+        operator *= 2
+        difference = getattr(self.qbt, self.op1_str)() * 2 - operator
+        assert np.isclose(np.max(np.abs(difference)), 0.0)
+
+    def test_operator_cache(self, io_type, monkeypatch):
+        monkeypatch.setattr(scqubits.settings, "OPERATOR_CACHE_SIZE", 32)
+        testname = self.file_str + "_1." + io_type
+        specdata = SpectrumData.create_from_file(DATADIR + testname)
+        self.qbt = self.qbt_type(**specdata.system_params)
+        operator = getattr(self.qbt, self.op1_str)()
+        if not qubit_base._OPERATOR_CACHE.get(self.qbt):
+            pytest.skip("Operator is not cached.")
+        assert getattr(self.qbt, self.op1_str)() is operator
+        if not scipy.sparse.issparse(operator):
+            assert not operator.flags.writeable
+        setattr(self.qbt, self.param_name, self.param_list[len(self.param_list) // 3])
+        assert getattr(self.qbt, self.op1_str)() is not operator
+        cached_operator = getattr(self.qbt, self.op1_str)()
+        self.qbt.clear_operator_cache()
+        difference = cached_operator - getattr(self.qbt, self.op1_str)()
+        assert np.isclose(np.max(np.abs(difference)), 0.0)
+
     def test_eigenvals(self, io_type):
         testname = self.file_str + "_1." + io_type
         specdata = SpectrumData.create_from_file(DATADIR + testname)
@@ -224,6 +460,9 @@ class StandardTests(BaseTest):
         matelem_reference = specdata.matrixelem_table
         return self.matrixelement_table(io_type, self.op1_str, matelem_reference)
 
+    def test_get_matelements_vs_paramvals(self, num_cpus, io_type):
+        self.get_matelements_vs_paramvals_variant(io_type, num_cpus=num_cpus)
+
     def test_plot_matrixelements(self, io_type):
         testname = self.file_str + "_1." + io_type
         specdata = SpectrumData.create_from_file(DATADIR + testname)
@@ -0,0 +1,225 @@
+# test_benchmarks.py
+# meant to be run with 'pytest --benchmarks'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019 and later, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+"""Performance benchmarks for the qubit classes covered by the standard tests.
+
+Benchmarks are skipped unless pytest is invoked with `--benchmarks`. Results
+(wall-clock times and peaks of traced memory) are summarized at the end of the run,
+and written to a JSON file with `--benchmark_file=<filename>`, e.g.::
+
+    pytest scqubits/tests/test_benchmarks.py --benchmarks --benchmark_file=bench.json
+"""
+
+import numpy as np
+import pytest
+import scipy.sparse
+
+import scqubits as scq
+
+from scqubits.core.storage import SpectrumData
+
+pytestmark = pytest.mark.scq_benchmark
+
+# For each qubit class: the parameter setting the Hilbert-space size and the sizes
+# to be benchmarked, the swept parameter, and an operator for matrix elements.
+QUBIT_CASES = {
+    "Transmon": dict(
+        size_param="ncut", sizes=[30, 150], param_name="ng", operator="n_operator"
+    ),
+    "Fluxonium": dict(
+        size_param="cutoff",
+        sizes=[110, 300],
+        param_name="flux",
+        operator="n_operator",
+    ),
+    "FluxQubit": dict(
+        size_param="ncut", sizes=[5, 10], param_name="flux", operator="n_1_operator"
+    ),
+    "ZeroPi": dict(
+        size_param="ncut",
+        sizes=[10, 30],
+        param_name="flux",
+        operator="n_theta_operator",
+    ),
+    "FullZeroPi": dict(
+        size_param="zeta_cutoff",
+        sizes=[10, 40],
+        param_name="flux",
+        operator="n_theta_operator",
+    ),
+    "Cos2PhiQubit": dict(
+        size_param="zeta_cut",
+        sizes=[10, 30],
+        param_name="flux",
+        operator="n_theta_operator",
+    ),
+}
+
+SWEEP_CPUS = [1, 2]
+PARAM_COUNT = 8
+EVALS_COUNT = 6
+
+
+def make_qubit(qubit_name, size):
+    case = QUBIT_CASES[qubit_name]
+    qubit_type = getattr(scq, qubit_name)
+    params = qubit_type.default_params()
+    if "ZeroPi" in qubit_name:
+        params["grid"] = scq.Grid1d(-19.0, 19.0, 200)
+    params[case["size_param"]] = size
+    return qubit_type(**params)
+
+
+@pytest.fixture(
+    params=[
+        (qubit_name, size)
+        for qubit_name, case in QUBIT_CASES.items()
+        for size in case["sizes"]
+    ],
+    ids=lambda qubit_case: "{}-{}".format(*qubit_case),
+)
+def qubit_case(request, scq_benchmark):
+    """Pytest fixture providing qubit, swept parameter, parameter values and
+    operator name for each qubit class and Hilbert-space size"""
+    qubit_name, size = request.param
+    case = QUBIT_CASES[qubit_name]
+    qubit = make_qubit(qubit_name, size)
+    scq_benchmark.extra_info["hilbertdim"] = qubit.hilbertdim()
+    param_vals = np.linspace(0.0, 0.5, PARAM_COUNT)
+    return qubit, case["param_name"], param_vals, case["operator"]
+
+
+def test_eigenvals(scq_benchmark, qubit_case):
+    qubit, *_ = qubit_case
+    scq_benchmark.pedantic(
+        qubit.eigenvals,
+        kwargs=dict(evals_count=EVALS_COUNT),
+        setup=qubit.clear_operator_cache,
+    )
+
+
+def test_eigensys(scq_benchmark, qubit_case):
+    qubit, *_ = qubit_case
+    scq_benchmark.pedantic(
+        qubit.eigensys,
+        kwargs=dict(evals_count=EVALS_COUNT),
+        setup=qubit.clear_operator_cache,
+    )
+
+
+@pytest.mark.parametrize("sweep_cpus", SWEEP_CPUS)
+def test_spectrum_vs_paramvals(scq_benchmark, qubit_case, sweep_cpus):
+    qubit, param_name, param_vals, _ = qubit_case
+    scq_benchmark(
+        qubit.get_spectrum_vs_paramvals,
+        param_name,
+        param_vals,
+        evals_count=EVALS_COUNT,
+        get_eigenstates=True,
+        num_cpus=sweep_cpus,
+    )
+
+
+def test_matrixelement_table(scq_benchmark, qubit_case):
+    qubit, _, _, operator = qubit_case
+    esys = qubit.eigensys(evals_count=EVALS_COUNT)
+    scq_benchmark.pedantic(
+        qubit.matrixelement_table,
+        args=(operator,),
+        kwargs=dict(evecs=esys[1], evals_count=EVALS_COUNT),
+        setup=qubit.clear_operator_cache,
+    )
+
+
+@pytest.mark.parametrize("sweep_cpus", SWEEP_CPUS)
+def test_matelements_vs_paramvals(scq_benchmark, qubit_case, sweep_cpus):
+    qubit, param_name, param_vals, operator = qubit_case
+    scq_benchmark(
+        qubit.get_matelements_vs_paramvals,
+        operator,
+        param_name,
+        param_vals,
+        evals_count=EVALS_COUNT,
+        num_cpus=sweep_cpus,
+    )
+
+
+@pytest.mark.parametrize("sweep_cpus", SWEEP_CPUS)
+def test_noise_sweep(scq_benchmark, qubit_case, sweep_cpus):
+    qubit, param_name, param_vals, _ = qubit_case
+    noise_channels = [
+        channel
+        for channel in qubit.supported_noise_channels()
+        if hasattr(qubit, channel)
+    ]
+    scq_benchmark(
+        qubit.coherence_vs_paramvals,
+        param_name,
+        param_vals,
+        noise_channels=noise_channels,
+        num_cpus=sweep_cpus,
+    )
+
+
+@pytest.mark.parametrize("sweep_cpus", SWEEP_CPUS)
+def test_effective_rates_sweep(scq_benchmark, qubit_case, sweep_cpus):
+    qubit, param_name, param_vals, _ = qubit_case
+    noise_channels = [
+        channel
+        for channel in qubit.effective_noise_channels()
+        if hasattr(qubit, channel)
+    ]
+    scq_benchmark(
+        qubit.effective_rates_vs_paramvals,
+        param_name,
+        param_vals,
+        noise_channels=noise_channels,
+        num_cpus=sweep_cpus,
+    )
+
+
+def test_spectrum_lookup(scq_benchmark, qubit_case):
+    qubit, _, _, operator = qubit_case
+    qubit.truncated_dim = EVALS_COUNT
+    oscillator = scq.Oscillator(E_osc=5.0, truncated_dim=6)
+    # interaction terms accept dense and csc operators only
+    qubit_op = getattr(qubit, operator)()
+    if scipy.sparse.issparse(qubit_op):
+        qubit_op = qubit_op.tocsc()
+    hilbertspace = scq.HilbertSpace([qubit, oscillator])
+    hilbertspace.interaction_list = [
+        scq.InteractionTerm(
+            g_strength=0.1,
+            op1=qubit_op,
+            subsys1=qubit,
+            op2=oscillator.creation_operator() + oscillator.annihilation_operator(),
+            subsys2=oscillator,
+        )
+    ]
+    scq_benchmark(hilbertspace.generate_lookup)
+
+
+def test_hdf5_roundtrip(scq_benchmark, qubit_case, tmpdir):
+    qubit, param_name, param_vals, _ = qubit_case
+    specdata = qubit.get_spectrum_vs_paramvals(
+        param_name, param_vals, evals_count=EVALS_COUNT, get_eigenstates=True
+    )
+    qubit_file = str(tmpdir.join("qubit.h5"))
+    specdata_file = str(tmpdir.join("specdata.h5"))
+
+    def roundtrip():
+        qubit.filewrite(qubit_file)
+        specdata.filewrite(specdata_file)
+        return scq.read(qubit_file), SpectrumData.create_from_file(specdata_file)
+
+    qubit_copy, specdata_copy = scq_benchmark(roundtrip)
+    assert qubit_copy == qubit
+    assert np.allclose(specdata_copy.energy_table, specdata.energy_table)
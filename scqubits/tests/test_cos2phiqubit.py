@@ -14,6 +14,8 @@
 import numpy as np
 import pytest
 
+import scqubits.settings as settings
+
 from scqubits import Cos2PhiQubit
 from scqubits.tests.conftest import StandardTests
 
@@ -29,3 +31,10 @@ class TestCos2PhiQubit(StandardTests):
         cls.op2_str = "zeta_operator"
         cls.param_name = "flux"
         cls.param_list = np.linspace(0, 0.5, 5)
+
+    def test_get_spectrum_vs_paramvals_continuation(self, io_type):
+        settings.SWEEP_CONTINUATION = "eigsh"
+        try:
+            self.get_spectrum_vs_paramvals_variant(io_type)
+        finally:
+            settings.SWEEP_CONTINUATION = None
@@ -0,0 +1,109 @@
+# test_cpu_switch.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019 and later, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import tempfile
+import time
+
+import numpy as np
+
+import scqubits.settings as settings
+
+from scqubits import Transmon
+from scqubits.utils import cpu_switch
+
+
+class TestCpuSwitch:
+    def test_serial_map(self):
+        assert cpu_switch.get_map_method(1) is map
+
+    def test_pool_reuse(self):
+        with cpu_switch.pool_scope():
+            pool = cpu_switch.get_pool(2)
+            assert cpu_switch.get_pool(2) is pool
+            assert settings.POOL is pool
+        assert settings.POOL is None
+        assert not cpu_switch._POOLS
+
+    def test_sweep_with_pool(self):
+        qubit = Transmon(EJ=30.0, EC=1.2, ng=0.3, ncut=15)
+        ng_vals = np.linspace(0.0, 1.0, 5)
+        specdata_serial = qubit.get_spectrum_vs_paramvals("ng", ng_vals, num_cpus=1)
+        specdata_parallel = qubit.get_spectrum_vs_paramvals("ng", ng_vals, num_cpus=2)
+        pool = settings.POOL
+        qubit.get_spectrum_vs_paramvals("ng", ng_vals, num_cpus=2)
+        assert settings.POOL is pool
+        cpu_switch.close_pools()
+        assert settings.POOL is None
+        assert np.allclose(specdata_serial.energy_table, specdata_parallel.energy_table)
+
+    def test_imap_ordered_chunks(self):
+        values = list(range(23))
+        with cpu_switch.pool_scope():
+            result = list(cpu_switch.imap_ordered(abs, values, 2, chunksize=4))
+        assert result == values
+        assert list(cpu_switch.imap_ordered(abs, values, 1)) == values
+
+    def test_imap_ordered_payload(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        values = list(range(10))
+        tasks = []
+        with cpu_switch.pool_scope():
+            pool = cpu_switch.get_pool(2)
+            pool_imap = pool.imap
+
+            def recording_imap(func, task_list):
+                if isinstance(func, cpu_switch._ChunkEvaluator):
+                    tasks.extend(task_list)
+                return pool_imap(func, task_list)
+
+            monkeypatch.setattr(pool, "imap", recording_imap)
+            result = list(cpu_switch.imap_ordered(abs, values, 2, chunksize=1))
+        assert result == values
+        # tasks only reference the serialized function, which is removed afterwards
+        assert len(tasks) == len(values)
+        assert not any(isinstance(entry, bytes) for task in tasks for entry in task)
+        assert not list(tmp_path.iterdir())
+
+    def test_imap_ordered_releases_function(self):
+        values = list(range(10))
+        with cpu_switch.pool_scope():
+            result = list(cpu_switch.imap_ordered(abs, values, 2, chunksize=1))
+            worker_tokens = cpu_switch.get_pool(2).map(_worker_token, range(20))
+        assert result == values
+        assert worker_tokens == [None] * 20
+
+    def test_imap_ordered_early_exit(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        values = list(range(80))
+        with cpu_switch.pool_scope():
+            start = time.monotonic()
+            results = cpu_switch.imap_ordered(_slow_identity, values, 2, chunksize=1)
+            assert [next(results), next(results)] == [0, 1]
+            results.close()
+            # outstanding chunks are skipped rather than evaluated
+            assert time.monotonic() - start < 0.05 * len(values) / 4
+            assert not list(tmp_path.iterdir())
+            assert list(cpu_switch.imap_ordered(abs, values, 2)) == values
+
+
+def _slow_identity(value):
+    import time
+
+    time.sleep(0.05)
+    return value
+
+
+def _worker_token(_):
+    # imported here, so that the worker's own module state is inspected
+    from scqubits.utils import cpu_switch as worker_cpu_switch
+
+    return worker_cpu_switch._WORKER_FUNCTION[0]
@@ -11,6 +11,9 @@
 ############################################################################
 
 import numpy as np
+import pytest
+
+import scqubits.settings as settings
 
 from scqubits import Fluxonium
 from scqubits.tests.conftest import StandardTests
@@ -26,3 +29,87 @@ class TestFluxonium(StandardTests):
         cls.op2_str = "phi_operator"
         cls.param_name = "flux"
         cls.param_list = np.linspace(0.45, 0.55, 50)
+
+    def test_get_spectrum_vs_paramvals_batched(self, io_type):
+        self.get_spectrum_vs_paramvals_variant(io_type, batched=True)
+
+    def test_get_matelements_vs_paramvals_batched(self, io_type):
+        self.get_matelements_vs_paramvals_variant(io_type, batched=True)
+
+    def test_eigensystem_cache(self):
+        qbt = Fluxonium.create()
+        settings.CACHE_EIGENSYSTEMS = True
+        try:
+            evals, evecs = qbt.eigensys(evals_count=8)
+            assert np.allclose(qbt.eigenvals(evals_count=5), evals[:5])
+            evals_small, evecs_small = qbt.eigensys(evals_count=3)
+            assert np.allclose(evecs_small, evecs[:, :3])
+            qbt.flux = 0.3
+            evals_cached = qbt.eigenvals(evals_count=5)
+            settings.CACHE_EIGENSYSTEMS = False
+            assert np.allclose(evals_cached, qbt.eigenvals(evals_count=5))
+        finally:
+            settings.CACHE_EIGENSYSTEMS = False
+
+    @pytest.mark.parametrize(
+        "method",
+        [
+            "get_spectrum_vs_paramvals",
+            "get_spectrum_vs_paramvals_interpolated",
+            "get_matelements_vs_paramvals",
+        ],
+    )
+    def test_sweep_restores_state_on_error(self, method):
+        qbt = Fluxonium(EJ=8.9, EC=2.5, EL=0.5, flux=0.33, cutoff=20)
+        reference = Fluxonium(EJ=8.9, EC=2.5, EL=0.5, flux=0.33, cutoff=20)
+        args = ("n_operator",) if method == "get_matelements_vs_paramvals" else ()
+        with pytest.raises(ValueError):
+            getattr(qbt, method)(
+                *args, "flux", np.linspace(0.0, 0.5, 3), evals_count=50
+            )
+        assert "_sweep" not in qbt.__dict__
+        assert qbt.flux == 0.33
+        assert qbt == reference
+
+    def test_paramgrid_restores_state_on_error(self):
+        qbt = Fluxonium(EJ=8.9, EC=2.5, EL=0.5, flux=0.33, cutoff=20)
+        param_grid = {"flux": np.linspace(0.0, 0.5, 3), "EL": np.array([0.5, 0.6])}
+        with pytest.raises(ValueError):
+            qbt.get_spectrum_vs_paramgrid(param_grid, evals_count=50)
+        assert "_sweep" not in qbt.__dict__
+        assert (qbt.flux, qbt.EL) == (0.33, 0.5)
+
+    def test_hamiltonian_decomposition_restores_dispatch(self, monkeypatch):
+        qbt = Fluxonium(EJ=8.9, EC=2.5, EL=0.5, flux=0.33, cutoff=20)
+
+        def failing_hamiltonian():
+            raise RuntimeError
+
+        monkeypatch.setattr(qbt, "hamiltonian", failing_hamiltonian)
+        with pytest.raises(RuntimeError):
+            qbt.hamiltonian_decomposition("flux")
+        assert settings.DISPATCH_ENABLED
+        assert qbt.flux == 0.33
+
+    @pytest.mark.parametrize("second_order", [False, True])
+    def test_get_spectrum_vs_paramvals_interpolated(self, num_cpus, second_order):
+        qbt = Fluxonium(EJ=8.9, EC=2.5, EL=0.5, flux=0.43, cutoff=110)
+        flux_vals = np.linspace(0.3, 0.7, 2001)
+        specdata = qbt.get_spectrum_vs_paramvals_interpolated(
+            "flux",
+            flux_vals,
+            evals_count=4,
+            tol=1e-5,
+            second_order=second_order,
+            num_cpus=num_cpus,
+        )
+        assert len(specdata.anchor_indices) < 100
+        assert np.all(specdata.error_estimate[specdata.anchor_indices] == 0.0)
+        assert specdata.error_estimate.max() <= 1e-5
+        reference = qbt.get_spectrum_vs_paramvals(
+            "flux", flux_vals[::40], evals_count=4, num_cpus=num_cpus
+        )
+        assert np.allclose(
+            specdata.energy_table[::40], reference.energy_table, rtol=0, atol=2e-5
+        )
+        assert qbt.flux == 0.43
@@ -26,3 +26,9 @@ class TestFluxQubit(StandardTests):
         cls.op2_str = "n_2_operator"
         cls.param_name = "flux"
         cls.param_list = np.linspace(0.45, 0.55, 50)
+
+    def test_get_spectrum_vs_paramvals_batched(self, io_type):
+        self.get_spectrum_vs_paramvals_variant(io_type, batched=True)
+
+    def test_get_matelements_vs_paramvals_batched(self, io_type):
+        self.get_matelements_vs_paramvals_variant(io_type, batched=True)
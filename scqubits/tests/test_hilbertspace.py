@@ -10,10 +10,17 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
+import os
+import shutil
+
+import h5py
 import numpy as np
 import pytest
+import qutip as qt
 
 import scqubits as scq
+import scqubits.utils.cpu_switch as cpu_switch
+import scqubits.utils.spectrum_utils as spec_utils
 
 from scqubits.core.hilbert_space import HilbertSpace, InteractionTerm
 from scqubits.core.param_sweep import ParameterSweep
@@ -362,6 +369,49 @@ class TestHilbertSpace:
         )
         assert np.allclose(evals, evals_reference)
 
+    def test_HilbertSpace_identity_wrap_matches_tensor(self):
+        hilbertspace = self.hilbertspace_initialize()
+        [transmon1, transmon2, resonator] = hilbertspace
+        operator = resonator.annihilation_operator()
+        wrapped = hilbertspace.identity_wrap(operator, resonator, op_in_eigenbasis=True)
+        reference = qt.tensor(
+            qt.qeye(transmon1.truncated_dim),
+            qt.qeye(transmon2.truncated_dim),
+            qt.Qobj(operator),
+        )
+        assert wrapped.dims == reference.dims
+        assert np.allclose(wrapped.full(), reference.full())
+
+    def test_HilbertSpace_sparse_eigensolver(self):
+        hilbertspace = self.hilbertspace_initialize()
+        # exceed the dimension up to which dense diagonalization is used
+        hilbertspace[0].truncated_dim = 12
+        hilbertspace[1].truncated_dim = 10
+        evals_reference = np.linalg.eigvalsh(hilbertspace.hamiltonian().full())[:8]
+        evals, evecs = hilbertspace.eigensys(evals_count=8)
+        assert np.allclose(evals, evals_reference)
+        assert np.allclose(hilbertspace.eigenvals(evals_count=8), evals_reference)
+        assert evecs[0].dims == [hilbertspace.subsystem_dims, [1, 1, 1]]
+
+    def test_HilbertSpace_matrix_free_hamiltonian(self):
+        hilbertspace = self.hilbertspace_initialize()
+        hamiltonian = hilbertspace.hamiltonian().full()
+        operator = hilbertspace.hamiltonian_linear_operator()
+        vectors = np.random.default_rng(42).random((hilbertspace.dimension, 2))
+        assert np.allclose(operator @ vectors, hamiltonian @ vectors)
+        assert np.allclose(operator @ vectors[:, 0], hamiltonian @ vectors[:, 0])
+
+        evals_reference = np.linalg.eigvalsh(hamiltonian)[:6]
+        scq.settings.MATRIX_FREE_MIN_DIMENSION = 1
+        try:
+            evals, evecs = hilbertspace.eigensys(evals_count=6)
+        finally:
+            scq.settings.MATRIX_FREE_MIN_DIMENSION = None
+        assert np.allclose(evals, evals_reference)
+        for evec, energy in zip(evecs, evals):
+            state = evec.full()[:, 0]
+            assert np.allclose(hamiltonian @ state, energy * state)
+
     def test_HilbertSpace_fileIO(self):
         hilbertspc = self.hilbertspace_initialize_2()
         hilbertspc.generate_lookup()
@@ -473,3 +523,184 @@ class TestParameterSweep:
         sweep = self.initialize(num_cpus)
         sweep.filewrite(self.tmpdir + "test.h5")
         sweep_copy = scq.read(self.tmpdir + "test.h5")
+
+    def test_ParameterSweep_static_interaction_ops(self, num_cpus):
+        sweep = self.initialize(num_cpus)
+        # interaction2 only couples static subsystems and is precomputed in full
+        assert list(sweep._interaction_ops_constant) == [0]
+        op_cpb1, op_resonator = sweep._interaction_ops_constant[0]
+        assert op_cpb1 is None and op_resonator is not None
+
+        param_index = 7
+        sweep.update_hilbertspace(sweep.param_vals[param_index])
+        assert np.allclose(
+            sweep.dressed_specdata.energy_table[param_index],
+            sweep._hilbertspace.eigenvals(evals_count=sweep.evals_count),
+        )
+
+    def test_ParameterSweep_adaptive_refinement(self, num_cpus):
+        sweep = self.initialize(num_cpus)
+        adaptive_sweep = ParameterSweep(
+            param_name=sweep.param_name,
+            param_vals=np.linspace(-0.1, 0.6, 11),
+            evals_count=sweep.evals_count,
+            hilbertspace=sweep._hilbertspace,
+            subsys_update_list=sweep.subsys_update_list,
+            update_hilbertspace=sweep.update_hilbertspace,
+            num_cpus=num_cpus,
+            refine_tol=1e-2,
+            max_points=60,
+        )
+        param_vals = adaptive_sweep.param_vals
+        assert 11 < len(param_vals) <= 60
+        assert np.all(np.diff(param_vals) > 0)
+        # repeated runs refine the initial coarse grid again
+        adaptive_sweep.max_points = 30
+        adaptive_sweep.run()
+        assert 11 < len(adaptive_sweep.param_vals) <= 30
+        assert np.isin(np.linspace(-0.1, 0.6, 11), adaptive_sweep.param_vals).all()
+        adaptive_sweep.max_points = 60
+        adaptive_sweep.run()
+        assert np.array_equal(adaptive_sweep.param_vals, param_vals)
+        reference_sweep = ParameterSweep(
+            param_name=sweep.param_name,
+            param_vals=param_vals,
+            evals_count=sweep.evals_count,
+            hilbertspace=sweep._hilbertspace,
+            subsys_update_list=sweep.subsys_update_list,
+            update_hilbertspace=sweep.update_hilbertspace,
+            num_cpus=num_cpus,
+        )
+        assert np.allclose(
+            adaptive_sweep.dressed_specdata.energy_table,
+            reference_sweep.dressed_specdata.energy_table,
+        )
+        assert np.array_equal(
+            adaptive_sweep.lookup._dressed_indices,
+            reference_sweep.lookup._dressed_indices,
+        )
+
+    def test_ParameterSweep_grid(self, num_cpus):
+        sweep = self.initialize(num_cpus)
+        CPB1, CPB2, _ = sweep._hilbertspace
+        flux_vals = np.linspace(-0.1, 0.6, 5)
+        ng_vals = np.array([0.0, 0.2, 0.4])
+
+        def update_hilbertspace(flux, ng):
+            CPB1.EJ = 40.0 * np.cos(np.pi * flux)
+            CPB2.ng = ng
+
+        grid_sweep = ParameterSweep(
+            param_name=["flux", "ng"],
+            param_vals=[flux_vals, ng_vals],
+            evals_count=sweep.evals_count,
+            hilbertspace=sweep._hilbertspace,
+            subsys_update_list=[CPB1, CPB2],
+            update_hilbertspace=update_hilbertspace,
+            num_cpus=num_cpus,
+        )
+        assert grid_sweep.param_count == 15
+        assert grid_sweep.grid_shape == (5, 3)
+        assert grid_sweep.param_index((3, 1)) == 10
+        energies = grid_sweep.reshape_to_grid(grid_sweep.dressed_specdata.energy_table)
+        for ng_index, ng in enumerate(ng_vals):
+            reference_sweep = ParameterSweep(
+                param_name="flux",
+                param_vals=flux_vals,
+                evals_count=sweep.evals_count,
+                hilbertspace=sweep._hilbertspace,
+                subsys_update_list=[CPB1, CPB2],
+                update_hilbertspace=lambda flux: update_hilbertspace(flux, ng),
+                num_cpus=num_cpus,
+            )
+            assert np.allclose(
+                energies[:, ng_index], reference_sweep.dressed_specdata.energy_table
+            )
+            assert np.array_equal(
+                grid_sweep.reshape_to_grid(grid_sweep.lookup._dressed_indices)[
+                    :, ng_index
+                ],
+                reference_sweep.lookup._dressed_indices,
+            )
+        diffspec = generate_diffspec_sweep(grid_sweep)
+        assert diffspec.energy_table.shape == (5, 3, sweep.evals_count)
+
+    def test_ParameterSweep_checkpoint_resume(self, num_cpus):
+        sweep = self.initialize(num_cpus)
+        filename = self.tmpdir + "checkpoint.h5"
+        # worker pools started during the streamed run must not lock the file
+        cpu_switch.close_pools()
+        streamed_sweep = ParameterSweep(
+            param_name=sweep.param_name,
+            param_vals=sweep.param_vals,
+            evals_count=sweep.evals_count,
+            hilbertspace=sweep._hilbertspace,
+            subsys_update_list=sweep.subsys_update_list,
+            update_hilbertspace=sweep.update_hilbertspace,
+            num_cpus=num_cpus,
+            checkpoint_file=filename,
+        )
+        reference_energies = sweep.dressed_specdata.energy_table
+        assert np.allclose(
+            streamed_sweep.dressed_specdata.energy_table, reference_energies
+        )
+        assert np.array_equal(
+            streamed_sweep.lookup._dressed_indices, sweep.lookup._dressed_indices
+        )
+
+        # emulate an interrupted run, then resume it
+        with h5py.File(filename, "r+") as h5file:
+            h5file["completed"][50:] = False
+            h5file["__objects/_lookup/__objects/_dressed_specdata/energy_table"][
+                50:
+            ] = np.nan
+        partial_sweep = scq.read(filename)
+        assert partial_sweep.completed.sum() == 50
+        assert np.isnan(partial_sweep.dressed_specdata.energy_table[50:]).all()
+
+        streamed_sweep.run()
+        assert scq.read(filename).completed.all()
+        assert np.allclose(
+            streamed_sweep.dressed_specdata.energy_table, reference_energies
+        )
+
+        # eigenstates are read from the file upon access, rather than held in memory
+        state_table = streamed_sweep.dressed_specdata.state_table
+        assert not isinstance(state_table, (list, np.ndarray))
+        for param_index in (0, 37, -1):
+            assert np.allclose(
+                spec_utils.convert_esys_to_ndarray(state_table[param_index]),
+                spec_utils.convert_esys_to_ndarray(
+                    sweep.dressed_specdata.state_table[param_index]
+                ),
+            )
+        bare_state_table = streamed_sweep.bare_specdata_list[0].state_table
+        assert not isinstance(bare_state_table, np.ndarray)
+        assert np.allclose(
+            bare_state_table[37], sweep.bare_specdata_list[0].state_table[37]
+        )
+        copy_filename = self.tmpdir + "checkpoint_copy.h5"
+        shutil.copy(filename, copy_filename)
+        copied_sweep = ParameterSweep(
+            param_name=sweep.param_name,
+            param_vals=sweep.param_vals,
+            evals_count=sweep.evals_count,
+            hilbertspace=sweep._hilbertspace,
+            subsys_update_list=sweep.subsys_update_list,
+            update_hilbertspace=sweep.update_hilbertspace,
+            num_cpus=num_cpus,
+            checkpoint_file=copy_filename,
+        )
+        os.remove(copy_filename)
+        assert np.allclose(
+            copied_sweep.dressed_specdata.energy_table, reference_energies
+        )
+        with pytest.raises(OSError):
+            copied_sweep.dressed_specdata.state_table[0]
+
+        # resuming after a change of the Hilbert space is rejected
+        with h5py.File(filename, "r+") as h5file:
+            h5file["completed"][50:] = False
+        sweep._hilbertspace.interaction_list[0].g_strength = 0.15
+        with pytest.raises(ValueError, match="checkpoint"):
+            streamed_sweep.run()
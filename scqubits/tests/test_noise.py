@@ -11,8 +11,19 @@
 ############################################################################
 
 import numpy as np
+import pytest
 
-from scqubits import Fluxonium, FluxQubit, Grid1d, Transmon, TunableTransmon, ZeroPi
+import scqubits.core.noise as noise
+
+from scqubits import (
+    Cos2PhiQubit,
+    Fluxonium,
+    FluxQubit,
+    Grid1d,
+    Transmon,
+    TunableTransmon,
+    ZeroPi,
+)
 
 data = {
     "Transmon": np.array(
@@ -134,3 +145,191 @@ class TestNoise:
             ncut=30,
         )
         assert compare_coherence_to_reference(qubit, "ZeroPi")
+
+    @pytest.mark.parametrize("qubit_type", [Fluxonium, FluxQubit])
+    def test_coherence_vs_paramvals(self, qubit_type):
+        # FluxQubit defines its own critical-current noise channels
+        qubit = qubit_type.create()
+        qubit.flux = 0.3
+        flux_vals = np.linspace(0.25, 0.45, 5)
+        noise_channels = qubit.supported_noise_channels() + [
+            ("tphi_1_over_f_cc", dict(i=2, j=0))
+        ]
+        if "t1_capacitive" in noise_channels:
+            noise_channels.append(("t1_capacitive", dict(i=2, j=0, total=False)))
+        sweep_data = qubit.coherence_vs_paramvals("flux", flux_vals, noise_channels)
+        assert qubit.flux == 0.3
+        for dataname, noise_channel in zip(sweep_data._datanames, noise_channels):
+            if isinstance(noise_channel, tuple):
+                noise_channel, options = noise_channel
+            else:
+                options = {}
+            reference = []
+            for flux in flux_vals:
+                qubit.flux = flux
+                reference.append(getattr(qubit, noise_channel)(**options))
+            assert np.allclose(getattr(sweep_data, dataname), reference)
+
+    def test_coherence_vs_paramvals_nonmonotonic(self):
+        # operators at the first, middle and last point agree, but not in between
+        qubit = Fluxonium.create()
+        flux_vals = [0.2, 0.3, 0.2, 0.45, 0.2]
+        noise_channels = ["tphi_1_over_f_flux", "t1_flux_bias_line"]
+        sweep_data = qubit.coherence_vs_paramvals("flux", flux_vals, noise_channels)
+        for noise_channel in noise_channels:
+            reference = []
+            for flux in flux_vals:
+                qubit.flux = flux
+                reference.append(getattr(qubit, noise_channel)())
+            assert np.allclose(getattr(sweep_data, noise_channel), reference)
+
+    def test_coherence_vs_paramvals_builds_operators_per_distinct_point(
+        self, monkeypatch
+    ):
+        qubit = Fluxonium.create()
+        flux_vals = [0.2, 0.3, 0.2, 0.45, 0.2]
+        spectrum_data = qubit.get_spectrum_vs_paramvals(
+            "flux", flux_vals, evals_count=2, get_eigenstates=True
+        )
+        built_at = []
+        d_hamiltonian_d_flux = qubit.d_hamiltonian_d_flux
+
+        def counting_d_hamiltonian_d_flux():
+            built_at.append(qubit.flux)
+            return d_hamiltonian_d_flux()
+
+        monkeypatch.setattr(
+            qubit, "d_hamiltonian_d_flux", counting_d_hamiltonian_d_flux
+        )
+        qubit.coherence_vs_paramvals(
+            "flux", flux_vals, "t1_flux_bias_line", spectrum_data=spectrum_data
+        )
+        assert sorted(built_at) == [0.2, 0.3, 0.45]
+
+    def test_effective_rates_vs_paramgrid(self):
+        qubit = TunableTransmon(EJmax=20.0, EC=0.5, d=0.1, flux=0.04, ng=0.3, ncut=30)
+        flux_vals = np.linspace(0.0, 0.4, 3)
+        ng_vals = np.linspace(0.0, 0.5, 4)
+        rates = qubit.effective_rates_vs_paramgrid(
+            {"flux": flux_vals, "ng": ng_vals}, noise_type="t2"
+        )
+        t2_eff = 1 / sum(getattr(rates, name) for name in rates._datanames)
+        assert (qubit.flux, qubit.ng) == (0.04, 0.3)
+        for n1, flux in enumerate(flux_vals):
+            for n2, ng in enumerate(ng_vals):
+                qubit.flux, qubit.ng = flux, ng
+                assert np.isclose(t2_eff[n1, n2], qubit.t2_effective())
+
+        qubit.ng = 0.3
+        rates = qubit.effective_rates_vs_paramvals("flux", flux_vals, noise_type="t1")
+        t1_eff = 1 / sum(getattr(rates, name) for name in rates._datanames)
+        for flux, t1 in zip(flux_vals, t1_eff):
+            qubit.flux = flux
+            assert np.isclose(t1, qubit.t1_effective())
+
+    def test_effective_rates_vs_paramgrid_inner_axis(self):
+        # the noise operators depend on flux, the inner grid axis
+        qubit = TunableTransmon(EJmax=20.0, EC=0.5, d=0.1, flux=0.04, ng=0.3, ncut=30)
+        ng_vals = np.linspace(0.0, 0.5, 4)
+        flux_vals = np.array([0.1, 0.35])
+        for num_cpus in [1, 2]:
+            rates = qubit.effective_rates_vs_paramgrid(
+                {"ng": ng_vals, "flux": flux_vals}, num_cpus=num_cpus
+            )
+            t2_eff = 1 / sum(getattr(rates, name) for name in rates._datanames)
+            for n1, ng in enumerate(ng_vals):
+                for n2, flux in enumerate(flux_vals):
+                    qubit.ng, qubit.flux = ng, flux
+                    assert np.isclose(t2_eff[n1, n2], qubit.t2_effective())
+
+    def test_spectral_densities_vectorized(self):
+        omega = np.array([[-3.0, -1e-6, 1e-6], [0.5, 5.0, 50.0]])
+        T = np.array([[0.01], [0.02]])
+        channels = [
+            (noise._spectral_density_capacitive, dict(EC=1.0, Q_cap=None)),
+            (noise._spectral_density_inductive, dict(EL=0.5, Q_ind=None)),
+            (noise._spectral_density_charge_impedance, dict(Z=50)),
+            (noise._spectral_density_flux_bias_line, dict(M=400, Z=50)),
+            (
+                noise._spectral_density_quasiparticle_tunneling,
+                dict(EJ=10.0, Y_qp=None, x_qp=3e-6, Delta=3.4e-4),
+            ),
+        ]
+        for spectral_density, options in channels:
+            values = spectral_density(omega, T=T, **options)
+            for (n1, n2), omega_val in np.ndenumerate(omega):
+                assert np.isclose(
+                    values[n1, n2], spectral_density(omega_val, T=T[n1, 0], **options)
+                )
+
+        # omega -> 0: finite limits for ohmic baths, divergent thermal factor otherwise
+        for spectral_density, options in channels[2:4]:
+            assert np.isclose(
+                spectral_density(0.0, T=0.015, **options),
+                spectral_density(1e-9, T=0.015, **options),
+            )
+        assert noise._spectral_density_capacitive(0.0, EC=1.0, Q_cap=1e6, T=0.015) == (
+            np.inf
+        )
+
+    def test_t1_rate_matrix(self):
+        qubit = Fluxonium(EJ=8.9, EC=2.5, EL=0.5, cutoff=110, flux=0.3)
+        flux_vals = np.linspace(0.25, 0.45, 4)
+        for noise_channel in ["t1_capacitive", "t1_flux_bias_line"]:
+            rate_matrices = qubit.t1_rate_matrix_vs_paramvals(
+                noise_channel, "flux", flux_vals, evals_count=5, T=0.02
+            )
+            assert rate_matrices.shape == (4, 5, 5)
+            for flux, rate_matrix in zip(flux_vals, rate_matrices):
+                qubit.flux = flux
+                esys = qubit.eigensys(evals_count=5)
+                noise_op, spectral_density = getattr(
+                    qubit, "_{}_terms".format(noise_channel)
+                )(T=0.02)
+                assert np.allclose(
+                    rate_matrix,
+                    qubit.t1_rate_matrix(noise_op(), spectral_density, esys=esys),
+                )
+                for i in range(5):
+                    for j in range(5):
+                        if i == j:
+                            assert rate_matrix[i, j] == 0
+                            continue
+                        rate = getattr(qubit, noise_channel)(
+                            i=i, j=j, T=0.02, total=False, esys=esys, get_rate=True
+                        )
+                        assert np.isclose(rate_matrix[i, j], rate)
+
+    def test_t1_rate_matrix_nonmonotonic(self):
+        qubit = Fluxonium(EJ=8.9, EC=2.5, EL=0.5, cutoff=110, flux=0.3)
+        flux_vals = np.array([0.2, 0.3, 0.2, 0.45, 0.2])
+        rate_matrices = qubit.t1_rate_matrix_vs_paramvals(
+            "t1_flux_bias_line", "flux", flux_vals, evals_count=4, T=0.02
+        )
+        for flux, rate_matrix in zip(flux_vals, rate_matrices):
+            qubit.flux = flux
+            noise_op, spectral_density = qubit._t1_flux_bias_line_terms(T=0.02)
+            assert np.allclose(
+                rate_matrix,
+                qubit.t1_rate_matrix(
+                    noise_op(), spectral_density, esys=qubit.eigensys(evals_count=4)
+                ),
+            )
+
+    def test_t1_rate_matrix_subclass_channel(self):
+        # Cos2PhiQubit defines its own t1_purcell channel
+        params = Cos2PhiQubit.default_params()
+        params.update(ncut=5, zeta_cut=10, phi_cut=5)
+        qubit = Cos2PhiQubit(**params)
+        flux_vals = np.array([0.45, 0.5])
+        rate_matrices = qubit.t1_rate_matrix_vs_paramvals(
+            "t1_purcell", "flux", flux_vals, evals_count=3
+        )
+        for flux, rate_matrix in zip(flux_vals, rate_matrices):
+            qubit.flux = flux
+            esys = qubit.eigensys(evals_count=3)
+            assert rate_matrix[0, 0] == 0
+            assert np.isclose(
+                rate_matrix[1, 0],
+                qubit.t1_purcell(i=1, j=0, total=False, esys=esys, get_rate=True),
+            )
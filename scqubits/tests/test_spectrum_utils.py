@@ -0,0 +1,100 @@
+# test_spectrum_utils.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019 and later, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import numpy as np
+import qutip as qt
+
+from scipy import sparse
+
+import scqubits.utils.spectrum_utils as spec_utils
+
+
+class TestMatrixElementTable:
+    @classmethod
+    def setup_class(cls):
+        rng = np.random.default_rng(1234)
+        cls.dim = 20
+        cls.operator = rng.random((cls.dim, cls.dim)) + 1j * rng.random(
+            (cls.dim, cls.dim)
+        )
+        cls.states = np.linalg.qr(rng.random((cls.dim, 5)))[0]
+
+    def reference_table(self):
+        return np.asarray(
+            [
+                [
+                    spec_utils.matrix_element(state1, self.operator, state2)
+                    for state2 in self.states.T
+                ]
+                for state1 in self.states.T
+            ]
+        )
+
+    def test_dense_table(self):
+        table = spec_utils.get_matrixelement_table(self.operator, self.states)
+        assert np.allclose(table, self.reference_table())
+
+    def test_sparse_table(self):
+        for operator in [
+            sparse.csc_matrix(self.operator),
+            sparse.dia_matrix(self.operator),
+        ]:
+            table = spec_utils.get_matrixelement_table(operator, self.states)
+            assert np.allclose(table, self.reference_table())
+
+    def test_qobj_table(self):
+        kets = [qt.Qobj(state[:, np.newaxis]) for state in self.states.T]
+        table = spec_utils.get_matrixelement_table(qt.Qobj(self.operator), kets)
+        assert np.allclose(table, self.reference_table())
+
+    def test_table_stack(self):
+        state_tables = np.asarray([self.states, self.states[::-1]])
+        reference = [
+            spec_utils.get_matrixelement_table(self.operator, states)
+            for states in state_tables
+        ]
+        for operator in [self.operator, sparse.csc_matrix(self.operator)]:
+            tables = spec_utils.get_matrixelement_table_stack(operator, state_tables)
+            assert np.allclose(tables, reference)
+
+
+def test_refine_sweep_avoided_crossing():
+    def avoided_crossing(param_vals):
+        half_splitting = np.sqrt(param_vals ** 2 + 0.01 ** 2)
+        return list(np.asarray([-half_splitting, half_splitting]).T)
+
+    param_vals, energies = spec_utils.refine_sweep(
+        avoided_crossing, lambda evals: evals, np.linspace(-1.0, 1.03, 21), 1e-4
+    )
+    assert len(param_vals) < 210
+    fine_vals = np.linspace(-1.0, 1.03, 20001)
+    interpolated = np.interp(fine_vals, param_vals, np.asarray(energies)[:, 1])
+    exact = np.asarray(avoided_crossing(fine_vals))[:, 1]
+    assert np.max(np.abs(interpolated - exact)) < 1e-4
+
+
+def test_hermite_interpolation_error_estimate():
+    anchor_vals = np.linspace(0.0, 2.0, 9)
+    param_vals = np.linspace(0.0, 2.0, 2001)
+    derivatives = [
+        np.sin(3.0 * anchor_vals)[:, np.newaxis],
+        3.0 * np.cos(3.0 * anchor_vals)[:, np.newaxis],
+        -9.0 * np.sin(3.0 * anchor_vals)[:, np.newaxis],
+    ]
+    for order in [2, 3]:
+        energies, errors, interval_errors = spec_utils.hermite_interpolation(
+            anchor_vals, derivatives[:order], param_vals
+        )
+        true_errors = np.abs(energies[:, 0] - np.sin(3.0 * param_vals))
+        assert np.allclose(energies[::250, 0], np.sin(3.0 * anchor_vals))
+        assert np.all(true_errors <= 2.0 * errors + 1e-14)
+        assert np.isclose(errors.max(), interval_errors.max(), rtol=1e-3)
@@ -16,6 +16,10 @@ import scqubits as qubit
 
 from scqubits.core.hilbert_space import HilbertSpace, InteractionTerm
 from scqubits.core.param_sweep import ParameterSweep
+from scqubits.core.spec_lookup import (
+    as_dressed_index_array,
+    dressed_indices_from_overlaps,
+)
 
 
 class TestSpectrumLookup:
@@ -84,6 +88,34 @@ class TestSpectrumLookup:
         reference = 21
         assert hilbertspace.lookup.dressed_index((1, 2, 1)) == reference
 
+    def test_hilbertspace_lookup_round_trip(self):
+        hilbertspace = self.initialize_hilbertspace()
+        hilbertspace.generate_lookup()
+        lookup = hilbertspace.lookup
+        assert np.array_equal(lookup.dressed_index_vs_paramvals((1, 2, 1)), [21])
+        assert lookup.dressed_index((3, 0, 0)) is None
+        for dressed_index in range(hilbertspace.dimension):
+            bare_labels = lookup.bare_index(dressed_index)
+            if bare_labels is not None:
+                assert lookup.dressed_index(bare_labels) == dressed_index
+
+    def test_dressed_indices_from_overlaps(self):
+        overlaps = np.asarray([[[0.8, 0.7, 0.1], [0.6, 0.71, 0.2]]])
+        argmax_indices = dressed_indices_from_overlaps(overlaps, "argmax")
+        assert np.array_equal(argmax_indices, [[0, 1, -1]])
+        hungarian_indices = dressed_indices_from_overlaps(overlaps, "hungarian")
+        assert np.array_equal(hungarian_indices, [[0, 1, -1]])
+        overlaps = np.asarray([[[0.9, 0.8], [0.1, 0.6]]])
+        assert np.array_equal(dressed_indices_from_overlaps(overlaps), [[0, 0]])
+        hungarian_indices = dressed_indices_from_overlaps(overlaps, "hungarian")
+        assert np.array_equal(hungarian_indices, [[0, 1]])
+
+    def test_legacy_dressed_indices(self):
+        legacy_indices = [[0, None, 2], [1, 0, None]]
+        assert np.array_equal(
+            as_dressed_index_array(legacy_indices), [[0, -1, 2], [1, 0, -1]]
+        )
+
     def test_hilbertspace_lookup_bare_eigenstates(self):
         hilbertspace = self.initialize_hilbertspace()
         hilbertspace.generate_lookup()
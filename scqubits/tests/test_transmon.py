@@ -13,6 +13,8 @@
 import numpy as np
 import pytest
 
+import scqubits.utils.spectrum_utils as spec_utils
+
 from scqubits import Transmon
 from scqubits.tests.conftest import StandardTests
 
@@ -32,3 +34,61 @@ class TestTransmon(StandardTests):
     def test_plot_n_wavefunction(self):
         self.qbt = Transmon(EJ=1.0, EC=1.0, ng=0.0, ncut=10)
         self.qbt.plot_n_wavefunction(esys=None, which=1, mode="real")
+
+    def test_get_spectrum_vs_paramvals_batched(self, io_type):
+        self.get_spectrum_vs_paramvals_variant(io_type, batched=True)
+
+    def test_get_matelements_vs_paramvals_batched(self, io_type):
+        self.get_matelements_vs_paramvals_variant(io_type, batched=True)
+
+    def test_banded_eigensys(self):
+        self.qbt = Transmon(EJ=20.0, EC=0.5, ng=0.3, ncut=40)
+        evals, evecs = self.qbt.eigensys(evals_count=8)
+        evals_dense, evecs_dense = np.linalg.eigh(self.qbt.hamiltonian())
+        assert np.allclose(evals, evals_dense[:8])
+        assert np.allclose(np.abs(evecs), np.abs(evecs_dense[:, :8]))
+
+    def test_get_spectrum_vs_paramgrid(self, num_cpus):
+        self.qbt = Transmon(EJ=20.0, EC=0.3, ng=0.1, ncut=15)
+        EJ_vals = np.linspace(10.0, 20.0, 4)
+        ng_vals = np.linspace(0.0, 0.5, 3)
+        specdata = self.qbt.get_spectrum_vs_paramgrid(
+            {"EJ": EJ_vals, "ng": ng_vals},
+            evals_count=4,
+            get_eigenstates=True,
+            num_cpus=num_cpus,
+        )
+        assert specdata.energy_table.shape == (4, 3, 4)
+        assert specdata.state_table.shape == (4, 3, 31, 4)
+        assert specdata.param_count == 12
+        assert (self.qbt.EJ, self.qbt.ng) == (20.0, 0.1)
+        for EJ_index, EJ in enumerate(EJ_vals):
+            for ng_index, ng in enumerate(ng_vals):
+                evals = Transmon(EJ=EJ, EC=0.3, ng=ng, ncut=15).eigenvals(4)
+                assert np.allclose(specdata.energy_table[EJ_index, ng_index], evals)
+
+    def test_track_levels_through_crossings(self):
+        # for EJ=0, levels are charge-state parabolas crossing at half-integer ng
+        self.qbt = Transmon(EJ=0.0, EC=1.0, ng=0.0, ncut=10)
+        ng_vals = np.linspace(-0.23, 1.21, 37)
+        specdata = self.qbt.get_spectrum_vs_paramvals(
+            "ng", ng_vals, evals_count=6, get_eigenstates=True
+        )
+        tracked = specdata.track_levels()
+        for level, charge in enumerate([0, -1, 1]):
+            assert np.allclose(
+                tracked.energy_table[:, level], 4.0 * (charge - ng_vals) ** 2
+            )
+        assert np.allclose(
+            tracked.energy_table,
+            np.take_along_axis(specdata.energy_table, tracked.level_permutation, 1),
+        )
+
+        tracker = spec_utils.LevelTracker()
+        chunked_permutation = np.concatenate(
+            [
+                tracker.update(specdata.state_table[start : start + 10])
+                for start in range(0, len(ng_vals), 10)
+            ]
+        )
+        assert np.array_equal(chunked_permutation, tracked.level_permutation)
@@ -13,6 +13,7 @@
 import numpy as np
 
 import scqubits as scq
+import scqubits.settings as settings
 
 from scqubits import ZeroPi
 from scqubits.tests.conftest import StandardTests
@@ -29,3 +30,10 @@ class TestZeroPi(StandardTests):
         cls.op2_str = "i_d_dphi_operator"
         cls.param_name = "flux"
         cls.param_list = np.linspace(0, 0.5, 15)
+
+    def test_get_spectrum_vs_paramvals_continuation(self, io_type):
+        settings.SWEEP_CONTINUATION = "eigsh"
+        try:
+            self.get_spectrum_vs_paramvals_variant(io_type)
+        finally:
+            settings.SWEEP_CONTINUATION = None
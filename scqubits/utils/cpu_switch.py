@@ -9,15 +9,122 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
-from typing import Callable
+import atexit
+import math
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import uuid
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Union
 
 import scqubits.settings as settings
 
+# registry of worker pools, keyed by (multiprocessing backend, number of workers)
+_POOLS: Dict[Tuple[str, int], Any] = {}
+
+# worker-side cache: (sweep token, deserialized sweep function)
+_WORKER_FUNCTION: Tuple[Union[str, None], Union[Callable, None]] = (None, None)
+
+# maximum time (in s) that workers wait for each other when releasing the function of
+# a finished sweep
+_RELEASE_TIMEOUT = 1.0
+
+
+def _create_pool(backend: str, num_cpus: int) -> Any:
+    if backend == "pathos":
+        try:
+            import dill
+            import pathos
+        except ImportError:
+            raise ImportError(
+                "scqubits multiprocessing mode set to 'pathos'. Need but cannot find"
+                " 'pathos'/'dill'!"
+            )
+        else:
+            dill.settings["recurse"] = True
+            return pathos.pools.ProcessPool(nodes=num_cpus)
+    if backend == "multiprocessing":
+        import multiprocessing
+
+        return multiprocessing.Pool(processes=num_cpus)
+    raise ValueError(
+        "Unknown multiprocessing type: settings.MULTIPROC = {}".format(backend)
+    )
+
+
+def _shutdown_pool(pool: Any) -> None:
+    pool.close()
+    pool.join()
+    if hasattr(pool, "clear"):
+        # pathos: remove the pool from its internal cache
+        pool.clear()
+
+
+def get_pool(num_cpus: int) -> Any:
+    """
+    Returns a worker pool with `num_cpus` workers for the backend selected by
+    `settings.MULTIPROC`. Pools are created lazily on first request and reused by
+    all subsequent calls asking for the same backend and number of workers.
+
+    Parameters
+    ----------
+    num_cpus: int
+
+    Returns
+    -------
+    pathos.pools.ProcessPool or multiprocessing.Pool
+    """
+    key = (settings.MULTIPROC, num_cpus)
+    pool = _POOLS.get(key)
+    if pool is None:
+        pool = _create_pool(*key)
+        _POOLS[key] = pool
+    settings.POOL = pool
+    return pool
+
+
+def close_pools() -> None:
+    """Shuts down all worker pools currently managed by scqubits. New pools are
+    created on demand when parallel processing is requested again."""
+    while _POOLS:
+        _, pool = _POOLS.popitem()
+        _shutdown_pool(pool)
+    settings.POOL = None
+
+
+@contextmanager
+def pool_scope() -> Iterator[None]:
+    """Context manager limiting the lifetime of worker pools: all pools created
+    inside the `with` block are shut down when the block is left, while pools that
+    existed beforehand remain available.
+
+    Examples
+    --------
+    >>> with pool_scope():
+    ...     specdata = qubit.get_spectrum_vs_paramvals("flux", fluxvals, num_cpus=4)
+    """
+    keys_before = set(_POOLS)
+    try:
+        yield
+    finally:
+        for key in set(_POOLS) - keys_before:
+            _shutdown_pool(_POOLS.pop(key))
+        if settings.POOL is not None and settings.POOL not in _POOLS.values():
+            settings.POOL = None
+
+
+atexit.register(close_pools)
+
 
 def get_map_method(num_cpus: int) -> Callable:
     """
     Selects the correct `.map` method depending on the specified number of desired
-    cores. If num_cpus>1, the multiprocessing/pathos pool is started here.
+    cores. If num_cpus>1, the `.map` method of a managed multiprocessing/pathos
+    pool is returned; the pool is started on first use and reused afterwards.
 
     Parameters
     ----------
@@ -36,29 +143,144 @@ def get_map_method(num_cpus: int) -> Callable:
     # windows may require special treatment if sys.platform == 'win32' and
     # settings.POOL is None: warnings.warn("Windows users may explicitly need to
     # provide scqubits.settings.POOL.")
+    return get_pool(num_cpus).map
+
+
+def _get_serializer(backend: str) -> Any:
+    if backend == "pathos":
+        import dill
+
+        return dill
+    return pickle
+
+
+class _ChunkEvaluator:
+    """Worker-side evaluation of one chunk of parameter values. The serialized sweep
+    function is only read and deserialized once per worker and sweep, and cached
+    until the sweep is finished, see `_WorkerRelease`. (Implemented as a callable class, so that pathos/dill pickle it by
+    reference rather than by value together with the `settings` module.)"""
+
+    def __call__(self, task: Tuple[str, str, str, bool, List[Any]]) -> List[Any]:
+        global _WORKER_FUNCTION
+        token, backend, payload_path, dispatch_enabled, chunk = task
+        if os.path.exists(os.path.join(os.path.dirname(payload_path), "cancelled")):
+            # the consumer has stopped iterating, results are no longer needed
+            return []
+        # pools outlive individual sweeps, so mirror the caller's dispatch state
+        settings.DISPATCH_ENABLED = dispatch_enabled
+        if _WORKER_FUNCTION[0] != token:
+            with open(payload_path, "rb") as payload_file:
+                func = _get_serializer(backend).load(payload_file)
+            _WORKER_FUNCTION = (token, func)
+        func = _WORKER_FUNCTION[1]
+        return [func(value) for value in chunk]
 
-    # user is asking for more than 1 cpu; start pool from here
-    if settings.MULTIPROC == "pathos":
+
+class _WorkerRelease:
+    """Worker-side release of the cached function of a finished sweep. One release
+    task is issued per worker. Each task registers its worker in the payload
+    directory and waits until all workers have registered (or `_RELEASE_TIMEOUT` has
+    passed), so that no worker takes more than one task and every worker cache is
+    cleared."""
+
+    def __call__(self, task: Tuple[str, str, int]) -> None:
+        global _WORKER_FUNCTION
+        token, payload_dir, worker_count = task
+        if _WORKER_FUNCTION[0] == token:
+            _WORKER_FUNCTION = (None, None)
+        open(os.path.join(payload_dir, "released_{}".format(os.getpid())), "w").close()
+        deadline = time.monotonic() + _RELEASE_TIMEOUT
+        while time.monotonic() < deadline:
+            released = [
+                name for name in os.listdir(payload_dir) if name.startswith("released_")
+            ]
+            if len(released) >= worker_count:
+                return
+            time.sleep(0.001)
+
+
+def _drain(results: Iterator[Any]) -> None:
+    """Exhausts the iterator `results`, discarding results and errors alike."""
+    while True:
         try:
-            import dill
-            import pathos
-        except ImportError:
-            raise ImportError(
-                "scqubits multiprocessing mode set to 'pathos'. Need but cannot find"
-                " 'pathos'/'dill'!"
-            )
-        else:
-            dill.settings["recurse"] = True
-            settings.POOL = pathos.pools.ProcessPool(nodes=num_cpus)
-            return settings.POOL.map
-    if settings.MULTIPROC == "multiprocessing":
-        import multiprocessing
+            next(results)
+        except StopIteration:
+            return
+        except Exception:
+            continue
 
-        settings.POOL = multiprocessing.Pool(processes=num_cpus)
-        return settings.POOL.map
-    else:
-        raise ValueError(
-            "Unknown multiprocessing type: settings.MULTIPROC = {}".format(
-                settings.MULTIPROC
+
+def _parallel_imap(
+    func: Callable, values: List[Any], num_cpus: int, chunksize: int
+) -> Iterator[Any]:
+    backend = settings.MULTIPROC
+    pool = get_pool(num_cpus)
+    token = uuid.uuid4().hex
+    # The serialized function is handed to the workers through a temporary file
+    # rather than as part of each task, so that tasks only carry parameter values.
+    payload_dir = tempfile.mkdtemp(prefix="scqubits_")
+    payload_path = os.path.join(payload_dir, "function.pkl")
+    results: Iterator[List[Any]] = iter(())
+    try:
+        with open(payload_path, "wb") as payload_file:
+            _get_serializer(backend).dump(func, payload_file)
+        tasks = [
+            (
+                token,
+                backend,
+                payload_path,
+                settings.DISPATCH_ENABLED,
+                values[start : start + chunksize],
             )
-        )
+            for start in range(0, len(values), chunksize)
+        ]
+        results = pool.imap(_ChunkEvaluator(), tasks)
+        for chunk_result in results:
+            yield from chunk_result
+    finally:
+        # If the consumer stopped early, outstanding chunks are skipped by the
+        # workers; collecting their (empty) results leaves no tasks behind in the
+        # pool. Release tasks are then processed once no worker needs the payload.
+        open(os.path.join(payload_dir, "cancelled"), "w").close()
+        _drain(results)
+        release_task = (token, payload_dir, num_cpus)
+        list(pool.imap(_WorkerRelease(), [release_task] * num_cpus))
+        shutil.rmtree(payload_dir)
+
+
+def imap_ordered(
+    func: Callable, iterable: Iterable, num_cpus: int, chunksize: int = None
+) -> Iterator[Any]:
+    """
+    Lazily evaluates `func` for all entries of `iterable`, yielding results in input
+    order as soon as they become available. For num_cpus>1, the work is dispatched
+    to the managed worker pool in chunks: `func` (typically a method bound to a
+    qubit or sweep object) is serialized only once, into a temporary file that each
+    worker reads and deserializes once; the tasks sent to the workers only hold the
+    chunks of parameter values. Workers drop their copy of `func` once all results
+    have been retrieved. If the iteration is stopped early (e.g., by closing the
+    iterator), chunks not yet started are skipped.
+
+    Parameters
+    ----------
+    func:
+        function of a single argument
+    iterable:
+        arguments to be passed to `func`
+    num_cpus:
+        number of cores to be used
+    chunksize:
+        number of entries sent to a worker per task (default: `settings.CHUNKSIZE`,
+        or, if that is None, about four chunks per worker)
+
+    Returns
+    -------
+        iterator over the results
+    """
+    if num_cpus == 1:
+        return map(func, iterable)
+    values = list(iterable)
+    chunksize = chunksize or settings.CHUNKSIZE
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(values) / (4 * num_cpus)))
+    return _parallel_imap(func, values, num_cpus, chunksize)
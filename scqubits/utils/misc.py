@@ -151,3 +151,31 @@ def qt_ket_to_ndarray(qobj_ket: qt.Qobj) -> np.ndarray:
     # Qutip's `.eigenstates()` returns an object-valued ndarray, each entry of which
     # is a Qobj ket.
     return np.asarray(qobj_ket.data.todense())
+
+
+def grid_traversal(shape: Tuple[int, ...], snake: bool = True) -> np.ndarray:
+    """
+    Returns the multi-indices of all points of a grid with the given shape, in the
+    order in which they are to be visited. With `snake=True`, each axis reverses
+    direction whenever a slower axis advances (boustrophedon order), so that
+    consecutive points are always nearest neighbours on the grid.
+
+    Parameters
+    ----------
+    shape:
+        number of points along each grid axis
+    snake:
+        if False, the grid is traversed in plain C (row-major) order
+
+    Returns
+    -------
+        integer array of shape (number of grid points, number of axes)
+    """
+    indices = np.indices(shape).reshape(len(shape), -1).T
+    if not snake:
+        return indices
+    traversal = indices.copy()
+    for axis in range(1, len(shape)):
+        reversed_rows = traversal[:, :axis].sum(axis=1) % 2 == 1
+        traversal[reversed_rows, axis] = shape[axis] - 1 - indices[reversed_rows, axis]
+    return traversal
@@ -10,12 +10,17 @@
 ############################################################################
 
 import cmath
+import math
+import warnings
 
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Union
 
 import numpy as np
 import qutip as qt
+import scipy as sp
 
+from scipy import sparse
+from scipy.optimize import linear_sum_assignment
 from scipy.sparse import csc_matrix, dia_matrix
 
 if TYPE_CHECKING:
@@ -23,6 +28,11 @@ if TYPE_CHECKING:
     from scqubits.core.qubit_base import QubitBaseClass
     from scqubits.io_utils.fileio_qutip import QutipEigenstates
 
+# below this dimension, dense diagonalization outperforms shift-invert `eigsh`
+_DENSE_EIGH_MAX_DIM = 400
+# intervals narrower than this fraction of the sweep range are never subdivided
+_REFINE_MIN_SPACING = 1e-9
+
 
 def order_eigensystem(
     evals: np.ndarray, evecs: np.ndarray
@@ -156,20 +166,59 @@ def get_matrixelement_table(
         table of matrix elements
     """
     if isinstance(operator, qt.Qobj):
-        state_list = state_table
+        op_matrix = operator.data
+        states = _states_as_columns(state_table)
     else:
-        state_list = state_table.T
+        op_matrix = operator
+        states = np.asarray(state_table)
+    return states.conj().T @ (op_matrix @ states)
 
-    tablesize = len(state_list)
-    mtable = [
+
+def _states_as_columns(state_list: Union[np.ndarray, List[qt.Qobj]]) -> np.ndarray:
+    """Converts a list of states (Qobj kets or numpy arrays) into an array holding
+    the states as columns."""
+    if isinstance(state_list, np.ndarray) and state_list.dtype != object:
+        return state_list.T
+    return np.column_stack(
         [
-            matrix_element(state_list[n], operator, state_list[m])
-            for m in range(tablesize)
+            state.full()[:, 0] if isinstance(state, qt.Qobj) else np.ravel(state)
+            for state in state_list
         ]
-        for n in range(tablesize)
-    ]
+    )
 
-    return np.asarray(mtable)
+
+def get_matrixelement_table_stack(
+    operator: Union[np.ndarray, csc_matrix, dia_matrix, qt.Qobj],
+    state_tables: np.ndarray,
+) -> np.ndarray:
+    """Calculates tables of matrix elements for a stack of state tables, such as the
+    eigenstates obtained along a parameter sweep.
+
+    Parameters
+    ----------
+    operator:
+        operator with respect to which matrix elements are to be calculated; either a
+        single operator, or a stack of dense operators with shape
+        `(len(state_tables), dim, dim)`
+    state_tables:
+        array of shape `(N, dim, n)`, holding for each of the N entries the states
+        `|v0>, |v1>, ...` in scipy's `eigsh` transposed form
+
+    Returns
+    -------
+        array of shape `(N, n, n)` holding the tables of matrix elements
+    """
+    if isinstance(operator, qt.Qobj):
+        operator = operator.data
+    states = np.asarray(state_tables)
+    if sparse.issparse(operator):
+        stack_count, dim, states_count = states.shape
+        states_flat = states.transpose(1, 0, 2).reshape(dim, -1)
+        op_states = operator @ states_flat
+        op_states = op_states.reshape(dim, stack_count, states_count).transpose(1, 0, 2)
+    else:
+        op_states = np.matmul(operator, states)
+    return np.matmul(states.conj().transpose(0, 2, 1), op_states)
 
 
 def closest_dressed_energy(
@@ -275,6 +324,29 @@ def convert_esys_to_ndarray(esys_qutip: "QutipEigenstates") -> np.ndarray:
     return esys_ndarray
 
 
+def convert_ndarray_to_esys(evecs: np.ndarray, subsystem_dims: List[int]) -> np.ndarray:
+    """Inverse of `convert_esys_to_ndarray`: takes eigenvectors as columns of a
+    numpy array and converts them into an object array of qutip kets with the
+    tensor-product structure given by `subsystem_dims`.
+
+    Parameters
+    ----------
+    evecs:
+        array of eigenvectors; evecs[:, k] is the k-th eigenvector
+    subsystem_dims:
+        dimensions of the subsystems composing the Hilbert space
+
+    Returns
+    -------
+        object array of `qutip.Qobj` kets, as obtained from qutip `.eigenstates()`
+    """
+    ket_dims = [list(subsystem_dims), [1] * len(subsystem_dims)]
+    esys_qutip = np.empty(evecs.shape[1], dtype=object)
+    for index in range(evecs.shape[1]):
+        esys_qutip[index] = qt.Qobj(evecs[:, index : index + 1], dims=ket_dims)
+    return esys_qutip
+
+
 def convert_matrix_to_qobj(
     operator: Union[np.ndarray, csc_matrix, dia_matrix],
     subsystem: Union["QubitBaseClass", "Oscillator"],
@@ -319,6 +391,30 @@ def convert_operator_to_qobj(
     raise TypeError("Unsupported operator type: ", type(operator))
 
 
+def convert_operator_to_csr(
+    operator: Union[np.ndarray, csc_matrix, dia_matrix, qt.Qobj, str],
+    subsystem: Union["QubitBaseClass", "Oscillator"],
+    op_in_eigenbasis: bool,
+    evecs: Optional[np.ndarray],
+) -> sparse.csr_matrix:
+    """Sparse counterpart of `convert_operator_to_qobj`: returns the subsystem
+    operator as a scipy CSR matrix, expressed in the truncated eigenbasis of
+    `subsystem` in the same cases as `convert_operator_to_qobj`."""
+    if isinstance(operator, qt.Qobj):
+        return sparse.csr_matrix(operator.data)
+    if not isinstance(operator, (np.ndarray, csc_matrix, dia_matrix, str)):
+        raise TypeError("Unsupported operator type: ", type(operator))
+
+    dim = subsystem.truncated_dim
+    if op_in_eigenbasis and not isinstance(operator, str):
+        return sparse.csr_matrix(operator)[:dim, :dim]
+    if evecs is None:
+        _, evecs = subsystem.eigensys(evals_count=dim)
+    if isinstance(operator, str):
+        return sparse.csr_matrix(subsystem.matrixelement_table(operator, evecs=evecs))
+    return sparse.csr_matrix(get_matrixelement_table(operator, evecs))
+
+
 def generate_target_states_list(
     sweep: "ParameterSweep", initial_state_labels: Tuple[int, ...]
 ) -> List[Tuple[int, ...]]:
@@ -373,3 +469,577 @@ def recast_esys_mapdata(
     )
     eigenstate_table = [esys_mapdata[index][1] for index in range(paramvals_count)]
     return eigenenergy_table, eigenstate_table
+
+
+def batched_eigh(
+    hamiltonian_stack: np.ndarray, evals_count: int, eigvals_only: bool = False
+) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """Diagonalizes a stack of Hermitian matrices of shape (N, dim, dim) at once,
+    using the batched LAPACK driver behind `numpy.linalg.eigh`.
+
+    Parameters
+    ----------
+    hamiltonian_stack:
+        array of Hermitian matrices, `hamiltonian_stack[n]` being the n-th matrix
+    evals_count:
+        number of lowest eigenvalues/eigenvectors to be kept
+    eigvals_only:
+        if True, only eigenvalues are returned (default value = False)
+
+    Returns
+    -------
+        eigenvalues of shape (N, evals_count) and, unless `eigvals_only` is set,
+        eigenvectors of shape (N, dim, evals_count); evecs[n][:, k] is the k-th
+        eigenvector for the n-th matrix
+    """
+    if eigvals_only:
+        return np.linalg.eigvalsh(hamiltonian_stack)[:, :evals_count]
+    evals, evecs = np.linalg.eigh(hamiltonian_stack)
+    return evals[:, :evals_count], evecs[:, :, :evals_count]
+
+
+def continued_eigsh(
+    matrix: Union[csc_matrix, np.ndarray],
+    evals_count: int,
+    previous_evals: Optional[np.ndarray] = None,
+    previous_evecs: Optional[np.ndarray] = None,
+    return_eigenvectors: bool = True,
+    v0: Optional[np.ndarray] = None,
+    method: str = "eigsh",
+) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """Calculates the lowest eigenvalues (and eigenvectors) of a sparse Hermitian
+    matrix by shift-invert `eigsh`, warm-started from the eigensystem obtained at a
+    neighboring point of a parameter sweep (continuation). The shift is placed just
+    below the previous ground state energy, and the Lanczos start vector is taken
+    from the span of the previous eigenvectors. Without previous data, this reduces
+    to the standard call with `sigma=0`.
+
+    Parameters
+    ----------
+    matrix:
+        sparse Hermitian matrix
+    evals_count:
+        number of desired eigenvalues/eigenvectors
+    previous_evals:
+        eigenvalues at the neighboring parameter point (default value = None)
+    previous_evecs:
+        eigenvectors at the neighboring parameter point, previous_evecs[:, k] being
+        the k-th eigenvector (default value = None)
+    return_eigenvectors:
+        if False, only eigenvalues are returned (default value = True)
+    v0:
+        start vector used in the absence of previous eigenvectors
+        (default value = None)
+    method:
+        'eigsh' (default) or 'lobpcg'; in the latter case, the previous
+        eigenvectors are used as a block of start vectors for LOBPCG, with
+        fallback to shift-invert `eigsh` if LOBPCG does not converge
+
+    Returns
+    -------
+        eigenvalues (unsorted, as returned by the eigensolver) and, if requested,
+        eigenvectors
+    """
+    dim = matrix.shape[0]
+    usable_evecs = (
+        previous_evals is not None
+        and previous_evecs is not None
+        and previous_evecs.shape[0] == dim
+        and previous_evecs.shape[1] == evals_count
+    )
+    if method == "lobpcg" and usable_evecs:
+        # Jacobi preconditioner, shifted below the previous ground state energy
+        diag_shifted = matrix.diagonal().real - np.min(previous_evals) + 1.0
+        preconditioner = sparse.diags(
+            1.0 / np.where(diag_shifted > 1.0, diag_shifted, 1.0)
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            evals, evecs = sparse.linalg.lobpcg(
+                matrix,
+                previous_evecs,
+                M=preconditioner,
+                largest=False,
+                tol=1e-8,
+                maxiter=100,
+            )
+        residuals = np.linalg.norm(matrix @ evecs - evecs * evals, axis=0)
+        if np.all(residuals < 1e-6 * max(1.0, np.max(np.abs(evals)))):
+            return (evals, evecs) if return_eigenvectors else evals
+
+    sigma = 0.0
+    if previous_evals is not None and len(previous_evals) == evals_count:
+        previous_evals = np.sort(previous_evals)
+        spread = previous_evals[-1] - previous_evals[0]
+        sigma = previous_evals[0] - 0.1 * (spread if spread > 0.0 else 1.0)
+    if usable_evecs:
+        v0 = np.sum(previous_evecs, axis=1)
+    return sparse.linalg.eigsh(
+        matrix,
+        k=evals_count,
+        sigma=sigma,
+        which="LM",
+        v0=v0,
+        return_eigenvectors=return_eigenvectors,
+    )
+
+
+def lowest_eigsh(
+    matrix: Union[sparse.spmatrix, sparse.linalg.LinearOperator],
+    evals_count: int,
+    eigvals_only: bool = False,
+) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """Calculates the lowest eigenvalues (and eigenvectors) of a sparse Hermitian
+    matrix, sorted in ascending order. If only a small part of the spectrum is
+    requested, shift-invert `eigsh` is used with the shift placed just below the
+    Gershgorin lower bound of the spectrum, so that the eigenvalues closest to the
+    shift are the lowest ones. Otherwise, the matrix is diagonalized densely.
+    Matrix-free operators are handled by `eigsh` in regular mode.
+
+    Parameters
+    ----------
+    matrix:
+        sparse Hermitian matrix or Hermitian `LinearOperator`
+    evals_count:
+        number of desired eigenvalues/eigenvectors
+    eigvals_only:
+        if True, only eigenvalues are returned (default value = False)
+
+    Returns
+    -------
+        eigenvalues and, unless `eigvals_only` is set, eigenvectors;
+        evecs[:, k] is the k-th eigenvector
+    """
+    dim = matrix.shape[0]
+    if not sparse.issparse(matrix):
+        # matrix-free operator: no factorization available for shift-invert
+        result = sparse.linalg.eigsh(
+            matrix, k=evals_count, which="SA", return_eigenvectors=not eigvals_only
+        )
+    elif dim <= _DENSE_EIGH_MAX_DIM or evals_count >= dim // 2:
+        return sp.linalg.eigh(
+            matrix.toarray(),
+            eigvals_only=eigvals_only,
+            eigvals=(0, evals_count - 1),
+        )
+    else:
+        matrix = sparse.csr_matrix(matrix)
+        diagonal = matrix.diagonal().real
+        offdiag_rowsums = np.asarray(abs(matrix).sum(axis=1)).ravel() - np.abs(diagonal)
+        lower_bound = np.min(diagonal - offdiag_rowsums)
+        sigma = lower_bound - 1e-3 * max(1.0, abs(lower_bound))
+        result = sparse.linalg.eigsh(
+            matrix,
+            k=evals_count,
+            sigma=sigma,
+            which="LM",
+            return_eigenvectors=not eigvals_only,
+        )
+    if eigvals_only:
+        return np.sort(result)
+    evals, evecs = result
+    order_eigensystem(evals, evecs)
+    return evals, evecs
+
+
+def refinement_errors(param_vals: np.ndarray, energy_table: np.ndarray) -> np.ndarray:
+    """Estimates, for each interval between neighboring parameter values, the error
+    of linearly interpolating the energies across it. The estimate combines the
+    local curvature of each level (from divided differences) with a check for
+    unresolved level-gap minima: if the gap between adjacent levels is smallest at
+    a grid point, the avoided crossing is only resolved once the gap changes by
+    little across the neighboring intervals.
+
+    Parameters
+    ----------
+    param_vals:
+        sorted parameter values, of length N
+    energy_table:
+        energies of shape (N, evals_count), sorted along the second axis
+
+    Returns
+    -------
+        error estimates of shape (N-1,)
+    """
+    widths = np.diff(param_vals)
+    if len(param_vals) < 3:
+        return np.full_like(widths, np.inf, dtype=np.float_)
+    slopes = np.diff(energy_table, axis=0) / widths[:, np.newaxis]
+    curvatures = np.max(
+        np.abs(2.0 * np.diff(slopes, axis=0) / (widths[:-1] + widths[1:])[:, None]),
+        axis=1,
+    )
+    # curvature at the two end points of each interval; linear interpolation error
+    # is bounded by max|E''| h^2 / 8
+    interval_curvatures = np.maximum(
+        np.concatenate(([curvatures[0]], curvatures)),
+        np.concatenate((curvatures, [curvatures[-1]])),
+    )
+    errors = interval_curvatures * widths ** 2 / 8.0
+
+    gaps = np.diff(energy_table, axis=1)
+    if gaps.shape[1] > 0:
+        is_minimum = (gaps[1:-1] < gaps[:-2]) & (gaps[1:-1] < gaps[2:])
+        rise = np.where(
+            is_minimum,
+            np.maximum(gaps[:-2] - gaps[1:-1], gaps[2:] - gaps[1:-1]),
+            0.0,
+        ).max(axis=1)
+        errors[:-1] = np.maximum(errors[:-1], rise)
+        errors[1:] = np.maximum(errors[1:], rise)
+    return errors
+
+
+def refine_sweep(
+    compute_points: Callable[[np.ndarray], List[Any]],
+    get_energies: Callable[[Any], np.ndarray],
+    param_vals: np.ndarray,
+    tol: float,
+    max_points: Optional[int] = None,
+) -> Tuple[np.ndarray, List[Any]]:
+    """Adaptively refines a parameter sweep. Starting from the (coarse) grid
+    `param_vals`, interval midpoints are inserted wherever the error estimate of
+    `refinement_errors` exceeds `tol`, largest errors first, until all intervals
+    are resolved or the point budget is used up.
+
+    Parameters
+    ----------
+    compute_points:
+        computes the results for an array of parameter values, returning a list with
+        one entry per value
+    get_energies:
+        extracts the sorted energies from a single result entry
+    param_vals:
+        initial parameter values
+    tol:
+        tolerance for the estimated interpolation error of the energies
+    max_points:
+        maximum total number of parameter values
+        (default value: ten times the initial number of values)
+
+    Returns
+    -------
+        sorted refined parameter values, and the corresponding results
+    """
+    param_vals = np.sort(np.asarray(param_vals, dtype=np.float_))
+    if max_points is None:
+        max_points = 10 * len(param_vals)
+    results = compute_points(param_vals)
+    min_spacing = _REFINE_MIN_SPACING * (param_vals[-1] - param_vals[0])
+    while len(param_vals) < max_points:
+        energy_table = np.asarray([get_energies(result) for result in results])
+        errors = refinement_errors(param_vals, energy_table)
+        errors[np.diff(param_vals) <= min_spacing] = 0.0
+        flagged = np.flatnonzero(errors > tol)
+        if len(flagged) == 0:
+            break
+        flagged = flagged[np.argsort(errors[flagged])[::-1]]
+        flagged = np.sort(flagged[: max_points - len(param_vals)])
+        new_vals = 0.5 * (param_vals[flagged] + param_vals[flagged + 1])
+        new_results = compute_points(new_vals)
+
+        param_vals = np.insert(param_vals, flagged + 1, new_vals)
+        for offset, (interval, result) in enumerate(zip(flagged, new_results)):
+            results.insert(interval + 1 + offset, result)
+    return param_vals, results
+
+
+def _eigenstate_stack(
+    state_table: Union[np.ndarray, List[np.ndarray], List["QutipEigenstates"]]
+) -> np.ndarray:
+    """Returns the eigenstates along a sweep as an array of shape (N, dim, n), with
+    `[k][:, j]` being the j-th eigenstate at the k-th parameter value."""
+    if isinstance(state_table, np.ndarray) and state_table.dtype != object:
+        return state_table
+    return np.asarray(
+        [
+            convert_esys_to_ndarray(evecs).T
+            if isinstance(evecs[0], qt.Qobj)
+            else np.asarray(evecs)
+            for evecs in state_table
+        ]
+    )
+
+
+def level_matches(previous_states: np.ndarray, state_stack: np.ndarray) -> np.ndarray:
+    """For consecutive points of a sweep, identifies the eigenstates that continue
+    each other adiabatically by maximal overlap. The overlaps of all steps are
+    obtained from a single stacked matrix product; where the largest overlaps do not
+    determine a one-to-one assignment, `linear_sum_assignment` is used.
+
+    Parameters
+    ----------
+    previous_states:
+        eigenstates of shape (dim, n) at the point preceding `state_stack`
+    state_stack:
+        eigenstates of shape (N, dim, n)
+
+    Returns
+    -------
+        array of shape (N, n); entry [k, j] is the index of the eigenstate at point k
+        that continues eigenstate j of point k-1
+    """
+    preceding_stack = np.concatenate(
+        (previous_states[np.newaxis], state_stack[:-1]), axis=0
+    )
+    overlaps = np.abs(np.matmul(preceding_stack.conj().transpose(0, 2, 1), state_stack))
+    matches = np.argmax(overlaps, axis=2)
+    states_count = matches.shape[1]
+    ambiguous = np.any(np.sort(matches, axis=1) != np.arange(states_count), axis=1)
+    for step in np.flatnonzero(ambiguous):
+        _, matches[step] = linear_sum_assignment(overlaps[step] ** 2, maximize=True)
+    return matches
+
+
+class LevelTracker:
+    """Follows energy levels through a parameter sweep by eigenvector overlaps
+    between consecutive parameter values, rather than by energy ordering, so that
+    levels keep their identity through true crossings. Sweep data may be passed in
+    consecutive chunks as they become available.
+
+    Levels are labeled by their energy ordering at the first parameter value. Note
+    that levels can only be followed reliably if no level enters or leaves the
+    window of computed eigenstates.
+    """
+
+    def __init__(self) -> None:
+        self._last_states: Optional[np.ndarray] = None
+        self._last_permutation: Optional[np.ndarray] = None
+
+    def update(
+        self,
+        state_table: Union[np.ndarray, List[np.ndarray], List["QutipEigenstates"]],
+    ) -> np.ndarray:
+        """Processes the eigenstates of the next chunk of parameter values.
+
+        Parameters
+        ----------
+        state_table:
+            eigenstates for each parameter value of the chunk, as array of shape
+            (N, dim, n) or list of eigenstate arrays or qutip eigenstates
+
+        Returns
+        -------
+            permutation table of shape (N, n); entry [k, j] is the index, in energy
+            ordering, of tracked level j at the k-th parameter value of the chunk
+        """
+        state_stack = _eigenstate_stack(state_table)
+        if self._last_states is None:
+            self._last_states = state_stack[0]
+            self._last_permutation = np.arange(state_stack.shape[2])
+        matches = level_matches(self._last_states, state_stack)
+        permutation = np.empty_like(matches)
+        current_permutation = self._last_permutation
+        for index, step_matches in enumerate(matches):
+            current_permutation = step_matches[current_permutation]
+            permutation[index] = current_permutation
+        self._last_states = state_stack[-1]
+        self._last_permutation = current_permutation
+        return permutation
+
+
+def apply_level_permutation(
+    permutation: np.ndarray,
+    energy_table: np.ndarray,
+    state_table: Union[
+        np.ndarray, List[np.ndarray], List["QutipEigenstates"], None
+    ] = None,
+    matrixelem_table: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, Union[np.ndarray, List[np.ndarray], None], Optional[np.ndarray]]:
+    """Reorders sweep data from energy ordering into the ordering of tracked levels,
+    as given by a permutation table from `LevelTracker` or `track_levels`.
+
+    Returns
+    -------
+        energy table, state table (None if not provided) and matrix element table
+        (None if not provided), each reordered
+    """
+    energy_table = np.take_along_axis(np.asarray(energy_table), permutation, axis=1)
+    if isinstance(state_table, np.ndarray) and state_table.dtype != object:
+        state_table = np.take_along_axis(
+            state_table, permutation[:, np.newaxis, :], axis=2
+        )
+    elif state_table is not None:
+        state_table = [
+            evecs[index_perm]
+            if isinstance(evecs[0], qt.Qobj)
+            else np.asarray(evecs)[:, index_perm]
+            for evecs, index_perm in zip(state_table, permutation)
+        ]
+    if matrixelem_table is not None:
+        matrixelem_table = np.asarray(
+            [
+                table[np.ix_(index_perm, index_perm)]
+                for table, index_perm in zip(matrixelem_table, permutation)
+            ]
+        )
+    return energy_table, state_table, matrixelem_table
+
+
+def track_levels(
+    state_table: Union[np.ndarray, List[np.ndarray], List["QutipEigenstates"]]
+) -> np.ndarray:
+    """Returns the permutation table that follows energy levels across an entire
+    sweep by eigenvector overlaps, see `LevelTracker`.
+
+    Parameters
+    ----------
+    state_table:
+        eigenstates for each parameter value of the sweep
+
+    Returns
+    -------
+        permutation table of shape (N, n); entry [k, j] is the index, in energy
+        ordering, of tracked level j at the k-th parameter value
+    """
+    return LevelTracker().update(state_table)
+
+
+def _hermite_coefficients(
+    widths: np.ndarray, anchor_derivatives: List[np.ndarray]
+) -> np.ndarray:
+    """Returns the coefficients a_j of the Hermite polynomials
+    :math:`\\sum_j a_j t^j` (with t in [0, 1]) matching values and derivatives at
+    both ends of each interval, of shape (intervals, order+1, n)."""
+    energies, slopes = anchor_derivatives[:2]
+    y0, y1 = energies[:-1], energies[1:]
+    d0 = slopes[:-1] * widths[:, np.newaxis]
+    d1 = slopes[1:] * widths[:, np.newaxis]
+    if len(anchor_derivatives) == 2:
+        return np.stack(
+            (y0, d0, 3.0 * (y1 - y0) - 2.0 * d0 - d1, 2.0 * (y0 - y1) + d0 + d1),
+            axis=1,
+        )
+    curvatures = anchor_derivatives[2]
+    s0 = curvatures[:-1] * widths[:, np.newaxis] ** 2
+    s1 = curvatures[1:] * widths[:, np.newaxis] ** 2
+    return np.stack(
+        (
+            y0,
+            d0,
+            0.5 * s0,
+            10.0 * (y1 - y0) - 6.0 * d0 - 4.0 * d1 - 0.5 * (3.0 * s0 - s1),
+            -15.0 * (y1 - y0) + 8.0 * d0 + 7.0 * d1 + 0.5 * (3.0 * s0 - 2.0 * s1),
+            6.0 * (y1 - y0) - 3.0 * (d0 + d1) - 0.5 * (s0 - s1),
+        ),
+        axis=1,
+    )
+
+
+def hermite_interpolation(
+    anchor_vals: np.ndarray,
+    anchor_derivatives: List[np.ndarray],
+    param_vals: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Interpolates energies between anchor points at which the energies and their
+    first (and possibly second) derivatives are known, by cubic (quintic) Hermite
+    polynomials. The interpolation error is estimated from the standard remainder
+    term, with the next-higher derivative approximated by differencing the
+    leading polynomial coefficients of neighboring intervals.
+
+    Parameters
+    ----------
+    anchor_vals:
+        sorted parameter values of the anchor points, of length A
+    anchor_derivatives:
+        [energies, first derivatives] or [energies, first derivatives, second
+        derivatives], each of shape (A, n)
+    param_vals:
+        sorted parameter values within the anchor range for which energies are to be
+        interpolated
+
+    Returns
+    -------
+        interpolated energies of shape (len(param_vals), n); error estimates for each
+        entry of `param_vals`; estimated maximum errors for each anchor interval
+    """
+    widths = np.diff(anchor_vals)
+    coefficients = _hermite_coefficients(widths, anchor_derivatives)
+    degree = coefficients.shape[1] - 1
+    smoothness = (degree + 1) // 2
+
+    # leading derivative of each polynomial, and its rate of change between the
+    # centers of neighboring intervals
+    leading_derivatives = (
+        math.factorial(degree) * coefficients[:, -1] / widths[:, np.newaxis] ** degree
+    )
+    if len(widths) > 1:
+        centers = 0.5 * (anchor_vals[:-1] + anchor_vals[1:])
+        changes = np.abs(
+            np.diff(leading_derivatives, axis=0) / np.diff(centers)[:, np.newaxis]
+        ).max(axis=1)
+        next_derivatives = np.maximum(
+            np.concatenate((changes[:1], changes)),
+            np.concatenate((changes, changes[-1:])),
+        )
+    else:
+        next_derivatives = np.full_like(widths, np.inf)
+    remainders = next_derivatives / math.factorial(degree + 1) * widths ** (degree + 1)
+    interval_errors = remainders / 4.0 ** smoothness
+
+    intervals = np.clip(
+        np.searchsorted(anchor_vals, param_vals, side="right") - 1, 0, len(widths) - 1
+    )
+    t = ((param_vals - anchor_vals[intervals]) / widths[intervals])[:, np.newaxis]
+    point_coefficients = coefficients[intervals]
+    energies = point_coefficients[:, -1]
+    for power in range(degree - 1, -1, -1):
+        energies = energies * t + point_coefficients[:, power]
+    errors = remainders[intervals] * (t[:, 0] * (1.0 - t[:, 0])) ** smoothness
+    return energies, errors, interval_errors
+
+
+def energy_curvatures(
+    evals: np.ndarray,
+    evecs: np.ndarray,
+    first_derivative: Union[np.ndarray, sparse.spmatrix],
+    second_derivative: Union[np.ndarray, sparse.spmatrix],
+    hamiltonian: Union[np.ndarray, sparse.spmatrix, None] = None,
+) -> np.ndarray:
+    """Returns the second derivatives of the eigenvalues with respect to a
+    parameter p, from second-order perturbation theory:
+    :math:`E_k'' = \\langle k|H''|k\\rangle
+    + 2\\sum_{m\\neq k} |\\langle m|H'|k\\rangle|^2/(E_k-E_m)`.
+
+    Parameters
+    ----------
+    evals:
+        eigenvalues
+    evecs:
+        eigenvectors; evecs[:, k] is the k-th eigenvector
+    first_derivative:
+        derivative dH/dp of the Hamiltonian
+    second_derivative:
+        second derivative d^2H/dp^2 of the Hamiltonian
+    hamiltonian:
+        if the eigensystem is incomplete, the Hamiltonian itself; the contribution of
+        the missing eigenstates to the sum is then obtained by solving the
+        Sternheimer equation with MINRES (default value = None, complete
+        eigensystem)
+
+    Returns
+    -------
+        second derivatives of the eigenvalues
+    """
+    dh_evecs = first_derivative @ evecs
+    dh_matrix = evecs.conj().T @ dh_evecs
+    energy_differences = evals[:, np.newaxis] - evals[np.newaxis, :]
+    np.fill_diagonal(energy_differences, np.inf)
+    curvatures = np.real(np.sum(evecs.conj() * (second_derivative @ evecs), axis=0))
+    curvatures += 2.0 * np.sum(np.abs(dh_matrix) ** 2 / energy_differences, axis=1)
+    if hamiltonian is None:
+        return curvatures
+
+    # remaining states: solve (E_k - H) x = Q H'|k>, Q projecting out the known
+    # eigenstates; the contribution is <k|H'|x>
+    remainders = dh_evecs - evecs @ dh_matrix
+    for index, energy in enumerate(evals):
+        shifted_hamiltonian = hamiltonian - energy * sparse.identity(
+            hamiltonian.shape[0], format="csc"
+        )
+        solution, _ = sparse.linalg.minres(
+            shifted_hamiltonian, -remainders[:, index], tol=1e-12
+        )
+        solution -= evecs @ (evecs.conj().T @ solution)
+        curvatures[index] += 2.0 * np.real(np.vdot(remainders[:, index], solution))
+    return curvatures